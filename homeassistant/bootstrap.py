@@ -437,6 +437,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_template_bytecode(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -804,6 +805,73 @@ async def async_setup_multi_components(
             )
 
 
+async def _async_prefetch_imports(
+    hass: core.HomeAssistant, integrations: list[loader.Integration]
+) -> None:
+    """Import integrations ahead of their setup.
+
+    The integrations are imported one at a time so the import executor
+    is never filled with prefetches, which would delay the imports of
+    the integrations that are being set up. Integrations with
+    requirements that are not known to be installed yet are skipped
+    since they can only be imported once the requirements are processed.
+    """
+    for integration in integrations:
+        if (
+            integration.domain in hass.config.components
+            or integration.pkg_path in sys.modules
+            or not requirements.async_requirements_installed(
+                hass, integration.requirements
+            )
+        ):
+            continue
+        try:
+            await integration.async_get_component()
+        except Exception:  # noqa: BLE001
+            # The error is reported when the integration is set up
+            _LOGGER.debug("Failed to prefetch %s", integration.domain, exc_info=True)
+
+
+def _startup_critical_path(
+    integration_cache: dict[str, loader.Integration], setup_time: dict[str, float]
+) -> list[tuple[str, float]]:
+    """Return the chain of dependencies that took the longest to set up.
+
+    An integration can only finish its setup after its dependencies and
+    the after dependencies that were set up finished, so the chain with
+    the longest total setup time bounds how fast startup can be.
+    """
+    finish: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+
+    def _finish(domain: str, visiting: set[str]) -> float:
+        if domain in finish:
+            return finish[domain]
+        visiting.add(domain)
+        latest_dep: str | None = None
+        latest_dep_finish = 0.0
+        if (integration := integration_cache.get(domain)) is not None:
+            for dep in chain(integration.dependencies, integration.after_dependencies):
+                if dep not in setup_time or dep in visiting:
+                    continue
+                if (dep_finish := _finish(dep, visiting)) > latest_dep_finish:
+                    latest_dep, latest_dep_finish = dep, dep_finish
+        visiting.discard(domain)
+        previous[domain] = latest_dep
+        finish[domain] = latest_dep_finish + setup_time[domain]
+        return finish[domain]
+
+    if not setup_time:
+        return []
+    domain: str | None = max(setup_time, key=lambda domain: _finish(domain, set()))
+    path: list[tuple[str, float]] = []
+    while domain is not None:
+        path.append((domain, setup_time[domain]))
+        domain = previous[domain]
+    path.reverse()
+    return path
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -1011,6 +1079,28 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - stage_1_domains
 
+    # Import the integrations of the stages while the stages before them
+    # are set up, base platforms and integrations with few dependencies first
+    hass.async_create_background_task(
+        _async_prefetch_imports(
+            hass,
+            [
+                integration_cache[domain]
+                for stage_domains in (stage_1_domains, stage_2_domains)
+                for domain in sorted(
+                    stage_domains & integration_cache.keys(),
+                    key=lambda domain: (
+                        not SETUP_ORDER_SORT_KEY(domain),
+                        len(integration_cache[domain].dependencies),
+                    ),
+                )
+            ],
+        ),
+        "prefetch integration imports",
+        # Let the first stage queue its imports before the prefetch does
+        eager_start=False,
+    )
+
     for name, domain_group in pre_stage_domains:
         if domain_group:
             stage_2_domains -= domain_group
@@ -1071,8 +1161,17 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    setup_time = async_get_setup_timings(hass)
+    if critical_path := _startup_critical_path(integration_cache, setup_time):
+        _LOGGER.info(
+            "Startup critical path (%.2fs): %s",
+            sum(duration for _, duration in critical_path),
+            " -> ".join(
+                f"{domain} ({duration:.2f}s)" for domain, duration in critical_path
+            ),
+        )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
-        setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
@@ -27,6 +27,7 @@ from homeassistant.helpers import (
     instance_id,
     integration_platform,
     issue_registry as ir,
+    storage,
 )
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
@@ -368,6 +369,8 @@ class BackupManager:
 
     async def async_pre_backup_actions(self) -> None:
         """Perform pre backup actions."""
+        # Older versions restoring the backup only read the storage files
+        await storage.async_write_journal_snapshots(self.hass)
         pre_backup_results = await asyncio.gather(
             *(
                 platform.async_pre_backup(self.hass)
@@ -332,13 +332,8 @@ class SensorFilter(SensorEntity):
                     history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await get_instance(self.hass).async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                filter_history = await history.async_state_changes_during_period(
+                    self.hass, start, entity_id=self._entity
                 )
                 if self._entity in filter_history:
                     history_list.extend(
@@ -21,7 +21,7 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import DOMAIN
+from .const import DOMAIN, MIN_MAX_POINTS
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 CONF_ORDER = "use_include_order"
@@ -105,6 +105,14 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
         no_attributes = "no_attributes" in request.query
+        max_points: int | None = None
+        if max_points_str := query.get("max_points"):
+            try:
+                max_points = int(max_points_str)
+            except ValueError:
+                max_points = 0
+            if max_points < MIN_MAX_POINTS:
+                return self.json_message("Invalid max_points", HTTPStatus.BAD_REQUEST)
 
         if (
             # has_states_before will return True if there are states older than
@@ -119,6 +127,22 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        if max_points:
+            return cast(
+                web.Response,
+                await get_instance(hass).async_add_executor_job(
+                    self._downsampled_states_json,
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    max_points,
+                    include_start_time_state,
+                    significant_changes_only,
+                    no_attributes,
+                ),
+            )
+
         return cast(
             web.Response,
             await get_instance(hass).async_add_executor_job(
@@ -163,3 +187,32 @@ class HistoryPeriodView(HomeAssistantView):
                     ).values()
                 )
             )
+
+    def _downsampled_states_json(
+        self,
+        hass: HomeAssistant,
+        start_time: dt,
+        end_time: dt,
+        entity_ids: list[str],
+        max_points: int,
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        no_attributes: bool,
+    ) -> web.Response:
+        """Fetch downsampled states from the database as json."""
+        with session_scope(hass=hass, read_only=True) as session:
+            return self.json(
+                list(
+                    history.get_downsampled_states_with_session(
+                        hass,
+                        session,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        max_points,
+                        include_start_time_state,
+                        significant_changes_only,
+                        no_attributes,
+                    ).values()
+                )
+            )
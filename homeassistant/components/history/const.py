@@ -5,3 +5,7 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Downsampling keeps the first, min, max and last state of each time
+# bucket, so max_points must allow at least one bucket
+MIN_MAX_POINTS = 4
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -35,10 +36,10 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, run_callback_threadsafe
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES, MIN_MAX_POINTS
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -93,6 +94,77 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    max_points: int,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> bytes:
+    """Fetch downsampled history and convert it to json in the executor."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return json_bytes(
+            messages.result_message(
+                msg_id,
+                history.get_downsampled_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    max_points,
+                    include_start_time_state,
+                    significant_changes_only,
+                    no_attributes,
+                    True,
+                ),
+            )
+        )
+
+
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Stream history significant_states to the client from the executor.
+
+    Each chunk is sent as soon as it has been read from the database
+    so the client can render the first entities before the query
+    has finished. The next chunk is only read once the event loop
+    has sent the previous one, so a large query can not flood it.
+    """
+    for chunk in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ):
+        if msg_id not in connection.subscriptions:
+            # The client unsubscribed while we were streaming
+            return
+        run_callback_threadsafe(
+            hass.loop,
+            connection.send_message,
+            json_bytes(messages.event_message(msg_id, chunk)),
+        ).result()
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +175,11 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        # Downsampled history is returned as one result
+        vol.Exclusive("stream", "output"): bool,
+        vol.Exclusive("max_points", "output"): vol.All(
+            int, vol.Range(min=MIN_MAX_POINTS)
+        ),
     }
 )
 @websocket_api.async_response
@@ -157,9 +234,70 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    instance = get_instance(hass)
+
+    if max_points := msg.get("max_points"):
+        connection.send_message(
+            await instance.async_add_executor_job(
+                _ws_get_downsampled_states,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                max_points,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        )
+        return
+
+    if msg.get("stream") and instance.states_meta_manager.active:
+        msg_id: int = msg["id"]
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        try:
+            await instance.async_add_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        except Exception:
+            _LOGGER.exception("Error streaming history")
+            if msg_id in connection.subscriptions:
+                connection.send_message(
+                    json_bytes(
+                        messages.event_message(
+                            msg_id,
+                            {
+                                "error": {
+                                    "code": websocket_api.ERR_UNKNOWN_ERROR,
+                                    "message": "Error streaming history",
+                                }
+                            },
+                        )
+                    )
+                )
+        else:
+            if msg_id in connection.subscriptions:
+                connection.send_message(
+                    json_bytes(messages.event_message(msg_id, {"done": True}))
+                )
+        finally:
+            connection.subscriptions.pop(msg_id, None)
+        return
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await instance.async_add_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
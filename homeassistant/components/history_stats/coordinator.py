@@ -73,6 +73,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         if self._track_events_listener:
             self._track_events_listener()
             self._track_events_listener = None
+            self._history_stats.async_set_tracking_events(False)
         if self._at_start_listener:
             self._at_start_listener()
             self._at_start_listener = None
@@ -91,6 +92,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         self._track_events_listener = async_track_state_change_event(
             self.hass, [self._history_stats.entity_id], self._async_update_from_event
         )
+        self._history_stats.async_set_tracking_events(True)
 
     async def _async_update_from_event(
         self, event: Event[EventStateChangedData]
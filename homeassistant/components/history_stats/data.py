@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
 import datetime
 import logging
 import math
 
-from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.components.recorder import history
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
 
@@ -55,15 +56,35 @@ class HistoryStats:
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
         self._history_current_period: list[HistoryState] = []
         self._previous_run_before_start = False
+        # Whether state changes are passed to async_update as they happen
+        self._tracking_events = False
+        # Whether the history holds every state change until now
+        self._history_is_live = False
+        # Counts the state changes passed to async_update
+        self._events_generation = 0
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
         self._end = end
 
+    @callback
+    def async_set_tracking_events(self, tracking_events: bool) -> None:
+        """Set if state changes of the entity are passed to async_update.
+
+        State changes may have been missed while they were not, so the
+        history has to be loaded from the database when the period moves.
+        """
+        self._tracking_events = tracking_events
+        self._history_is_live = False
+
     async def async_update(
         self, event: Event[EventStateChangedData] | None
     ) -> HistoryStatsState:
         """Update the stats at a given time."""
+        if event:
+            self._events_generation += 1
+        # Whether no state change was passed while loading the history
+        history_complete = True
         # Get previous values of start and end
         previous_period_start, previous_period_end = self._period
         # Parse templates
@@ -88,6 +109,7 @@ class HistoryStats:
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
             self._history_current_period = []
+            self._history_is_live = False
             self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
@@ -124,11 +146,35 @@ class HistoryStats:
             if not new_data and current_period_end_timestamp < now_timestamp:
                 # If period has not changed and current time after the period end...
                 # Don't compute anything as the value cannot have changed
+                self._history_is_live = False
                 return self._state
+        elif (
+            self._history_is_live
+            and not self._previous_run_before_start
+            and current_period_start_timestamp >= previous_period_start_timestamp
+        ):
+            # The period moved forward and the history holds every state
+            # change since the previous start, so it only has to be trimmed
+            self._async_trim_history(
+                current_period_start_timestamp, current_period_end_timestamp
+            )
+            if event and (new_state := event.data["new_state"]) is not None:
+                if (
+                    current_period_start_timestamp
+                    <= floored_timestamp(new_state.last_changed)
+                    <= current_period_end_timestamp
+                ):
+                    self._history_current_period.append(
+                        HistoryState(new_state.state, new_state.last_changed_timestamp)
+                    )
         else:
+            events_generation = self._events_generation
             await self._async_history_from_db(
                 current_period_start_timestamp, current_period_end_timestamp
             )
+            # The history replaced the state changes passed meanwhile,
+            # which the database may not have had yet
+            history_complete = events_generation == self._events_generation
             if event and (new_state := event.data["new_state"]) is not None:
                 if (
                     current_period_start_timestamp
@@ -141,6 +187,11 @@ class HistoryStats:
 
             self._previous_run_before_start = False
 
+        self._history_is_live = (
+            self._tracking_events
+            and history_complete
+            and current_period_end_timestamp >= now_timestamp
+        )
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
             now_timestamp,
             current_period_start_timestamp,
@@ -155,31 +206,45 @@ class HistoryStats:
         current_period_end_timestamp: float,
     ) -> None:
         """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
+        states = await history.async_state_changes_during_period(
+            self.hass,
+            dt_util.utc_from_timestamp(current_period_start_timestamp),
+            dt_util.utc_from_timestamp(current_period_end_timestamp),
+            self.entity_id,
+            include_start_time_state=True,
+            no_attributes=True,
         )
         self._history_current_period = [
             HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
+            for state in states.get(self.entity_id, [])
         ]
 
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
+    def _async_trim_history(
+        self, current_period_start_timestamp: float, current_period_end_timestamp: float
+    ) -> None:
+        """Drop the history outside of the current period.
+
+        The last state change before the start is kept as the state at the
+        start of the period.
+        """
+        history_current_period = self._history_current_period
+        first = max(
+            bisect.bisect_right(
+                history_current_period,
+                current_period_start_timestamp,
+                key=lambda history_state: history_state.last_changed,
+            )
+            - 1,
+            0,
+        )
+        last = bisect.bisect_left(
+            history_current_period,
+            current_period_end_timestamp + 1,
+            lo=first,
+            key=lambda history_state: history_state.last_changed,
+        )
+        if first or last < len(history_current_period):
+            self._history_current_period = history_current_period[first:last]
 
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
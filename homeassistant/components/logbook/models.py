@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast
 
 from propcache import cached_property
@@ -17,7 +18,7 @@ from homeassistant.components.recorder.models import (
     uuid_hex_to_bytes_or_none,
 )
 from homeassistant.const import ATTR_ICON, EVENT_STATE_CHANGED
-from homeassistant.core import Context, Event, State, callback
+from homeassistant.core import CALLBACK_TYPE, Context, Event, State, callback
 from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
@@ -33,6 +34,9 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    live_stream_index: LiveStreamIndex = field(
+        default_factory=lambda: LiveStreamIndex(LIVE_STREAM_INDEX_SIZE)
+    )
 
 
 class LazyEventPartialState:
@@ -96,6 +100,10 @@ class LazyEventPartialState:
         return bytes_to_ulid_or_none(self.row[CONTEXT_PARENT_ID_BIN_POS])
 
 
+# How many recent events the live streams share rows and entries for
+LIVE_STREAM_INDEX_SIZE: Final = 2048
+
+
 # Row order must match the query order in queries/common.py
 # ---------------------------------------------------------
 ROW_ID_POS: Final = 0
@@ -177,3 +185,71 @@ def async_event_to_row(event: Event) -> EventAsRow:
         data=event.data,
         context=context,
     )
+
+
+class LiveStreamIndex:
+    """Index the rows and entries of recent events for the live streams.
+
+    Live streams subscribed to overlapping entities and devices receive the
+    same events, and the event that started a context is converted to a row
+    again for every row it caused. Once a stream is live, the row and the
+    humanified entry of an event only depend on the event, so they are made
+    once and kept for the most recent events while there are live streams.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Init the index."""
+        self._size = size
+        self._streams = 0
+        self._events: deque[Event] = deque()
+        self._rows: dict[Event, EventAsRow] = {}
+        self._entries: dict[tuple[bool, bool], dict[Event, dict[str, Any] | None]] = {}
+
+    @callback
+    def async_add_stream(self) -> CALLBACK_TYPE:
+        """Add a live stream and return a callback to remove it.
+
+        The index is cleared when the last live stream is removed.
+        """
+        self._streams += 1
+
+        @callback
+        def _async_remove_stream() -> None:
+            self._streams -= 1
+            if not self._streams:
+                self._events.clear()
+                self._rows.clear()
+                self._entries.clear()
+
+        return _async_remove_stream
+
+    def __len__(self) -> int:
+        """Return the number of indexed events."""
+        return len(self._events)
+
+    @callback
+    def async_get_row(self, event: Event) -> EventAsRow:
+        """Get the row of an event and index the event."""
+        if (row := self._rows.get(event)) is not None:
+            return row
+        row = self._rows[event] = async_event_to_row(event)
+        self._events.append(event)
+        if len(self._events) > self._size:
+            oldest = self._events.popleft()
+            del self._rows[oldest]
+            for entries in self._entries.values():
+                entries.pop(oldest, None)
+        return row
+
+    @callback
+    def async_get_entries(
+        self, include_entity_name: bool, timestamp: bool
+    ) -> dict[Event, dict[str, Any] | None]:
+        """Get the entries of indexed events humanified with the given options.
+
+        An event maps to None when it does not produce an entry.
+        """
+        key = (include_entity_name, timestamp)
+        if (entries := self._entries.get(key)) is None:
+            entries = self._entries[key] = {}
+        return entries
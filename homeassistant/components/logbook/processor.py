@@ -34,7 +34,7 @@ from homeassistant.const import (
     EVENT_CALL_SERVICE,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.core import Event, HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
@@ -76,6 +76,7 @@ from .models import (
     TIME_FIRED_TS_POS,
     EventAsRow,
     LazyEventPartialState,
+    LiveStreamIndex,
     LogbookConfig,
     async_event_to_row,
 )
@@ -99,6 +100,7 @@ class LogbookRun:
     include_entity_name: bool
     timestamp: bool
     memoize_new_contexts: bool = True
+    live_stream_index: LiveStreamIndex | None = None
 
 
 class EventProcessor:
@@ -133,6 +135,7 @@ class EventProcessor:
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
+            live_stream_index=logbook_config.live_stream_index,
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
 
@@ -198,10 +201,46 @@ class EventProcessor:
             )
         )
 
+    def humanify_events(self, events: Sequence[Event]) -> list[dict[str, Any]]:
+        """Humanify events from the live stream.
+
+        Once the stream is live the entries are shared with the other
+        live streams through the live stream index.
+        """
+        logbook_run = self.logbook_run
+        live_stream_index = logbook_run.live_stream_index
+        assert live_stream_index is not None
+        get_row = live_stream_index.async_get_row
+        if logbook_run.memoize_new_contexts:
+            # Rows are still augmented with the contexts from the database
+            return self.humanify(get_row(event) for event in events)
+
+        entries = live_stream_index.async_get_entries(
+            logbook_run.include_entity_name, logbook_run.timestamp
+        )
+        humanified: list[dict[str, Any]] = []
+        for event in events:
+            if event in entries:
+                entry = entries[event]
+            else:
+                entry = entries[event] = next(
+                    _humanify(
+                        self.hass,
+                        (get_row(event),),
+                        self.ent_reg,
+                        logbook_run,
+                        self.context_augmenter,
+                    ),
+                    None,
+                )
+            if entry is not None:
+                humanified.append(entry)
+        return humanified
+
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow] | Sequence[EventAsRow] | Sequence[Row] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -320,6 +359,7 @@ class ContextAugmenter:
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
         self.include_entity_name = logbook_run.include_entity_name
+        self.live_stream_index = logbook_run.live_stream_index
 
     def get_context(
         self, context_id_bin: bytes | None, row: Row | EventAsRow | None
@@ -334,6 +374,8 @@ class ContextAugmenter:
             and (context := row[CONTEXT_POS]) is not None
             and (origin_event := context.origin_event) is not None
         ):
+            if self.live_stream_index:
+                return self.live_stream_index.async_get_row(origin_event)
             return async_event_to_row(origin_event)
         return None
 
@@ -26,7 +26,7 @@ from .helpers import (
     async_filter_entities,
     async_subscribe_events,
 )
-from .models import LogbookConfig, async_event_to_row
+from .models import LogbookConfig
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
@@ -231,9 +231,7 @@ async def _async_events_consumer(
         while not stream_queue.empty():
             events.append(stream_queue.get_nowait())
 
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
+        if logbook_events := event_processor.humanify_events(events):
             connection.send_message(
                 json_bytes(
                     messages.event_message(
@@ -352,9 +350,9 @@ async def ws_event_stream(
             )
             _unsub()
 
+    logbook_config: LogbookConfig = hass.data[DOMAIN]
     entities_filter: Callable[[str], bool] | None = None
     if not event_processor.limited_select:
-        logbook_config: LogbookConfig = hass.data[DOMAIN]
         entities_filter = logbook_config.entity_filter
 
     async_subscribe_events(
@@ -366,6 +364,8 @@ async def ws_event_stream(
         entity_ids,
         device_ids,
     )
+    # The index of the live streams is cleared with the last subscription
+    subscriptions.append(logbook_config.live_stream_index.async_add_stream())
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
@@ -17,16 +17,23 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_TYPE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -75,16 +82,51 @@ CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
+PLATFORMS = [Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Profiler websocket commands."""
+    websocket_api.async_register_command(hass, websocket_loop_stats)
+    return True
+
+
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/loop_stats"})
+def websocket_loop_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the event loop lag and the callbacks that blocked it."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not loaded"
+        )
+        return
+    connection.send_result(msg["id"], hass.data[DOMAIN][LOOP_MONITOR].async_stats())
+
+
 async def async_setup_entry(  # noqa: C901
     hass: HomeAssistant, entry: ConfigEntry
 ) -> bool:
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass)
+    monitor.async_start()
+
+    async def _async_stop_monitor(event: Event) -> None:
+        await monitor.async_stop()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_monitor)
+    )
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -382,16 +424,19 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
-    hass.data.pop(DOMAIN)
+    await hass.data.pop(DOMAIN)[LOOP_MONITOR].async_stop()
     return True
 
 
@@ -0,0 +1,251 @@
+"""Monitor the lag of the event loop and the callbacks that block it."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any
+
+from lru import LRU
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+# Seconds between two heartbeats of the event loop
+SAMPLE_INTERVAL = 0.25
+# Lag in seconds from which the running callback is blamed for it
+SLOW_CALLBACK_THRESHOLD = 0.1
+# The percentiles are calculated over the last minute
+LAG_SAMPLES = 240
+MAX_SLOW_CALLBACKS = 64
+UPDATE_INTERVAL = timedelta(seconds=30)
+
+_INTEGRATION_PATHS = ("custom_components/", "homeassistant/components/")
+_PROFILER_PATH = "homeassistant/components/profiler/"
+
+
+@dataclass(slots=True)
+class SlowCallback:
+    """Statistics of a callback that blocked the event loop."""
+
+    integration: str | None
+    callback: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics with the durations in milliseconds."""
+        return {
+            "integration": self.integration,
+            "callback": self.callback,
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 1),
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+def _frame_integration(frame: FrameType) -> str | None:
+    """Return the integration the code of a frame belongs to."""
+    filename = frame.f_code.co_filename
+    for path in _INTEGRATION_PATHS:
+        if (index := filename.find(path)) == -1:
+            continue
+        start = index + len(path)
+        if (end := filename.find("/", start)) == -1:
+            return None
+        return filename[start:end]
+    return None
+
+
+def find_culprit(frame: FrameType | None) -> tuple[str | None, str]:
+    """Return the integration and callback a stack of the event loop is in.
+
+    The integration is the innermost one on the stack and the callback
+    the outermost frame of that integration, which is usually the
+    function the event loop called.
+    """
+    innermost = frame
+    integration: str | None = None
+    culprit: FrameType | None = None
+    while frame is not None:
+        if _PROFILER_PATH not in frame.f_code.co_filename and (
+            frame_integration := _frame_integration(frame)
+        ):
+            if integration is None:
+                integration = frame_integration
+            if frame_integration == integration:
+                culprit = frame
+        frame = frame.f_back
+    if culprit is None:
+        culprit = innermost
+    if culprit is None:
+        return None, "unknown"
+    code = culprit.f_code
+    return integration, f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    """Return the percentile of an ordered list of samples."""
+    return ordered[round(percentile * (len(ordered) - 1))]
+
+
+class LoopMonitor:
+    """Sample the event loop lag and attribute long lags to their callback.
+
+    A heartbeat on the event loop measures how late it runs. A watchdog
+    thread checks whether the heartbeat is overdue and, when it is,
+    takes the stack of the event loop thread once to find out which
+    callback is blocking it. Nothing is added to the callbacks themselves.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self._hass = hass
+        self._lags: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._slow_callbacks: LRU[tuple[str | None, str], SlowCallback] = LRU(
+            MAX_SLOW_CALLBACKS
+        )
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._deadline: float | None = None
+        # The deadline of the stalled heartbeat and the culprit the watchdog found
+        self._blocker: tuple[float, tuple[str | None, str]] | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._unsub_update: CALLBACK_TYPE | None = None
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+        self._loop_thread_id = 0
+        self.slow_callbacks_total = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling the event loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._async_schedule()
+        self._watchdog = threading.Thread(
+            target=self._watch, name="profiler_loop_watchdog", daemon=True
+        )
+        self._watchdog.start()
+        self._unsub_update = async_track_time_interval(
+            self._hass,
+            self._async_update_listeners,
+            UPDATE_INTERVAL,
+            name="profiler loop monitor",
+        )
+
+    async def async_stop(self) -> None:
+        """Stop sampling the event loop."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._unsub_update is not None:
+            self._unsub_update()
+            self._unsub_update = None
+        self._deadline = None
+        self._stop.set()
+        if self._watchdog is not None:
+            await self._hass.async_add_executor_job(self._watchdog.join)
+            self._watchdog = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for updates of the statistics."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    @callback
+    def _async_update_listeners(self, *_: Any) -> None:
+        """Notify the listeners the statistics were updated."""
+        for update_callback in self._listeners:
+            update_callback()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule the next heartbeat."""
+        self._deadline = time.monotonic() + SAMPLE_INTERVAL
+        self._handle = self._hass.loop.call_later(SAMPLE_INTERVAL, self._async_sample)
+
+    @callback
+    def _async_sample(self) -> None:
+        """Record how late the heartbeat runs."""
+        if (deadline := self._deadline) is None:
+            return
+        lag = max(time.monotonic() - deadline, 0.0)
+        self.async_record_lag(lag, deadline)
+        self._async_schedule()
+
+    @callback
+    def async_record_lag(self, lag: float, deadline: float | None = None) -> None:
+        """Record a lag and blame the callback the watchdog caught for a long one."""
+        self._lags.append(lag)
+        if lag < SLOW_CALLBACK_THRESHOLD:
+            return
+        self.slow_callbacks_total += 1
+        culprit: tuple[str | None, str] = (None, "unknown")
+        if (blocker := self._blocker) is not None and blocker[0] == deadline:
+            culprit = blocker[1]
+        if (stats := self._slow_callbacks.get(culprit)) is None:
+            stats = self._slow_callbacks[culprit] = SlowCallback(*culprit)
+        stats.count += 1
+        stats.total += lag
+        stats.max = max(stats.max, lag)
+
+    def _watch(self) -> None:
+        """Catch the callback blocking the event loop while it is blocked.
+
+        Runs in the watchdog thread.
+        """
+        while not self._stop.wait(SLOW_CALLBACK_THRESHOLD / 2):
+            deadline = self._deadline
+            if (
+                deadline is None
+                or time.monotonic() < deadline + SLOW_CALLBACK_THRESHOLD
+                or (self._blocker is not None and self._blocker[0] == deadline)
+            ):
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)  # noqa: SLF001
+            self._blocker = (deadline, find_culprit(frame))
+            del frame
+
+    @callback
+    def async_lag_percentiles(self) -> dict[str, float | None]:
+        """Return the lag percentiles in milliseconds."""
+        if not self._lags:
+            return dict.fromkeys(("p50", "p95", "p99", "max"))
+        ordered = sorted(self._lags)
+        return {
+            "p50": round(_percentile(ordered, 0.50) * 1000, 1),
+            "p95": round(_percentile(ordered, 0.95) * 1000, 1),
+            "p99": round(_percentile(ordered, 0.99) * 1000, 1),
+            "max": round(ordered[-1] * 1000, 1),
+        }
+
+    @callback
+    def async_slow_callbacks_in_window(self) -> int:
+        """Return how many heartbeats of the last minute were blocked."""
+        return sum(lag >= SLOW_CALLBACK_THRESHOLD for lag in self._lags)
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the statistics of the event loop."""
+        return {
+            "samples": len(self._lags),
+            "lag_ms": self.async_lag_percentiles(),
+            "slow_callbacks_in_window": self.async_slow_callbacks_in_window(),
+            "slow_callbacks_total": self.slow_callbacks_total,
+            "slow_callbacks": [
+                stats.as_dict()
+                for stats in sorted(
+                    self._slow_callbacks.values(),
+                    key=lambda stats: stats.total,
+                    reverse=True,
+                )
+            ],
+        }
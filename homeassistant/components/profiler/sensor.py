@@ -0,0 +1,93 @@
+"""Sensors for the event loop statistics of the profiler."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import LoopMonitor
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopMonitorSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of the event loop statistics."""
+
+    value_fn: Callable[[LoopMonitor], float | None]
+
+
+def _lag_description(percentile: str) -> LoopMonitorSensorEntityDescription:
+    """Return the description of a lag percentile sensor."""
+    return LoopMonitorSensorEntityDescription(
+        key=f"loop_lag_{percentile}",
+        translation_key=f"loop_lag_{percentile}",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda monitor: monitor.async_lag_percentiles()[percentile],
+    )
+
+
+SENSORS: tuple[LoopMonitorSensorEntityDescription, ...] = (
+    *(_lag_description(percentile) for percentile in ("p50", "p95", "p99", "max")),
+    LoopMonitorSensorEntityDescription(
+        key="slow_callbacks",
+        translation_key="slow_callbacks",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda monitor: monitor.async_slow_callbacks_in_window(),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the event loop sensors."""
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    async_add_entities(
+        LoopMonitorSensor(monitor, entry, description) for description in SENSORS
+    )
+
+
+class LoopMonitorSensor(SensorEntity):
+    """A rolling statistic of the event loop."""
+
+    entity_description: LoopMonitorSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        monitor: LoopMonitor,
+        entry: ConfigEntry,
+        description: LoopMonitorSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._monitor = monitor
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Write the statistics whenever the monitor updates them."""
+        self.async_on_remove(
+            self._monitor.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic."""
+        return self.entity_description.value_fn(self._monitor)
@@ -39,6 +39,7 @@ from . import (
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
     DOMAIN,
+    EVENT_RECORDER_PURGE_PROGRESS,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
     SQLITE_URL_PREFIX,
@@ -46,6 +47,7 @@ from .const import (  # noqa: F401
 )
 from .core import Recorder
 from .services import async_register_services
+from .table_managers.states_partitions import PARTITION_INTERVALS
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
 
@@ -68,6 +70,9 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_PURGE_RANGE_DELETE = "purge_range_delete"
+CONF_PARTITION_INTERVAL = "partition_interval"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -111,6 +116,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_PURGE_RANGE_DELETE, default=False): cv.boolean,
+                    vol.Optional(CONF_PARTITION_INTERVAL): vol.In(PARTITION_INTERVALS),
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -147,6 +155,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_insert = conf[CONF_BULK_INSERT]
+    purge_range_delete = conf[CONF_PURGE_RANGE_DELETE]
+    partition_interval = conf.get(CONF_PARTITION_INTERVAL)
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -159,12 +170,18 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if EVENT_STATE_CHANGED in exclude_event_types:
         _LOGGER.error("State change events cannot be excluded, use a filter instead")
         exclude_event_types.remove(EVENT_STATE_CHANGED)
+    # The purge progress is fired after every purge pass, recording
+    # it would only add more rows for the next purge.
+    exclude_event_types.add(EVENT_RECORDER_PURGE_PROGRESS)
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
         auto_repack=auto_repack,
         keep_days=keep_days,
         commit_interval=commit_interval,
+        bulk_insert=bulk_insert,
+        purge_range_delete=purge_range_delete,
+        partition_interval=partition_interval,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
@@ -80,12 +80,15 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
+from .table_managers.bulk_insert import BulkInsertManager, supports_bulk_insert
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
 from .table_managers.states_meta import StatesMetaManager
+from .table_managers.states_partitions import StatesPartitionManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
@@ -159,6 +162,9 @@ class Recorder(threading.Thread):
         auto_repack: bool,
         keep_days: int,
         commit_interval: int,
+        bulk_insert: bool,
+        purge_range_delete: bool,
+        partition_interval: str | None,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -177,6 +183,11 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.bulk_insert = bulk_insert
+        self._bulk_insert_active = False
+        self.purge_range_delete = purge_range_delete
+        self.partition_interval = partition_interval
+        self.purge_progress: PurgeProgress | None = None
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -205,7 +216,9 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = False
 
         self.recorder_runs_manager = RecorderRunsManager()
+        self.bulk_insert_manager = BulkInsertManager()
         self.states_manager = StatesManager()
+        self.states_partition_manager = StatesPartitionManager(self)
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -515,6 +528,8 @@ class Recorder(threading.Thread):
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
             self.queue_task(PerodicCleanupTask())
+        if self.partition_interval and self.states_partition_manager.active:
+            self.queue_task(migration.StatesPartitionTask())
 
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
@@ -687,6 +702,22 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_event_to_session(self, session: Session, dbevent: Events) -> None:
+        """Add an Events row to the session or the bulk insert buffer."""
+        if not self._bulk_insert_active:
+            self._add_to_session(session, dbevent)
+            return
+        self.bulk_insert_manager.add_event(dbevent)
+        self._event_session_has_pending_writes = True
+
+    def _add_state_to_session(self, session: Session, dbstate: States) -> None:
+        """Add a States row to the session or the bulk insert buffer."""
+        if not self._bulk_insert_active:
+            self._add_to_session(session, dbstate)
+            return
+        self.bulk_insert_manager.add_state(dbstate)
+        self._event_session_has_pending_writes = True
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -808,6 +839,11 @@ class Recorder(threading.Thread):
 
         migration.migrate_data_live(self, self.get_session, schema_status)
 
+        with session_scope(session=self.get_session(), read_only=True) as session:
+            self.states_partition_manager.load(session)
+        if self.partition_interval:
+            self.queue_task(migration.StatesPartitionTask())
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -1053,7 +1089,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1078,7 +1114,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1160,7 +1196,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1208,6 +1244,10 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self.bulk_insert_manager.pending:
+            with session.no_autoflush:
+                self.bulk_insert_manager.write_pending(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1257,6 +1297,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self.bulk_insert_manager.reset()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1282,6 +1323,11 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        self._bulk_insert_active = (
+            self.bulk_insert
+            and self.engine is not None
+            and supports_bulk_insert(self.engine)
+        )
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
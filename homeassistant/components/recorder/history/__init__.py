@@ -12,26 +12,75 @@ from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .loader import HISTORY_LOADER, HistoryLoader
 from .modern import (
+    get_downsampled_states_with_session as _modern_get_downsampled_states_with_session,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states,
 )
 
 # These are the APIs of this package
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "async_state_changes_during_period",
+    "get_downsampled_states_with_session",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states",
 ]
 
 
+def get_downsampled_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    max_points: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Return a dict of significant states downsampled to max_points per entity."""
+    if not get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only used while migrating, return the
+        # minimal response instead of downsampling it.
+        return get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            True,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_downsampled_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        max_points,
+        include_start_time_state,
+        significant_changes_only,
+        no_attributes,
+        compressed_state_format,
+    )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -181,3 +230,33 @@ def state_changes_during_period(
         limit,
         include_start_time_state,
     )
+
+
+async def async_state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> dict[str, list[State]]:
+    """Return a list of states that changed during a time period.
+
+    Unlike state_changes_during_period, requests made at about the same
+    time are answered together with a single query.
+    """
+    if not entity_id:
+        raise ValueError("entity_id must be provided")
+    if (loader := hass.data.get(HISTORY_LOADER)) is None:
+        loader = hass.data[HISTORY_LOADER] = HistoryLoader(hass)
+    return await loader.async_state_changes_during_period(
+        start_time,
+        end_time,
+        entity_id,
+        no_attributes,
+        descending,
+        limit,
+        include_start_time_state,
+    )
@@ -2,6 +2,16 @@
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+ENTITY_ID_KEY = "entity_id"
+STREAM_ATTRIBUTES_KEY = "attributes"
+
+# The maximum number of rows sent in one chunk when streaming history
+STREAM_CHUNK_SIZE = 1000
+
+# The maximum number of entities and of start time states selected by one
+# query for the state changes of several entities, which keeps it well
+# below the SQLite limits on compound selects (500) and expression depth
+MAX_PERIODS_PER_QUERY = 100
 
 SIGNIFICANT_DOMAINS = {
     "climate",
@@ -0,0 +1,260 @@
+"""Load the history of many entities with shared recorder queries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.util.hass_dict import HassKey
+
+from . import modern
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY_LOADER: HassKey[HistoryLoader] = HassKey("recorder_history_loader")
+
+
+@dataclass(slots=True)
+class _Request:
+    """A request for the state changes of an entity during a period."""
+
+    entity_id: str
+    start_time: datetime
+    end_time: datetime | None
+    no_attributes: bool
+    descending: bool
+    limit: int | None
+    include_start_time_state: bool
+    future: asyncio.Future[dict[str, list[State]]]
+
+
+def _state_at(state: State, start_time: datetime) -> State:
+    """Return a state as the state at the start of a period."""
+    return State(
+        state.entity_id,
+        state.state,
+        state.attributes,
+        last_changed=start_time,
+        last_reported=start_time,
+        last_updated=start_time,
+        validate_entity_id=False,
+    )
+
+
+def _derive_start_time_states(
+    states: list[State], start_times: list[datetime]
+) -> dict[float, State]:
+    """Return the states at points in time from the states of a merged period.
+
+    The states hold the state at the start of the merged period followed
+    by the state changes. Attributes may change without the state, so this
+    is only exact when the attributes are not loaded.
+    """
+    start_time_states: dict[float, State] = {}
+    for start_time in start_times:
+        start_time_ts = start_time.timestamp()
+        start_state: State | None = None
+        for index, state in enumerate(states):
+            timestamp = state.last_changed_timestamp
+            if timestamp > start_time_ts or (index and timestamp == start_time_ts):
+                break
+            start_state = state
+        if start_state is None:
+            continue
+        if start_state.last_changed_timestamp != start_time_ts:
+            start_state = _state_at(start_state, start_time)
+        start_time_states[start_time_ts] = start_state
+    return start_time_states
+
+
+def _split(
+    request: _Request, start_time_states: dict[float, State], changes: list[State]
+) -> dict[str, list[State]]:
+    """Return the part of the states of a merged period a request asked for."""
+    start_time_ts = request.start_time.timestamp()
+    end_time_ts = request.end_time.timestamp() if request.end_time else None
+    states = [
+        state
+        for state in changes
+        if start_time_ts < state.last_changed_timestamp
+        and (end_time_ts is None or state.last_changed_timestamp < end_time_ts)
+    ]
+    if request.limit:
+        # The limit applies to the newest states when descending
+        states = (
+            states[-request.limit :] if request.descending else states[: request.limit]
+        )
+    if request.include_start_time_state and (
+        start_state := start_time_states.get(start_time_ts)
+    ):
+        states.insert(0, start_state)
+    if request.descending:
+        states.reverse()
+    if not states:
+        return {}
+    return {request.entity_id: states}
+
+
+class HistoryLoader:
+    """Answer requests for the state changes of single entities in batches.
+
+    Integrations loading the history of their source entity when they are
+    set up send a query each, which adds up when many of them start at
+    once. The loader answers the requests made in the same event loop
+    iteration, and those made while the previous batch was loading, with
+    one query, asking for each entity once with the union of the periods
+    requested for it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loader."""
+        self._hass = hass
+        self._pending: list[_Request] = []
+        self._batch_task: asyncio.Task[None] | None = None
+
+    async def async_state_changes_during_period(
+        self,
+        start_time: datetime,
+        end_time: datetime | None,
+        entity_id: str,
+        no_attributes: bool,
+        descending: bool,
+        limit: int | None,
+        include_start_time_state: bool,
+    ) -> dict[str, list[State]]:
+        """Return the state changes of an entity once its batch is loaded."""
+        future: asyncio.Future[dict[str, list[State]]] = self._hass.loop.create_future()
+        self._pending.append(
+            _Request(
+                entity_id.lower(),
+                start_time,
+                end_time,
+                no_attributes,
+                descending,
+                limit,
+                include_start_time_state,
+                future,
+            )
+        )
+        if self._batch_task is None:
+            self._batch_task = self._hass.async_create_task(
+                self._async_load_batches(),
+                "recorder history loader",
+                eager_start=False,
+            )
+        return await future
+
+    async def _async_load_batches(self) -> None:
+        """Load batches of requests until none are pending."""
+        instance = get_instance(self._hass)
+        while self._pending:
+            requests = self._pending
+            self._pending = []
+            try:
+                results = await instance.async_add_executor_job(self._load, requests)
+            except Exception as err:  # noqa: BLE001
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(err)
+                continue
+            for request, result in zip(requests, results, strict=True):
+                if not request.future.done():
+                    request.future.set_result(result)
+        self._batch_task = None
+
+    def _load(self, requests: list[_Request]) -> list[dict[str, list[State]]]:
+        """Load the state changes of a batch of requests."""
+        # pylint: disable-next=import-outside-toplevel
+        from . import state_changes_during_period
+
+        hass = self._hass
+        instance = get_instance(hass)
+        results: dict[int, dict[str, list[State]]] = {}
+        merged: defaultdict[bool, list[tuple[int, _Request]]] = defaultdict(list)
+        requests_per_entity = Counter(
+            (request.no_attributes, request.entity_id) for request in requests
+        )
+        for index, request in enumerate(requests):
+            if (
+                len(requests) == 1
+                or not instance.states_meta_manager.active
+                # The limit can only be applied by the database when
+                # the period of the entity is not merged with another
+                or (
+                    request.limit
+                    and requests_per_entity[request.no_attributes, request.entity_id]
+                    > 1
+                )
+            ):
+                results[index] = state_changes_during_period(
+                    hass,
+                    request.start_time,
+                    request.end_time,
+                    request.entity_id,
+                    request.no_attributes,
+                    request.descending,
+                    request.limit,
+                    request.include_start_time_state,
+                )
+                continue
+            merged[request.no_attributes].append((index, request))
+
+        for no_attributes, merged_requests in merged.items():
+            periods: dict[str, tuple[datetime, datetime | None, list[datetime]]] = {}
+            limits: dict[str, tuple[int, bool]] = {}
+            for _, request in merged_requests:
+                if request.limit:
+                    limits[request.entity_id] = (request.limit, request.descending)
+                start_times = (
+                    [request.start_time] if request.include_start_time_state else []
+                )
+                if (period := periods.get(request.entity_id)) is None:
+                    periods[request.entity_id] = (
+                        request.start_time,
+                        request.end_time,
+                        start_times,
+                    )
+                    continue
+                start_time, end_time, merged_start_times = period
+                periods[request.entity_id] = (
+                    min(start_time, request.start_time),
+                    None
+                    if end_time is None or request.end_time is None
+                    else max(end_time, request.end_time),
+                    merged_start_times + start_times,
+                )
+            _LOGGER.debug(
+                "Loading %s history requests for %s entities with one query",
+                len(merged_requests),
+                len(periods),
+            )
+            if no_attributes and len(periods) == 1 and not limits:
+                # A single entity has a faster query for the start time state
+                entity_id, (start_time, end_time, start_times) = next(
+                    iter(periods.items())
+                )
+                states = state_changes_during_period(
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_id,
+                    no_attributes,
+                    include_start_time_state=bool(start_times),
+                ).get(entity_id, [])
+                loaded = {
+                    entity_id: (_derive_start_time_states(states, start_times), states)
+                }
+            else:
+                loaded = modern.state_changes_during_periods(
+                    hass, periods, no_attributes, limits
+                )
+            for index, request in merged_requests:
+                results[index] = _split(
+                    request, *loaded.get(request.entity_id, ({}, []))
+                )
+        return [results[index] for index in range(len(requests))]
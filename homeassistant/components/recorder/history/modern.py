@@ -16,13 +16,20 @@ from sqlalchemy import (
     func,
     lambda_stmt,
     literal,
+    or_,
     select,
     union_all,
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
@@ -41,12 +48,17 @@ from ..models import (
     extract_metadata_ids,
     row_to_compressed_state,
 )
+from ..models.state_attributes import EMPTY_JSON_OBJECT, decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
+    ENTITY_ID_KEY,
     LAST_CHANGED_KEY,
+    MAX_PERIODS_PER_QUERY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
+    STREAM_ATTRIBUTES_KEY,
+    STREAM_CHUNK_SIZE,
 )
 
 _FIELD_MAP = {
@@ -230,6 +242,48 @@ def get_significant_states_with_session(
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, start_time_ts, entity_id_to_metadata_id = query
+    assert entity_ids is not None
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, float | None, dict[str, int | None]] | None:
+    """Build the significant states statement.
+
+    Returns the statement, the start time timestamp if the start time
+    state is included and the entity_id to metadata_id map, or None if
+    none of the entities have been recorded.
+    """
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
@@ -240,7 +294,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -278,17 +332,306 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+    return (
+        stmt,
         start_time_ts if include_start_time_state else None,
+        entity_id_to_metadata_id,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Wrap stream_significant_states_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        yield from stream_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+        )
+
+
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Stream significant states as columnar chunks.
+
+    Runs the same query as get_significant_states_with_session, but reads
+    it with a server-side cursor and yields chunks of at most chunk_size
+    rows for a single entity as they are read, instead of building the
+    whole result in memory first.
+
+    Each chunk holds the entity_id and parallel arrays of states (s),
+    last_updated timestamps (lu), last_changed timestamps (lc, only when
+    significant_changes_only is False, None when equal to lu) and
+    attribute references (a, only when attributes are selected). The
+    references index into a table of attributes that is built up over
+    the stream; the attributes a chunk adds to it are sent along in the
+    chunk's attributes list. Attributes are decoded once per distinct
+    value instead of once per row.
+    """
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return
+    stmt, start_time_ts, entity_id_to_metadata_id = query
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    rows = session.connection().execution_options(yield_per=chunk_size).execute(stmt)
+    include_last_changed = not significant_changes_only
+    attribute_refs: dict[str, int] = {}
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        prev_state: str | None = None
+        chunk: dict[str, Any] | None = None
+        for row in group:
+            state: str = row.state
+            if minimal and chunk is not None and state == prev_state:
+                continue
+            if chunk is None or len(chunk[COMPRESSED_STATE_STATE]) == chunk_size:
+                if chunk is not None:
+                    yield chunk
+                chunk = _new_stream_chunk(
+                    entity_id, include_last_changed, not no_attributes
+                )
+            prev_state = state
+            last_updated_ts: float | None = row.last_updated_ts or start_time_ts
+            chunk[COMPRESSED_STATE_STATE].append(state)
+            chunk[COMPRESSED_STATE_LAST_UPDATED].append(last_updated_ts)
+            if include_last_changed:
+                last_changed_ts: float | None = row.last_changed_ts
+                chunk[COMPRESSED_STATE_LAST_CHANGED].append(
+                    last_changed_ts
+                    if last_changed_ts and last_changed_ts != last_updated_ts
+                    else None
+                )
+            if no_attributes:
+                continue
+            if minimal and len(chunk[COMPRESSED_STATE_STATE]) > 1:
+                # With minimal response only the first state of
+                # an entity carries its attributes
+                chunk[COMPRESSED_STATE_ATTRIBUTES].append(None)
+                continue
+            shared_attrs: str = row.attributes or EMPTY_JSON_OBJECT
+            if (attribute_ref := attribute_refs.get(shared_attrs)) is None:
+                attribute_ref = attribute_refs[shared_attrs] = len(attribute_refs)
+                chunk[STREAM_ATTRIBUTES_KEY].append(
+                    decode_attributes_from_source(shared_attrs, {})
+                )
+            chunk[COMPRESSED_STATE_ATTRIBUTES].append(attribute_ref)
+        if chunk is not None:
+            yield chunk
+
+
+def _new_stream_chunk(
+    entity_id: str, include_last_changed: bool, include_attributes: bool
+) -> dict[str, Any]:
+    """Return an empty columnar chunk for an entity."""
+    chunk: dict[str, Any] = {
+        ENTITY_ID_KEY: entity_id,
+        COMPRESSED_STATE_STATE: [],
+        COMPRESSED_STATE_LAST_UPDATED: [],
+    }
+    if include_last_changed:
+        chunk[COMPRESSED_STATE_LAST_CHANGED] = []
+    if include_attributes:
+        chunk[COMPRESSED_STATE_ATTRIBUTES] = []
+        chunk[STREAM_ATTRIBUTES_KEY] = []
+    return chunk
+
+
+def get_downsampled_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    max_points: int,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Return significant states downsampled to at most max_points per entity.
+
+    The period is split into max_points // 4 equally sized time buckets and
+    only the first, minimum, maximum and last state of each bucket are
+    returned, which is enough to draw the same line at the resolution
+    of the graph. States that are not numeric only keep the first and
+    last state of each bucket.
+
+    The result uses the minimal_response format: the first state of each
+    entity is a full state and the following states only carry the state
+    and the time it was updated.
+    """
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, start_time_ts, entity_id_to_metadata_id = query
+    return _downsampled_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time.timestamp(),
+        (end_time or dt_util.utcnow()).timestamp(),
+        max_points,
+        start_time_ts,
         entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
         compressed_state_format,
-        no_attributes=no_attributes,
+        no_attributes,
     )
 
 
+def _downsampled_states_to_dict(
+    states: Iterable[Row],
+    period_start_ts: float,
+    period_end_ts: float,
+    max_points: int,
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    compressed_state_format: bool,
+    no_attributes: bool,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Reduce SQL results to the first, min, max and last row of each bucket.
+
+    States must be sorted by entity_id and last_updated.
+    """
+    state_class: Callable[
+        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        State | dict[str, Any],
+    ]
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    bucket_width = max(period_end_ts - period_start_ts, 1) / max(max_points // 4, 1)
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+
+    def _row_time(row: Row) -> float:
+        """Return the time of a row, start time states use the start time."""
+        return cast(float, row[last_updated_ts_idx] or start_time_ts or period_start_ts)
+
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        ent_results = result[entity_id]
+        # Each bucket holds its [first, min, max, last] rows
+        buckets: list[list[Row | None]] = []
+        bucket: list[Row | None] = []
+        current_bucket = -1
+        min_value = max_value = 0.0
+        for row in group:
+            if (
+                row_bucket := int((_row_time(row) - period_start_ts) // bucket_width)
+            ) != current_bucket:
+                current_bucket = row_bucket
+                bucket = [row, None, None, row]
+                buckets.append(bucket)
+            else:
+                bucket[3] = row
+            try:
+                value = float(row[state_idx])
+            except (TypeError, ValueError):
+                continue
+            if bucket[1] is None or value < min_value:
+                bucket[1] = row
+                min_value = value
+            if bucket[2] is None or value > max_value:
+                bucket[2] = row
+                max_value = value
+
+        for bucket in buckets:
+            for row in sorted(
+                {id(row): row for row in bucket if row is not None}.values(),
+                key=_row_time,
+            ):
+                if not ent_results:
+                    ent_results.append(
+                        state_class(
+                            row,
+                            {},
+                            start_time_ts,
+                            entity_id,
+                            row[state_idx],
+                            row[last_updated_ts_idx],
+                            no_attributes,
+                        )
+                    )
+                elif compressed_state_format:
+                    ent_results.append(
+                        {attr_state: row[state_idx], attr_time: _row_time(row)}
+                    )
+                else:
+                    ent_results.append(
+                        {
+                            attr_state: row[state_idx],
+                            attr_time: _utc_from_timestamp(_row_time(row)).isoformat(),
+                        }
+                    )
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -331,6 +674,7 @@ def _state_changed_during_period_stmt(
     include_start_time_state: bool,
     run_start_ts: float | None,
     include_last_reported: bool,
+    descending: bool = False,
 ) -> Select | CompoundSelect:
     stmt = (
         _stmt_and_join_attributes(no_attributes, False, include_last_reported)
@@ -349,9 +693,21 @@ def _state_changed_during_period_stmt(
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    if limit:
-        stmt = stmt.limit(limit)
-    stmt = stmt.order_by(States.metadata_id, States.last_updated_ts)
+    if limit and descending:
+        # The limit applies to the newest states, which are
+        # selected in ascending order like all other states
+        newest = (
+            stmt.order_by(States.metadata_id, States.last_updated_ts.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = _select_from_subquery(
+            newest, no_attributes, False, include_last_reported
+        ).order_by(newest.c.last_updated_ts)
+    else:
+        if limit:
+            stmt = stmt.limit(limit)
+        stmt = stmt.order_by(States.metadata_id, States.last_updated_ts)
     if not include_start_time_state or not run_start_ts:
         # If we do not need the start time state or the
         # oldest possible timestamp is newer than the start time
@@ -432,6 +788,7 @@ def state_changes_during_period(
                 include_start_time_state,
                 oldest_ts,
                 has_last_reported,
+                descending,
             ),
             track_on=[
                 bool(end_time_ts),
@@ -439,6 +796,7 @@ def state_changes_during_period(
                 bool(limit),
                 include_start_time_state,
                 has_last_reported,
+                descending,
             ],
         )
         return cast(
@@ -456,6 +814,236 @@ def state_changes_during_period(
         )
 
 
+def _state_changes_during_periods_stmt(
+    periods: list[tuple[int, float, float | None]],
+    start_times: list[tuple[int, float]],
+    no_attributes: bool,
+    include_last_reported: bool,
+    limits: dict[int, tuple[int, bool]] | None = None,
+) -> Select:
+    """Return the statement for the state changes of entities in their periods.
+
+    periods holds the metadata_id, start and end of the period of every
+    entity and start_times the metadata_id and time of the states to add
+    at specific points in time. Those are marked by start_time_state and
+    have the point in time as last_updated_ts. limits maps the metadata_id
+    to the number of state changes to return and if those are the newest.
+    """
+    stmt = (
+        _stmt_and_join_attributes(no_attributes, False, include_last_reported)
+        .add_columns(literal(value=0).label("start_time_state"))
+        .filter(
+            (
+                (States.last_changed_ts == States.last_updated_ts)
+                | States.last_changed_ts.is_(None)
+            )
+            & or_(
+                *(
+                    and_(
+                        States.metadata_id == metadata_id,
+                        States.last_updated_ts > start_time_ts,
+                        States.last_updated_ts < end_time_ts,
+                    )
+                    if end_time_ts
+                    else and_(
+                        States.metadata_id == metadata_id,
+                        States.last_updated_ts > start_time_ts,
+                    )
+                    for metadata_id, start_time_ts, end_time_ts in periods
+                )
+            )
+        )
+    )
+    if not no_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    if limits:
+        stmt = _limit_state_changes_stmt(stmt, limits)
+    if not start_times:
+        return stmt.order_by(
+            stmt.selected_columns.metadata_id, stmt.selected_columns.last_updated_ts
+        )
+    parts: list[Select] = []
+    for metadata_id, start_time_ts in start_times:
+        subquery = _get_single_entity_start_time_stmt(
+            start_time_ts, metadata_id, no_attributes, False, include_last_reported
+        ).subquery()
+        part = select(
+            subquery.c.metadata_id,
+            subquery.c.state,
+            literal(value=start_time_ts).label("last_updated_ts"),
+        )
+        if include_last_reported:
+            part = part.add_columns(subquery.c.last_reported_ts)
+        if not no_attributes:
+            part = part.add_columns(subquery.c.attributes)
+        parts.append(part.add_columns(literal(value=1).label("start_time_state")))
+    changes = stmt.subquery()
+    parts.append(select(*changes.c))
+    unioned_subquery = union_all(*parts).subquery()
+    return select(*unioned_subquery.c).order_by(
+        unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts
+    )
+
+
+def _limit_state_changes_stmt(
+    stmt: Select, limits: dict[int, tuple[int, bool]]
+) -> Select:
+    """Return the state changes of stmt within the limits of their entities.
+
+    The state changes of every entity are numbered from the oldest and from
+    the newest so the limit of each entity can pick either.
+    """
+    ranked = stmt.add_columns(
+        func.row_number()
+        .over(partition_by=States.metadata_id, order_by=States.last_updated_ts)
+        .label("oldest_rownum"),
+        func.row_number()
+        .over(partition_by=States.metadata_id, order_by=States.last_updated_ts.desc())
+        .label("newest_rownum"),
+    ).subquery()
+    return select(
+        *(
+            column
+            for column in ranked.c
+            if column.name not in ("oldest_rownum", "newest_rownum")
+        )
+    ).where(
+        or_(
+            ranked.c.metadata_id.not_in(limits),
+            *(
+                and_(
+                    ranked.c.metadata_id == metadata_id,
+                    (ranked.c.newest_rownum if newest else ranked.c.oldest_rownum)
+                    <= limit,
+                )
+                for metadata_id, (limit, newest) in limits.items()
+            ),
+        )
+    )
+
+
+def _chunk_periods(
+    periods: list[tuple[int, float, float | None]],
+    start_times: list[tuple[int, float]],
+) -> Iterator[tuple[list[tuple[int, float, float | None]], list[tuple[int, float]]]]:
+    """Split the periods and start times into chunks to query one at a time.
+
+    Every chunk holds at most MAX_PERIODS_PER_QUERY periods and start times,
+    and the start times of an entity are in the chunk of its period.
+    """
+    start_times_by_metadata_id: dict[int, list[tuple[int, float]]] = {}
+    for start_time in start_times:
+        start_times_by_metadata_id.setdefault(start_time[0], []).append(start_time)
+    chunk_periods: list[tuple[int, float, float | None]] = []
+    chunk_start_times: list[tuple[int, float]] = []
+    for period in periods:
+        period_start_times = start_times_by_metadata_id.get(period[0], [])
+        if chunk_periods and (
+            len(chunk_periods) == MAX_PERIODS_PER_QUERY
+            or len(chunk_start_times) + len(period_start_times) > MAX_PERIODS_PER_QUERY
+        ):
+            yield chunk_periods, chunk_start_times
+            chunk_periods = []
+            chunk_start_times = []
+        chunk_periods.append(period)
+        chunk_start_times.extend(period_start_times)
+    yield chunk_periods, chunk_start_times
+
+
+def state_changes_during_periods(
+    hass: HomeAssistant,
+    periods: dict[str, tuple[datetime, datetime | None, list[datetime]]],
+    no_attributes: bool = False,
+    limits: dict[str, tuple[int, bool]] | None = None,
+) -> dict[str, tuple[dict[float, State], list[State]]]:
+    """Return the state changes of several entities, each during its own period.
+
+    periods maps the entity_id to the UTC start and end of its period and
+    the points in time to return the state at, like the start time state
+    of state_changes_during_period. limits maps the entity_id to the number
+    of state changes to return and if those are the newest instead of the
+    oldest. One query per chunk of entities returns, for every entity, the
+    states at those points in time by timestamp and the state changes
+    during the period.
+    """
+    instance = get_instance(hass)
+    has_last_reported = instance.schema_version >= LAST_REPORTED_SCHEMA_VERSION
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            periods, session, False
+        )
+        metadata_id_to_entity_id: dict[int, str] = {}
+        stmt_periods: list[tuple[int, float, float | None]] = []
+        start_times: list[tuple[int, float]] = []
+        stmt_limits: dict[int, tuple[int, bool]] = {}
+        for entity_id, (start_time, end_time, state_times) in periods.items():
+            if (metadata_id := entity_id_to_metadata_id.get(entity_id)) is None:
+                continue
+            metadata_id_to_entity_id[metadata_id] = entity_id
+            if limits and (limit := limits.get(entity_id)):
+                stmt_limits[metadata_id] = limit
+            stmt_periods.append(
+                (
+                    metadata_id,
+                    start_time.timestamp(),
+                    datetime_to_timestamp_or_none(end_time),
+                )
+            )
+            start_times.extend(
+                (metadata_id, state_time.timestamp())
+                for state_time in state_times
+                if _get_oldest_possible_ts(hass, state_time) is not None
+            )
+        if not stmt_periods:
+            return {}
+        rows: list[Row] = []
+        for chunk_periods, chunk_start_times in _chunk_periods(
+            stmt_periods, start_times
+        ):
+            rows.extend(
+                session.execute(
+                    _state_changes_during_periods_stmt(
+                        chunk_periods,
+                        chunk_start_times,
+                        no_attributes,
+                        has_last_reported,
+                        {
+                            metadata_id: stmt_limits[metadata_id]
+                            for metadata_id, _, _ in chunk_periods
+                            if metadata_id in stmt_limits
+                        },
+                    )
+                ).all()
+            )
+
+    result: dict[str, tuple[dict[float, State], list[State]]] = {}
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    for row_metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[row_metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        start_time_states: dict[float, State] = {}
+        changes: list[State] = []
+        for row in group:
+            state = LazyState(
+                row,
+                attr_cache,
+                None,
+                entity_id,
+                row[state_idx],
+                row[last_updated_ts_idx],
+                no_attributes,
+            )
+            if row.start_time_state:
+                start_time_states[row[last_updated_ts_idx]] = state
+            else:
+                changes.append(state)
+        result[entity_id] = (start_time_states, changes)
+    return result
+
+
 def _get_last_state_changes_single_stmt(metadata_id: int) -> Select:
     return (
         _stmt_and_join_attributes(False, False, False)
@@ -30,6 +30,7 @@ from sqlalchemy.sql.expression import true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
@@ -103,6 +104,16 @@ from .queries import (
     migrate_single_statistics_row_to_timestamp,
 )
 from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .table_managers.states_partitions import (
+    DEFAULT_PARTITION,
+    LEGACY_PARTITION,
+    PARTITION_INTERVALS,
+    PARTITIONS_AHEAD,
+    SELF_REFERENCING_FOREIGN_KEY_COLUMNS,
+    partition_start,
+    plan_partitions,
+    states_table_is_partitioned,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -824,6 +835,18 @@ def _restore_foreign_key_constraints(
             _LOGGER.info("Did not find a matching constraint for %s.%s", table, column)
             continue
 
+        if (
+            table == TABLE_STATES
+            and column in SELF_REFERENCING_FOREIGN_KEY_COLUMNS
+            and _states_table_is_partitioned(session_maker, engine)
+        ):
+            _LOGGER.info(
+                "The partitioned states table can not have a constraint for %s.%s",
+                table,
+                column,
+            )
+            continue
+
         inspector = sqlalchemy.inspect(engine)
         if any(
             foreign_key["name"] and foreign_key["constrained_columns"] == [column]
@@ -862,6 +885,16 @@ def _restore_foreign_key_constraints(
             _add_constraint(session_maker, add_constraint, table, column)
 
 
+def _states_table_is_partitioned(
+    session_maker: Callable[[], Session], engine: Engine
+) -> bool:
+    """Return if the states table is partitioned."""
+    if engine.dialect.name != SupportedDialect.POSTGRESQL:
+        return False
+    with session_scope(session=session_maker(), read_only=True) as session:
+        return states_table_is_partitioned(session)
+
+
 def _add_constraint(
     session_maker: Callable[[], Session],
     add_constraint: AddConstraint,
@@ -3055,3 +3088,221 @@ def rebuild_sqlite_table(
         with session_scope(session=session_maker()) as session:
             # Step 12 - Re-enable foreign keys
             session.connection().execute(text("PRAGMA foreign_keys=ON"))
+
+
+def partition_states_table(
+    session_maker: Callable[[], Session], engine: Engine, interval: str
+) -> bool:
+    """Move the PostgreSQL states table into the time partitioned layout.
+
+    The existing table is attached as the first partition instead of
+    being copied, so the only steps that scan it run with locks that
+    do not block writes. Partitions for new rows are created after it.
+    """
+    cutoff_constraint = f"{LEGACY_PARTITION}_range"
+    unique_index = f"ix_{LEGACY_PARTITION}_state_id_last_updated_ts"
+
+    _LOGGER.warning("Partitioning the states table; %s", MIGRATION_NOTE_WHILE)
+
+    try:
+        with session_scope(session=session_maker()) as session:
+            # Rows without last_updated_ts can not be placed in a partition
+            session.execute(text("DELETE FROM states WHERE last_updated_ts IS NULL"))
+            max_ts = session.execute(text("SELECT max(last_updated_ts) FROM states"))
+            newest = dt_util.utcnow()
+            if (max_ts_value := max_ts.scalar()) is not None:
+                newest = max(newest, dt_util.utc_from_timestamp(max_ts_value))
+            cutoff = partition_start(newest, interval) + PARTITION_INTERVALS[interval]
+            cutoff_ts = cutoff.timestamp()
+            session.execute(
+                text(
+                    f"ALTER TABLE states ADD CONSTRAINT {cutoff_constraint}"
+                    " CHECK (last_updated_ts IS NOT NULL"
+                    f" AND last_updated_ts < {cutoff_ts!r}) NOT VALID"
+                )
+            )
+        # Validating only takes a SHARE UPDATE EXCLUSIVE lock
+        with session_scope(session=session_maker()) as session:
+            session.execute(
+                text(f"ALTER TABLE states VALIDATE CONSTRAINT {cutoff_constraint}")
+            )
+        # The primary key of a partitioned table has to include
+        # the partition key
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(
+                text(
+                    f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {unique_index}"
+                    " ON states (state_id, last_updated_ts)"
+                )
+            )
+        with session_scope(session=session_maker()) as session:
+            index_definitions = [
+                definition
+                for name, definition in session.execute(
+                    text(
+                        "SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)"
+                        " FROM pg_index WHERE indrelid = 'states'::regclass"
+                        " AND NOT indisprimary"
+                    )
+                )
+                if name != unique_index
+            ]
+            index_names = [
+                name
+                for (name,) in session.execute(
+                    text(
+                        "SELECT indexrelid::regclass::text FROM pg_index"
+                        " WHERE indrelid = 'states'::regclass"
+                    )
+                )
+                if name != unique_index
+            ]
+            foreign_keys = list(
+                session.execute(
+                    text(
+                        "SELECT conname, pg_get_constraintdef(oid),"
+                        " (SELECT attname FROM pg_attribute"
+                        " WHERE attrelid = conrelid AND attnum = conkey[1])"
+                        " FROM pg_constraint"
+                        " WHERE conrelid = 'states'::regclass AND contype = 'f'"
+                    )
+                )
+            )
+            identity = session.execute(
+                text(
+                    "SELECT attidentity FROM pg_attribute"
+                    " WHERE attrelid = 'states'::regclass AND attname = 'state_id'"
+                )
+            ).scalar()
+            sequence = session.execute(
+                text("SELECT pg_get_serial_sequence('states', 'state_id')")
+            ).scalar()
+            next_state_id = (
+                session.execute(text("SELECT max(state_id) FROM states")).scalar() or 0
+            ) + 1
+
+            session.execute(text(f"ALTER TABLE states RENAME TO {LEGACY_PARTITION}"))
+            for name in index_names:
+                session.execute(text(f"ALTER INDEX {name} RENAME TO {name}_legacy"))
+            for name, _, column in foreign_keys:
+                if column in SELF_REFERENCING_FOREIGN_KEY_COLUMNS:
+                    # Foreign keys can not reference a partitioned table
+                    # without the partition key; the logbook already treats
+                    # a missing old state as no old state.
+                    session.execute(
+                        text(f"ALTER TABLE {LEGACY_PARTITION} DROP CONSTRAINT {name}")
+                    )
+            session.execute(
+                text(
+                    f"ALTER TABLE {LEGACY_PARTITION} ADD CONSTRAINT {unique_index}"
+                    f" UNIQUE USING INDEX {unique_index}"
+                )
+            )
+            session.execute(
+                text(
+                    f"ALTER TABLE {LEGACY_PARTITION}"
+                    " ALTER COLUMN last_updated_ts SET NOT NULL"
+                )
+            )
+            if identity:
+                session.execute(
+                    text(
+                        f"ALTER TABLE {LEGACY_PARTITION}"
+                        " ALTER COLUMN state_id DROP IDENTITY"
+                    )
+                )
+            else:
+                session.execute(
+                    text(
+                        f"ALTER TABLE {LEGACY_PARTITION}"
+                        " ALTER COLUMN state_id DROP DEFAULT"
+                    )
+                )
+                if sequence:
+                    session.execute(text(f"DROP SEQUENCE {sequence}"))
+            session.execute(
+                text(f"CREATE SEQUENCE states_state_id_seq START WITH {next_state_id}")
+            )
+            session.execute(
+                text(
+                    f"CREATE TABLE states (LIKE {LEGACY_PARTITION} INCLUDING DEFAULTS)"
+                    " PARTITION BY RANGE (last_updated_ts)"
+                )
+            )
+            session.execute(
+                text(
+                    "ALTER TABLE states ALTER COLUMN state_id"
+                    " SET DEFAULT nextval('states_state_id_seq')"
+                )
+            )
+            session.execute(
+                text("ALTER SEQUENCE states_state_id_seq OWNED BY states.state_id")
+            )
+            session.execute(
+                text(
+                    "ALTER TABLE states ADD CONSTRAINT states_pkey"
+                    " PRIMARY KEY (state_id, last_updated_ts)"
+                )
+            )
+            for name, definition, column in foreign_keys:
+                if column not in SELF_REFERENCING_FOREIGN_KEY_COLUMNS:
+                    session.execute(
+                        text(f"ALTER TABLE states ADD CONSTRAINT {name} {definition}")
+                    )
+            # The indexes on the partitioned table are created while it has
+            # no partitions; attaching the legacy table adopts its matching
+            # indexes instead of building new ones.
+            for definition in index_definitions:
+                session.execute(text(definition))
+            session.execute(
+                text(
+                    f"ALTER TABLE states ATTACH PARTITION {LEGACY_PARTITION}"
+                    f" FOR VALUES FROM (MINVALUE) TO ({cutoff_ts!r})"
+                )
+            )
+            for partition in plan_partitions(
+                cutoff,
+                cutoff + PARTITION_INTERVALS[interval] * PARTITIONS_AHEAD,
+                interval,
+            ):
+                session.execute(
+                    text(
+                        f"CREATE TABLE {partition.name} PARTITION OF states"
+                        f" FOR VALUES FROM ({partition.start_ts!r})"
+                        f" TO ({partition.end_ts!r})"
+                    )
+                )
+            session.execute(
+                text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF states DEFAULT")
+            )
+    except SQLAlchemyError:
+        _LOGGER.exception("Error partitioning the states table")
+        return False
+    _LOGGER.warning("Partitioning the states table finished")
+    return True
+
+
+@dataclass(slots=True)
+class StatesPartitionTask(RecorderTask):
+    """Partition the states table and create the upcoming partitions."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run partition task."""
+        interval = instance.partition_interval
+        assert interval is not None
+        if instance.dialect_name != SupportedDialect.POSTGRESQL:
+            _LOGGER.warning(
+                "Partitioning the states table is only supported on PostgreSQL"
+            )
+            return
+        manager = instance.states_partition_manager
+        if not manager.active:
+            assert instance.engine is not None
+            if not partition_states_table(
+                instance.get_session, instance.engine, interval
+            ):
+                return
+            with session_scope(session=instance.get_session()) as session:
+                manager.load(session)
+        with session_scope(session=instance.get_session()) as session:
+            manager.ensure_partitions(session, dt_util.utcnow(), interval)
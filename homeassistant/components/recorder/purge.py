@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
+from .const import SupportedDialect
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -26,6 +29,7 @@ from .queries import (
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
@@ -38,6 +42,7 @@ from .queries import (
     find_legacy_row,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
+    find_states_to_purge_by_range,
     find_statistics_runs_to_purge,
 )
 from .repack import repack_database
@@ -52,6 +57,94 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The purge runs in passes with a commit in between so events can be
+# recorded while a large purge is running. The number of batches per
+# pass is adjusted so a pass takes about PURGE_TIME_SLICE seconds, half
+# of it for states and half of it for events.
+PURGE_TIME_SLICE = 1.0
+MAX_BATCHES_PER_PURGE = 100
+# Weight of the newest measurement in the moving average of the batch latency
+BATCH_LATENCY_WEIGHT = 0.5
+
+RANGE_DELETE_DIALECTS = {SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL}
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge that runs in multiple passes."""
+
+    purge_before: datetime
+    started: datetime
+    states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE
+    events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE
+    passes: int = 0
+    states_purged: int = 0
+    events_purged: int = 0
+    states_batch_latency: float | None = None
+    events_batch_latency: float | None = None
+    finished: datetime | None = None
+
+    def record_states_batches(self, purged: int, batches: int, elapsed: float) -> None:
+        """Record the batches of states purged in a pass.
+
+        The elapsed time includes purging the attributes the states no
+        longer use.
+        """
+        self.states_purged += purged
+        self.states_batch_latency = _moving_average(
+            self.states_batch_latency, elapsed / batches
+        )
+
+    def record_events_batches(self, purged: int, batches: int, elapsed: float) -> None:
+        """Record the batches of events purged in a pass.
+
+        The elapsed time includes purging the event data the events no
+        longer use.
+        """
+        self.events_purged += purged
+        self.events_batch_latency = _moving_average(
+            self.events_batch_latency, elapsed / batches
+        )
+
+    def finish_pass(self, done: bool) -> None:
+        """Finish a purge pass and size the batches of the next one."""
+        self.passes += 1
+        if done:
+            self.finished = dt_util.utcnow()
+        self.states_batch_size = _batches_per_time_slice(
+            self.states_batch_latency, self.states_batch_size
+        )
+        self.events_batch_size = _batches_per_time_slice(
+            self.events_batch_latency, self.events_batch_size
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "finished": self.finished.isoformat() if self.finished else None,
+            "passes": self.passes,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+        }
+
+
+def _moving_average(average: float | None, value: float) -> float:
+    """Return the moving average of the batch latency."""
+    if average is None:
+        return value
+    return average + BATCH_LATENCY_WEIGHT * (value - average)
+
+
+def _batches_per_time_slice(latency: float | None, batch_size: int) -> int:
+    """Return the number of batches that can be purged in half a time slice."""
+    if not latency:
+        return batch_size
+    return max(1, min(MAX_BATCHES_PER_PURGE, int(PURGE_TIME_SLICE / 2 / latency)))
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -61,6 +154,7 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
@@ -85,11 +179,16 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
+            if instance.states_partition_manager.active:
+                has_more_to_purge |= _purge_states_partitions(
+                    instance, session, purge_before, progress
+                )
+            else:
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before, progress
+                )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -179,6 +278,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -193,17 +293,29 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    use_range_delete = _use_range_delete(instance)
+    start = time.monotonic()
+    batches = purged = 0
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
-        )
+        if use_range_delete:
+            state_ids, attributes_ids = _purge_states_by_range(
+                instance, session, purge_before, max_bind_vars
+            )
+        else:
+            state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+                session, purge_before, max_bind_vars
+            )
+            _purge_state_ids(instance, session, state_ids)
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
-        _purge_state_ids(instance, session, state_ids)
+        batches += 1
+        purged += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    if progress and batches:
+        progress.record_states_batches(purged, batches, time.monotonic() - start)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -211,11 +323,47 @@ def _purge_states_and_attributes_ids(
     return has_remaining_state_ids_to_purge
 
 
+def _purge_states_partitions(
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    progress: PurgeProgress | None = None,
+) -> bool:
+    """Drop an expired states partition and purge the default partition.
+
+    Only one partition is dropped per pass so the commit in between
+    releases the lock on the states table. The default partition is
+    purged once no expired partition is left.
+
+    Returns true if there are more states to purge.
+    """
+    manager = instance.states_partition_manager
+    start = time.monotonic()
+    if expired_partitions := manager.expired_partitions(purge_before):
+        partition = expired_partitions[0]
+        _LOGGER.debug("Dropping states partition %s", partition.name)
+        attributes_ids = manager.drop_partition(session, partition)
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+        # The next pass purges the default partition
+        return True
+    state_ids, attributes_ids = manager.select_default_partition_rows_to_purge(
+        session, purge_before, instance.max_bind_vars
+    )
+    if not state_ids:
+        return False
+    _purge_state_ids(instance, session, state_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    if progress:
+        progress.record_states_batches(len(state_ids), 1, time.monotonic() - start)
+    return True
+
+
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -228,6 +376,8 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    start = time.monotonic()
+    batches = purged = 0
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
@@ -236,9 +386,13 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        batches += 1
+        purged += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
+    if progress and batches:
+        progress.record_events_batches(purged, batches, time.monotonic() - start)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -266,6 +420,58 @@ def _select_state_attributes_ids_to_purge(
     return state_ids, attributes_ids
 
 
+def _use_range_delete(instance: Recorder) -> bool:
+    """Return if states should be purged with range deletes."""
+    return (
+        instance.purge_range_delete and instance.dialect_name in RANGE_DELETE_DIALECTS
+    )
+
+
+def _purge_states_by_range(
+    instance: Recorder, session: Session, purge_before: datetime, max_bind_vars: int
+) -> tuple[set[int], set[int]]:
+    """Purge the oldest states with a range delete on last_updated_ts.
+
+    A range delete can be pruned to the partitions of the states table
+    that hold the range, where deleting by state_id has to look in all of
+    them. The oldest max_bind_vars states are selected first so the
+    states that link to them can be disconnected and their attributes_ids
+    can be checked.
+
+    Returns the purged state and attributes ids.
+    """
+    purge_before_ts = purge_before.timestamp()
+    rows = session.execute(
+        find_states_to_purge_by_range(purge_before_ts, max_bind_vars)
+    ).all()
+    if not rows:
+        return set(), set()
+    if len(rows) < max_bind_vars:
+        # All the states before purge_before have been selected
+        purge_to_ts = purge_before_ts
+    elif (purge_to_ts := rows[-1].last_updated_ts) == rows[0].last_updated_ts:
+        # All the selected states were updated at the same time, the
+        # range would be empty so fall back to deleting them by id.
+        state_ids = {row.state_id for row in rows}
+        _purge_state_ids(instance, session, state_ids)
+        return state_ids, {row.attributes_id for row in rows if row.attributes_id}
+    # The range excludes the newest selected states as there might be
+    # more states with the same last_updated_ts that were not selected.
+    state_ids = set()
+    attributes_ids = set()
+    for state_id, attributes_id, last_updated_ts in rows:
+        if last_updated_ts < purge_to_ts:
+            state_ids.add(state_id)
+            if attributes_id:
+                attributes_ids.add(attributes_id)
+    disconnected_rows = session.execute(disconnect_states_rows(state_ids))
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+    deleted_rows = session.execute(delete_states_rows_before(purge_to_ts))
+    _LOGGER.debug("Deleted %s states with a range delete", deleted_rows)
+    instance.states_manager.evict_purged_state_ids(state_ids)
+    return state_ids, attributes_ids
+
+
 def _select_event_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
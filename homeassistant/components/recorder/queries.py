@@ -269,6 +269,27 @@ def find_states_to_purge(
     )
 
 
+def find_states_to_purge_by_range(
+    purge_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the oldest states to purge ordered by last_updated_ts."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.attributes_id, States.last_updated_ts)
+        .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts.asc())
+        .limit(max_bind_vars)
+    )
+
+
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete states rows with a last_updated_ts before purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_oldest_state() -> StatementLambdaElement:
     """Find the last_updated_ts of the oldest state."""
     return lambda_stmt(
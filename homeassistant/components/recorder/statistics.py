@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
@@ -165,6 +166,9 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_ACCUMULATOR = "recorder_hourly_statistics_accumulator"
+
+PERIODS_PER_HOUR = int(Statistics.duration / StatisticsShortTerm.duration)
 
 
 def mean(values: list[float]) -> float | None:
@@ -208,6 +212,138 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _HourlySummary:
+    """Running summary of the short term statistics of one metadata_id."""
+
+    start_ts: float
+    mean_total: float = 0.0
+    mean_count: int = 0
+    min: float | None = None
+    max: float | None = None
+    last_reset_ts: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+    def as_statistic_data(self) -> StatisticDataTimestamp:
+        """Return the summary as hourly statistic data."""
+        data: StatisticDataTimestamp = {
+            "start_ts": self.start_ts,
+            "last_reset_ts": self.last_reset_ts,
+        }
+        if self.mean_count:
+            data["mean"] = self.mean_total / self.mean_count
+        if self.min is not None:
+            data["min"] = self.min
+        if self.max is not None:
+            data["max"] = self.max
+        if self.state is not None:
+            data["state"] = self.state
+        if self.sum is not None:
+            data["sum"] = self.sum
+        return data
+
+
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsAccumulator:
+    """Accumulate short term statistics for the hourly statistics.
+
+    The short term statistics are folded into a running mean, min, max and
+    last sum per metadata_id as each 5-minute period is compiled, so the
+    hourly statistics can be created without querying the short term
+    statistics table again.
+
+    The summary is only used if every period of the hour was compiled by
+    this instance and nothing else modified the short term statistics of
+    the hour in the meantime, otherwise the hourly statistics are compiled
+    from the database as before.
+    """
+
+    _hour_start_ts: float | None = None
+    _periods: set[float] = dataclasses.field(default_factory=set)
+    _summaries: dict[int, _HourlySummary] = dataclasses.field(default_factory=dict)
+    _valid: bool = True
+
+    def add_period(
+        self,
+        start: datetime,
+        stats: Iterable[tuple[int, StatisticData]],
+    ) -> None:
+        """Fold the short term statistics of a 5-minute period into the summary.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        hour_start_ts = start.replace(minute=0).timestamp()
+        start_ts = start.timestamp()
+        if hour_start_ts != self._hour_start_ts:
+            self._hour_start_ts = hour_start_ts
+            self._periods.clear()
+            self._summaries.clear()
+            self._valid = True
+        if start_ts in self._periods:
+            # The period is compiled again after a failed attempt, the rows
+            # from the first attempt may or may not have been committed.
+            self.invalidate()
+        self._periods.add(start_ts)
+        if not self._valid:
+            return
+        summaries = self._summaries
+        for metadata_id, stat in stats:
+            if (summary := summaries.get(metadata_id)) is None:
+                summary = summaries[metadata_id] = _HourlySummary(hour_start_ts)
+            if (mean := stat.get("mean")) is not None:
+                summary.mean_total += mean
+                summary.mean_count += 1
+            if (min_ := stat.get("min")) is not None and (
+                summary.min is None or min_ < summary.min
+            ):
+                summary.min = min_
+            if (max_ := stat.get("max")) is not None and (
+                summary.max is None or max_ > summary.max
+            ):
+                summary.max = max_
+            # Periods are compiled in order so the last one holds the sum
+            summary.last_reset_ts = datetime_to_timestamp_or_none(
+                stat.get("last_reset")
+            )
+            summary.state = stat.get("state")
+            summary.sum = stat.get("sum")
+
+    def invalidate(self) -> None:
+        """Stop using the summary of the current hour.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._summaries.clear()
+        self._valid = False
+
+    def pop_summary(
+        self, hour_start: datetime
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the summary of an hour if it is complete and reset.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        summary: dict[int, StatisticDataTimestamp] | None = None
+        if (
+            self._valid
+            and self._hour_start_ts == hour_start.timestamp()
+            and len(self._periods) == PERIODS_PER_HOUR
+        ):
+            summary = {
+                metadata_id: hourly_summary.as_statistic_data()
+                for metadata_id, hourly_summary in self._summaries.items()
+            }
+        self._hour_start_ts = None
+        self._periods.clear()
+        self._summaries.clear()
+        self._valid = True
+        return summary
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -248,13 +384,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_display_unit(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-    allow_none: bool = True,
-) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit if the statistic is converted."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -272,6 +407,24 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+    allow_none: bool = True,
+) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if (
+        display := _get_statistic_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+
+    converter, display_unit = display
     if allow_none:
         return converter.converter_factory_allow_none(
             from_unit=statistic_unit, to_unit=display_unit
@@ -397,14 +550,24 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    session: Session, start: datetime, accumulator: HourlyStatisticsAccumulator
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If all 5-minute statistics of the hour were compiled by this instance
+    the summary is taken from the accumulator instead.
     """
     start_time = start.replace(minute=0)
+    if (summary_from_accumulator := accumulator.pop_summary(start_time)) is not None:
+        _LOGGER.debug("Compiling hourly statistics for %s from memory", start_time)
+        _insert_hourly_statistics(session, summary_from_accumulator)
+        return
+
     start_time_ts = start_time.timestamp()
     end_time = start_time + Statistics.duration
     end_time_ts = end_time.timestamp()
@@ -447,7 +610,13 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
+    _insert_hourly_statistics(session, summary)
+
+
+def _insert_hourly_statistics(
+    session: Session, summary: dict[int, StatisticDataTimestamp]
+) -> None:
+    """Insert compiled hourly statistics in the database."""
     now_timestamp = time_time()
     session.add_all(
         Statistics.from_stats_ts(metadata_id, summary_item, now_timestamp)
@@ -455,6 +624,27 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     )
 
 
+def _filter_compile_statistics_error(
+    instance: Recorder,
+) -> Callable[[Exception], bool]:
+    """Create a filter which drops the hourly summary when compiling fails.
+
+    The session is rolled back so the short term statistics which were
+    added to the accumulator might not be in the database.
+    """
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
+    filter_unique_constraint = filter_unique_constraint_integrity_error(
+        instance, "statistic"
+    )
+
+    def _filter_compile_statistics_error(err: Exception) -> bool:
+        """Invalidate the accumulator and filter unique constraint errors."""
+        accumulator.invalidate()
+        return filter_unique_constraint(err)
+
+    return _filter_compile_statistics_error
+
+
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
     """Compile missing statistics."""
@@ -469,9 +659,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
 
     with session_scope(
         session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
+        exception_filter=_filter_compile_statistics_error(instance),
     ) as session:
         # Find the newest statistics run, if any
         if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
@@ -484,8 +672,10 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             periods_without_commit += 1
             end = start + timedelta(minutes=period_size)
             _LOGGER.debug("Compiling missing statistics for %s-%s", start, end)
+            # There are no runs after the newest run, so there is no need
+            # to check if each period has already been compiled
             modified_statistic_ids = _compile_statistics(
-                instance, session, start, end >= last_period
+                instance, session, start, end >= last_period, check_existing_run=False
             )
             if periods_without_commit == commit_interval or modified_statistic_ids:
                 session.commit()
@@ -511,9 +701,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
         session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
+        exception_filter=_filter_compile_statistics_error(instance),
     ) as session:
         modified_statistic_ids = _compile_statistics(
             instance, session, start, fire_events
@@ -536,7 +724,11 @@ def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
 
 
 def _compile_statistics(
-    instance: Recorder, session: Session, start: datetime, fire_events: bool
+    instance: Recorder,
+    session: Session,
+    start: datetime,
+    fire_events: bool,
+    check_existing_run: bool = True,
 ) -> set[str]:
     """Compile 5-minute statistics for all integrations with a recorder platform.
 
@@ -551,7 +743,9 @@ def _compile_statistics(
     modified_statistic_ids: set[str] = set()
 
     # Return if we already have 5-minute statistics for the requested period
-    if execute_stmt_lambda_element(session, _get_first_id_stmt(start)):
+    if check_existing_run and execute_stmt_lambda_element(
+        session, _get_first_id_stmt(start)
+    ):
         _LOGGER.debug("Statistics already compiled for %s-%s", start, end)
         return modified_statistic_ids
 
@@ -580,6 +774,7 @@ def _compile_statistics(
         current_metadata.update(compiled.current_metadata)
 
     new_short_term_stats: list[StatisticsBase] = []
+    inserted_stats: list[tuple[int, StatisticData]] = []
     updated_metadata_ids: set[int] = set()
     now_timestamp = time_time()
     # Insert collected statistics in the database
@@ -594,6 +789,10 @@ def _compile_statistics(
             session, StatisticsShortTerm, metadata_id, stats["stat"], now_timestamp
         ):
             new_short_term_stats.append(new_stat)
+            inserted_stats.append((metadata_id, stats["stat"]))
+
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
+    accumulator.add_period(start, inserted_stats)
 
     if start.minute == 50:
         # Once every hour, update issues
@@ -608,7 +807,7 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, accumulator)
 
     session.add(StatisticsRuns(start=start))
 
@@ -754,6 +953,7 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
@@ -909,61 +1109,70 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
+_start_getter = itemgetter("start")
+
+
 def _reduce_statistics(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily or monthly statistics."""
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
     _want_last_reset = "last_reset" in types
     _want_state = "state" in types
     _want_sum = "sum" in types
+    # The periods of different statistics mostly start with the same hour
+    periods: dict[float, tuple[float, float]] = {}
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        reduced = result[statistic_id]
+        first = 0
+        # Reduce a period at a time, the statistics are sorted by start so
+        # the period ends before the first statistic starting at its end
+        while first < len(stat_list):
+            first_start = stat_list[first]["start"]
+            if (period := periods.get(first_start)) is None:
+                period = periods[first_start] = period_start_end(first_start)
+            start, end = period
+            last = bisect_left(stat_list, end, first + 1, key=_start_getter)
+            period_stats = stat_list[first:last]
+            last_stat = stat_list[last - 1]
+            row: StatisticsRow = {
+                "start": start,
+                "end": end,
+            }
+            if _want_mean:
+                mean_values = [
+                    _mean
+                    for statistic in period_stats
+                    if (_mean := statistic.get("mean")) is not None
+                ]
+                row["mean"] = mean(mean_values) if mean_values else None
+            if _want_min:
+                min_values = [
+                    _min
+                    for statistic in period_stats
+                    if (_min := statistic.get("min")) is not None
+                ]
+                row["min"] = min(min_values) if min_values else None
+            if _want_max:
+                max_values = [
+                    _max
+                    for statistic in period_stats
+                    if (_max := statistic.get("max")) is not None
+                ]
+                row["max"] = max(max_values) if max_values else None
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            reduced.append(row)
+            first = last
 
     return result
 
@@ -1011,10 +1220,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1061,10 +1268,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1116,10 +1321,8 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics(stats, _month_start_end_ts, types)
 
 
 def _generate_statistics_during_period_stmt(
@@ -2099,6 +2302,27 @@ def _build_sum_converted_stats(
     ]
 
 
+def _build_sum_ratio_converted_stats(
+    db_rows: list[Row],
+    table_duration_seconds: float,
+    start_ts_idx: int,
+    sum_idx: int,
+    from_ratio: float,
+    to_ratio: float,
+) -> list[StatisticsRow]:
+    """Build a list of sum statistics converted with unit ratios."""
+    return [
+        {
+            "start": (start_ts := db_row[start_ts_idx]),
+            "end": start_ts + table_duration_seconds,
+            "sum": None
+            if (v := db_row[sum_idx]) is None
+            else (v / from_ratio) * to_ratio,
+        }
+        for db_row in db_rows
+    ]
+
+
 def _build_sum_stats(
     db_rows: list[Row],
     table_duration_seconds: float,
@@ -2154,6 +2378,28 @@ def _build_converted_stats(
     ]
 
 
+def _build_ratio_converted_stats(
+    db_rows: list[Row],
+    table_duration_seconds: float,
+    start_ts_idx: int,
+    row_mapping: tuple[tuple[str, int], ...],
+    from_ratio: float,
+    to_ratio: float,
+) -> list[StatisticsRow]:
+    """Build a list of statistics converted with unit ratios."""
+    return [
+        {
+            "start": (start_ts := db_row[start_ts_idx]),
+            "end": start_ts + table_duration_seconds,
+            **{
+                key: None if (v := db_row[idx]) is None else (v / from_ratio) * to_ratio  # type: ignore[typeddict-item]
+                for key, idx in row_mapping
+            },
+        }
+        for db_row in db_rows
+    ]
+
+
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
     stats: Sequence[Row[Any]],
@@ -2201,15 +2447,20 @@ def _sorted_statistics_to_dict(
     for meta_id, db_rows in stats_by_meta_id.items():
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
+        convert: Callable[[float], float] | None = None
+        ratios: tuple[float, float] | None = None
         if convert_units:
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
-            )
-        else:
-            convert = None
+            if display := _get_statistic_display_unit(unit, state_unit, units):
+                converter, display_unit = display
+                # Most units are converted with ratios which can be applied
+                # inline instead of calling the converter for each value
+                if (
+                    ratios := converter.get_conversion_ratios(unit, display_unit)
+                ) is None:
+                    convert = converter.converter_factory(unit, display_unit)
 
         build_args = (db_rows, table_duration_seconds, start_ts_idx)
         if sum_only:
@@ -2219,10 +2470,14 @@ def _sorted_statistics_to_dict(
             # For energy, we only need sum statistics, so we can optimize
             # this path to avoid the overhead of the more generic function.
             assert sum_idx is not None
-            if convert:
+            if ratios:
+                _stats = _build_sum_ratio_converted_stats(*build_args, sum_idx, *ratios)
+            elif convert:
                 _stats = _build_sum_converted_stats(*build_args, sum_idx, convert)
             else:
                 _stats = _build_sum_stats(*build_args, sum_idx)
+        elif ratios:
+            _stats = _build_ratio_converted_stats(*build_args, row_mapping, *ratios)
         elif convert:
             _stats = _build_converted_stats(*build_args, row_mapping, convert)
         else:
@@ -2370,6 +2625,8 @@ def _import_statistics_with_session(
     if table != StatisticsShortTerm:
         return True
 
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
+
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
     run_cache = get_short_term_statistics_run_cache(instance.hass)
@@ -2388,6 +2645,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_ACCUMULATOR)
+def get_hourly_statistics_accumulator(
+    hass: HomeAssistant,
+) -> HourlyStatisticsAccumulator:
+    """Get the hourly statistics accumulator."""
+    return HourlyStatisticsAccumulator()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2481,6 +2746,7 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2554,6 +2820,7 @@ def change_statistics_unit(
             )
             return
 
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
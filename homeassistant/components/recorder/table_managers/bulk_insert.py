@@ -0,0 +1,179 @@
+"""Support for writing states and events with bulk INSERT statements."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import Session
+
+from ..db_schema import Events, States
+
+# Columns copied verbatim from the pending ORM objects into the
+# parameter sets of the executemany INSERT statements.
+STATES_COLUMNS = (
+    "entity_id",
+    "state",
+    "last_updated_ts",
+    "last_changed_ts",
+    "last_reported_ts",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+    "origin_idx",
+)
+EVENTS_COLUMNS = (
+    "origin_idx",
+    "time_fired_ts",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+)
+
+
+def supports_bulk_insert(engine: Engine) -> bool:
+    """Return if the engine can return ids from a multi-row INSERT.
+
+    This is available on SQLite >= 3.35, MariaDB >= 10.5 and PostgreSQL.
+    """
+    return bool(engine.dialect.insert_executemany_returning)
+
+
+class BulkInsertManager:
+    """Buffer pending States and Events and write them with executemany.
+
+    The ORM unit of work has to insert States one row at a time because
+    of the self-referential old_state relationship. Instead the pending
+    rows are buffered here and written as one multi-VALUES INSERT per
+    generation, where a generation holds at most one state per entity.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk insert manager."""
+        self._states: list[States] = []
+        self._events: list[Events] = []
+        self.rows_written = 0
+        self.statements_executed = 0
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(self._states or self._events)
+
+    def add_state(self, state: States) -> None:
+        """Buffer a States row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states.append(state)
+
+    def add_event(self, event: Events) -> None:
+        """Buffer an Events row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._events.append(event)
+
+    def write_pending(self, session: Session) -> None:
+        """Write all buffered rows to the session.
+
+        The session is flushed first so the StatesMeta, StateAttributes,
+        EventTypes and EventData rows the buffered rows point to have
+        their ids assigned.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self.pending:
+            return
+        session.flush()
+        if self._events:
+            self._write_events(session)
+        if self._states:
+            self._write_states(session)
+        self._events.clear()
+        self._states.clear()
+
+    def _write_events(self, session: Session) -> None:
+        """Write the buffered events with a single executemany."""
+        rows: list[dict[str, Any]] = []
+        for dbevent in self._events:
+            row = {column: getattr(dbevent, column) for column in EVENTS_COLUMNS}
+            row["event_type_id"] = (
+                event_type_rel.event_type_id
+                if (event_type_rel := dbevent.event_type_rel)
+                else dbevent.event_type_id
+            )
+            row["data_id"] = (
+                event_data_rel.data_id
+                if (event_data_rel := dbevent.event_data_rel)
+                else dbevent.data_id
+            )
+            rows.append(row)
+        session.execute(insert(Events), rows, execution_options={"render_nulls": True})
+        self.rows_written += len(rows)
+        self.statements_executed += 1
+
+    def _write_states(self, session: Session) -> None:
+        """Write the buffered states one generation at a time.
+
+        A state can only link to its old state once the old state has
+        been assigned a state_id, and the ids returned by the database
+        are matched back to the rows by entity, so each entity appears
+        at most once per generation.
+        """
+        generation_by_entity: dict[tuple[int | None, str | None], int] = {}
+        generations: list[list[tuple[States, dict[str, Any]]]] = []
+        for dbstate in self._states:
+            row = {column: getattr(dbstate, column) for column in STATES_COLUMNS}
+            row["metadata_id"] = (
+                states_meta_rel.metadata_id
+                if (states_meta_rel := dbstate.states_meta_rel)
+                else dbstate.metadata_id
+            )
+            row["attributes_id"] = (
+                state_attributes.attributes_id
+                if (state_attributes := dbstate.state_attributes)
+                else dbstate.attributes_id
+            )
+            key = (row["metadata_id"], row["entity_id"])
+            generation = generation_by_entity.get(key, 0)
+            generation_by_entity[key] = generation + 1
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append((dbstate, row))
+
+        stmt = insert(States).returning(
+            States.state_id, States.metadata_id, States.entity_id
+        )
+        for generation_states in generations:
+            states_by_entity: dict[tuple[int | None, str | None], States] = {}
+            rows: list[dict[str, Any]] = []
+            for dbstate, row in generation_states:
+                row["old_state_id"] = (
+                    old_state.state_id
+                    if (old_state := dbstate.old_state)
+                    else dbstate.old_state_id
+                )
+                states_by_entity[(row["metadata_id"], row["entity_id"])] = dbstate
+                rows.append(row)
+            for inserted in session.execute(
+                stmt, rows, execution_options={"render_nulls": True}
+            ):
+                states_by_entity[
+                    (inserted.metadata_id, inserted.entity_id)
+                ].state_id = inserted.state_id
+            self.rows_written += len(rows)
+            self.statements_executed += 1
+
+    def reset(self) -> None:
+        """Drop all buffered rows after the session has been rolled back.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._states.clear()
+        self._events.clear()
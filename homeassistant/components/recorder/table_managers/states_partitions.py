@@ -0,0 +1,296 @@
+"""Support managing the time partitions of the states table."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import re
+from typing import TYPE_CHECKING
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.util import dt as dt_util
+from homeassistant.util.collection import chunked_or_all
+
+from ..const import SupportedDialect
+from ..db_schema import TABLE_STATES, Base
+
+if TYPE_CHECKING:
+    from ..core import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+PARTITION_INTERVAL_DAILY = "daily"
+PARTITION_INTERVAL_WEEKLY = "weekly"
+PARTITION_INTERVALS = {
+    PARTITION_INTERVAL_DAILY: timedelta(days=1),
+    PARTITION_INTERVAL_WEEKLY: timedelta(weeks=1),
+}
+
+# Number of partitions that are created ahead of the current one
+PARTITIONS_AHEAD = 3
+
+PARTITION_PREFIX = "states_p"
+# The states table as it was before it was partitioned
+LEGACY_PARTITION = "states_legacy"
+# Catches rows outside of all partitions, for example after a clock jump
+DEFAULT_PARTITION = "states_default"
+
+# The columns of the foreign keys of the states table which reference
+# itself; a partitioned table can not be referenced by state_id alone,
+# so these foreign keys are dropped when the table is partitioned
+SELF_REFERENCING_FOREIGN_KEY_COLUMNS = frozenset(
+    column
+    for constraint in Base.metadata.tables[TABLE_STATES].foreign_key_constraints
+    if constraint.referred_table.name == TABLE_STATES
+    for column in constraint.column_keys
+)
+
+_IS_PARTITIONED = text(
+    "SELECT 1 FROM pg_partitioned_table" " WHERE partrelid = to_regclass('states')"
+)
+_LIST_PARTITIONS = text(
+    "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)"
+    " FROM pg_inherits"
+    " JOIN pg_class child ON pg_inherits.inhrelid = child.oid"
+    " WHERE pg_inherits.inhparent = to_regclass('states')"
+)
+_PARTITION_BOUND = re.compile(r"FROM \((?P<start>[^)]+)\) TO \((?P<end>[^)]+)\)")
+
+
+@dataclass(frozen=True, slots=True)
+class StatesPartition:
+    """A range partition of the states table on last_updated_ts.
+
+    A start_ts of None is MINVALUE, an end_ts of None is the
+    default partition.
+    """
+
+    name: str
+    start_ts: float | None
+    end_ts: float | None
+
+
+def partition_start(moment: datetime, interval: str) -> datetime:
+    """Return the start of the partition the moment falls in.
+
+    Daily partitions start at UTC midnight, weekly partitions on Monday.
+    """
+    start = dt_util.as_utc(moment).replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == PARTITION_INTERVAL_WEEKLY:
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+def partition_name(start: datetime) -> str:
+    """Return the name of the partition starting at start."""
+    return f"{PARTITION_PREFIX}{dt_util.as_utc(start):%Y%m%d}"
+
+
+def plan_partitions(
+    covered_until: datetime, until: datetime, interval: str
+) -> list[StatesPartition]:
+    """Return the partitions needed to cover covered_until up to until.
+
+    The first partition ends on the first interval boundary after
+    covered_until so a change of interval never creates overlapping
+    partitions.
+    """
+    step = PARTITION_INTERVALS[interval]
+    partitions: list[StatesPartition] = []
+    start = covered_until
+    while start < until:
+        end = partition_start(start, interval) + step
+        partitions.append(
+            StatesPartition(partition_name(start), start.timestamp(), end.timestamp())
+        )
+        start = end
+    return partitions
+
+
+def _parse_bound(value: str) -> float | None:
+    """Parse a range bound returned by pg_get_expr."""
+    if value == "MINVALUE":
+        return None
+    return float(value.strip("'"))
+
+
+def _parse_partition(name: str, bound: str) -> StatesPartition:
+    """Parse a partition from its name and bound expression."""
+    if not (match := _PARTITION_BOUND.search(bound)):
+        return StatesPartition(name, None, None)
+    return StatesPartition(
+        name, _parse_bound(match["start"]), _parse_bound(match["end"])
+    )
+
+
+def states_table_is_partitioned(session: Session) -> bool:
+    """Return if the PostgreSQL states table is partitioned."""
+    return session.execute(_IS_PARTITIONED).first() is not None
+
+
+def _sort_partitions(partitions: Iterable[StatesPartition]) -> list[StatesPartition]:
+    """Sort partitions by their end with the default partition last."""
+    return sorted(
+        partitions,
+        key=lambda partition: (partition.end_ts is None, partition.end_ts or 0),
+    )
+
+
+class StatesPartitionManager:
+    """Manage the time partitions of the states table.
+
+    The states table is only partitioned on PostgreSQL after it has been
+    moved to the partitioned layout by migration.partition_states_table.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the states partition manager."""
+        self.recorder = recorder
+        self.active = False
+        self._partitions: list[StatesPartition] = []
+
+    @property
+    def partitions(self) -> list[StatesPartition]:
+        """Return the partitions of the states table."""
+        return self._partitions
+
+    def load(self, session: Session) -> None:
+        """Load the partitions of the states table.
+
+        Must run in the recorder thread.
+        """
+        if self.recorder.dialect_name != SupportedDialect.POSTGRESQL:
+            self.active = False
+            self._partitions = []
+            return
+        self.active = states_table_is_partitioned(session)
+        self._partitions = (
+            _sort_partitions(
+                _parse_partition(name, bound)
+                for name, bound in session.execute(_LIST_PARTITIONS)
+            )
+            if self.active
+            else []
+        )
+
+    def ensure_partitions(self, session: Session, now: datetime, interval: str) -> None:
+        """Create the partitions needed for the next PARTITIONS_AHEAD intervals.
+
+        Must run in the recorder thread.
+        """
+        if not self.active:
+            return
+        covered_until = max(
+            (
+                partition.end_ts
+                for partition in self._partitions
+                if partition.end_ts is not None
+            ),
+            default=None,
+        )
+        start = partition_start(now, interval)
+        if covered_until is not None:
+            start = max(start, dt_util.utc_from_timestamp(covered_until))
+        until = start + PARTITION_INTERVALS[interval] * (PARTITIONS_AHEAD + 1)
+        for partition in plan_partitions(start, until, interval):
+            try:
+                with session.begin_nested():
+                    session.execute(
+                        text(
+                            f"CREATE TABLE {partition.name} PARTITION OF states"
+                            f" FOR VALUES FROM ({partition.start_ts!r})"
+                            f" TO ({partition.end_ts!r})"
+                        )
+                    )
+            except SQLAlchemyError as err:
+                # This fails if rows for the range already ended up in the
+                # default partition; they stay there until they are purged
+                # while the later ranges still get their partitions
+                _LOGGER.warning(
+                    "Could not create states partition %s: %s", partition.name, err
+                )
+                continue
+            _LOGGER.debug("Created states partition %s", partition.name)
+            self._partitions = _sort_partitions([*self._partitions, partition])
+
+    def expired_partitions(self, purge_before: datetime) -> list[StatesPartition]:
+        """Return the partitions that only hold states older than purge_before."""
+        purge_before_ts = purge_before.timestamp()
+        return [
+            partition
+            for partition in self._partitions
+            if partition.end_ts is not None and partition.end_ts <= purge_before_ts
+        ]
+
+    def drop_partition(self, session: Session, partition: StatesPartition) -> set[int]:
+        """Drop a partition and return the attributes_ids it referenced.
+
+        Must run in the recorder thread.
+        """
+        attributes_ids = {
+            attributes_id
+            for (attributes_id,) in session.execute(
+                text(
+                    f"SELECT DISTINCT attributes_id FROM {partition.name}"  # noqa: S608
+                    " WHERE attributes_id IS NOT NULL"
+                )
+            )
+        }
+        self._evict_committed_state_ids(session, partition)
+        session.execute(text(f"DROP TABLE {partition.name}"))
+        self._partitions.remove(partition)
+        return attributes_ids
+
+    def select_default_partition_rows_to_purge(
+        self, session: Session, purge_before: datetime, max_bind_vars: int
+    ) -> tuple[set[int], set[int]]:
+        """Return the state_ids and attributes_ids to purge from the default partition.
+
+        Rows only end up in the default partition when no partition
+        existed for them, so they are purged row by row.
+        """
+        state_ids: set[int] = set()
+        attributes_ids: set[int] = set()
+        if not any(partition.end_ts is None for partition in self._partitions):
+            return state_ids, attributes_ids
+        for state_id, attributes_id in session.execute(
+            text(
+                f"SELECT state_id, attributes_id FROM {DEFAULT_PARTITION}"  # noqa: S608
+                " WHERE last_updated_ts < :purge_before LIMIT :limit"
+            ),
+            {"purge_before": purge_before.timestamp(), "limit": max_bind_vars},
+        ):
+            state_ids.add(state_id)
+            if attributes_id:
+                attributes_ids.add(attributes_id)
+        return state_ids, attributes_ids
+
+    def _evict_committed_state_ids(
+        self, session: Session, partition: StatesPartition
+    ) -> None:
+        """Evict the committed states that live in the partition from the cache.
+
+        The next state of the entity must not link its old_state_id
+        to a state that is about to be dropped.
+        """
+        stmt = text(
+            f"SELECT state_id FROM {partition.name}"  # noqa: S608
+            " WHERE state_id IN :state_ids"
+        ).bindparams(bindparam("state_ids", expanding=True))
+        states_manager = self.recorder.states_manager
+        for state_ids in chunked_or_all(
+            states_manager.committed_state_ids(), self.recorder.max_bind_vars
+        ):
+            states_manager.evict_purged_state_ids(
+                {
+                    state_id
+                    for (state_id,) in session.execute(
+                        stmt, {"state_ids": list(state_ids)}
+                    )
+                }
+            )
@@ -12,10 +12,11 @@ import threading
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
+from homeassistant.util import dt as dt_util
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, EVENT_RECORDER_PURGE_PROGRESS
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -117,9 +118,27 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+        progress = instance.purge_progress
+        if (
+            progress is None
+            or progress.finished is not None
+            or progress.purge_before != self.purge_before
         ):
+            progress = instance.purge_progress = purge.PurgeProgress(
+                self.purge_before, dt_util.utcnow()
+            )
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            progress.events_batch_size,
+            progress.states_batch_size,
+            progress,
+        )
+        progress.finish_pass(finished)
+        instance.hass.bus.fire(EVENT_RECORDER_PURGE_PROGRESS, progress.as_dict())
+        if finished:
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
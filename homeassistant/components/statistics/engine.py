@@ -0,0 +1,481 @@
+"""Incrementally maintained statistics over the samples of a statistics sensor."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from collections.abc import Callable
+from itertools import accumulate
+import math
+
+# Samples per chunk of the order statistics, chunks are split at twice the size
+_CHUNK_SIZE = 256
+
+
+class Tracker(ABC):
+    """A statistic kept up to date while samples enter and leave the window."""
+
+    __slots__ = ()
+
+    # Whether floating point errors accumulate when samples are removed
+    accumulates_error = False
+
+    @abstractmethod
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Account for the sample just appended to the window."""
+
+    @abstractmethod
+    def popleft(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Account for the oldest sample, which is about to be removed."""
+
+    @abstractmethod
+    def rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Calculate the statistic from all samples of the window."""
+
+
+class Moments(Tracker):
+    """Sum, mean and variance of the samples using Welford's algorithm."""
+
+    __slots__ = ("count", "m2", "mean", "total")
+
+    accumulates_error = True
+
+    def __init__(self) -> None:
+        """Initialize the moments of an empty window."""
+        self.count = 0
+        self.total: float = 0.0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Add the newest sample."""
+        value = states[-1]
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def popleft(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the oldest sample."""
+        value = states[0]
+        self.count -= 1
+        if not self.count:
+            self.total = self.mean = self.m2 = 0.0
+            return
+        self.total -= value
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+    def rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Calculate the moments from all samples."""
+        self.count = len(states)
+        self.total = math.fsum(states)
+        self.mean = self.total / self.count if self.count else 0.0
+        self.m2 = math.fsum((value - self.mean) ** 2 for value in states)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance."""
+        return self.m2 / (self.count - 1)
+
+
+class CircularSums(Tracker):
+    """Sums of the sine and cosine of samples which are angles in degrees."""
+
+    __slots__ = ("cos_sum", "sin_sum")
+
+    accumulates_error = True
+
+    def __init__(self) -> None:
+        """Initialize the sums of an empty window."""
+        self.sin_sum = 0.0
+        self.cos_sum = 0.0
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Add the newest sample."""
+        radians = math.radians(states[-1])
+        self.sin_sum += math.sin(radians)
+        self.cos_sum += math.cos(radians)
+
+    def popleft(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the oldest sample."""
+        radians = math.radians(states[0])
+        self.sin_sum -= math.sin(radians)
+        self.cos_sum -= math.cos(radians)
+
+    def rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Calculate the sums from all samples."""
+        self.sin_sum = math.fsum(math.sin(math.radians(value)) for value in states)
+        self.cos_sum = math.fsum(math.cos(math.radians(value)) for value in states)
+
+
+def _difference(previous: float, value: float) -> tuple[float, float]:
+    """Return the absolute and the non-negative difference of two samples."""
+    return abs(value - previous), value - previous if value >= previous else value
+
+
+class Differences(Tracker):
+    """Sums of the differences between consecutive samples."""
+
+    __slots__ = ("absolute", "nonnegative")
+
+    accumulates_error = True
+
+    def __init__(self) -> None:
+        """Initialize the sums of an empty window."""
+        self.absolute = 0.0
+        self.nonnegative = 0.0
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Add the difference to the newest sample."""
+        if len(states) > 1:
+            absolute, nonnegative = _difference(states[-2], states[-1])
+            self.absolute += absolute
+            self.nonnegative += nonnegative
+
+    def popleft(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the difference from the oldest sample."""
+        if len(states) > 1:
+            absolute, nonnegative = _difference(states[0], states[1])
+            self.absolute -= absolute
+            self.nonnegative -= nonnegative
+
+    def rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Calculate the sums from all samples."""
+        samples = list(states)
+        differences = [
+            _difference(previous, value)
+            for previous, value in zip(samples, samples[1:], strict=False)
+        ]
+        self.absolute = math.fsum(absolute for absolute, _ in differences)
+        self.nonnegative = math.fsum(nonnegative for _, nonnegative in differences)
+
+
+def _areas(
+    previous: float, value: float, previous_age: float, age: float
+) -> tuple[float, float]:
+    """Return the step and the linear area between two samples."""
+    duration = age - previous_age
+    return previous * duration, 0.5 * (value + previous) * duration
+
+
+class Areas(Tracker):
+    """Areas under the samples over time, with step and linear interpolation."""
+
+    __slots__ = ("linear", "step")
+
+    accumulates_error = True
+
+    def __init__(self) -> None:
+        """Initialize the areas of an empty window."""
+        self.step = 0.0
+        self.linear = 0.0
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Add the area up to the newest sample."""
+        if len(states) > 1:
+            step, linear = _areas(states[-2], states[-1], ages[-2], ages[-1])
+            self.step += step
+            self.linear += linear
+
+    def popleft(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the area from the oldest sample."""
+        if len(states) > 1:
+            step, linear = _areas(states[0], states[1], ages[0], ages[1])
+            self.step -= step
+            self.linear -= linear
+
+    def rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Calculate the areas from all samples."""
+        samples = list(zip(states, ages, strict=True))
+        areas = [
+            _areas(previous, value, previous_age, age)
+            for (previous, previous_age), (value, age) in zip(
+                samples, samples[1:], strict=False
+            )
+        ]
+        self.step = math.fsum(step for step, _ in areas)
+        self.linear = math.fsum(linear for _, linear in areas)
+
+
+class Extremes(Tracker):
+    """Minimum and maximum of the samples using monotonic queues.
+
+    Each queue holds the samples which can still become the extreme once
+    the samples before them are removed, as (sequence, value, age). Ties
+    keep the oldest sample in front.
+    """
+
+    __slots__ = ("_appended", "_maxima", "_minima", "_removed")
+
+    def __init__(self) -> None:
+        """Initialize the queues of an empty window."""
+        self._appended = 0
+        self._removed = 0
+        self._maxima: deque[tuple[int, bool | float, float]] = deque()
+        self._minima: deque[tuple[int, bool | float, float]] = deque()
+
+    def _push(self, value: bool | float, age: float) -> None:
+        """Add a sample to both queues."""
+        maxima = self._maxima
+        while maxima and maxima[-1][1] < value:
+            maxima.pop()
+        minima = self._minima
+        while minima and minima[-1][1] > value:
+            minima.pop()
+        sample = (self._appended, value, age)
+        maxima.append(sample)
+        minima.append(sample)
+        self._appended += 1
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Add the newest sample."""
+        self._push(states[-1], ages[-1])
+
+    def popleft(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the oldest sample."""
+        sequence = self._removed
+        self._removed += 1
+        if self._maxima and self._maxima[0][0] == sequence:
+            self._maxima.popleft()
+        if self._minima and self._minima[0][0] == sequence:
+            self._minima.popleft()
+
+    def rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Fill the queues from all samples."""
+        self._appended = self._removed = 0
+        self._maxima.clear()
+        self._minima.clear()
+        for value, age in zip(states, ages, strict=True):
+            self._push(value, age)
+
+    @property
+    def max(self) -> tuple[bool | float, float]:
+        """Return the oldest maximum sample as value and age."""
+        _, value, age = self._maxima[0]
+        return value, age
+
+    @property
+    def min(self) -> tuple[bool | float, float]:
+        """Return the oldest minimum sample as value and age."""
+        _, value, age = self._minima[0]
+        return value, age
+
+
+class OrderStatistics(Tracker):
+    """The samples in sorted order, for the median and percentiles.
+
+    The samples are kept in sorted chunks of bounded size with the
+    maximum of every chunk, so inserting or removing a sample bisects the
+    maximums and then moves at most two chunk sizes of references. The
+    running count of samples up to the end of every chunk is kept next to
+    them, so looking up a position bisects the counts.
+    """
+
+    __slots__ = ("_chunks", "_ends", "_maxes")
+
+    def __init__(self) -> None:
+        """Initialize the order statistics of an empty window."""
+        self._chunks: list[list[bool | float]] = []
+        self._maxes: list[bool | float] = []
+        self._ends: list[int] = []
+
+    def _count_from(self, index: int, delta: int) -> None:
+        """Add delta to the running counts from a chunk on."""
+        ends = self._ends
+        for position in range(index, len(ends)):
+            ends[position] += delta
+
+    def append(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Insert the newest sample."""
+        value = states[-1]
+        chunks = self._chunks
+        maxes = self._maxes
+        ends = self._ends
+        if not chunks:
+            chunks.append([value])
+            maxes.append(value)
+            ends.append(1)
+            return
+        index = bisect_left(maxes, value)
+        if index == len(chunks):
+            index -= 1
+            chunk = chunks[index]
+            chunk.append(value)
+            maxes[index] = value
+        else:
+            chunk = chunks[index]
+            insort(chunk, value)
+        self._count_from(index, 1)
+        if len(chunk) > 2 * _CHUNK_SIZE:
+            chunks[index : index + 1] = [chunk[:_CHUNK_SIZE], chunk[_CHUNK_SIZE:]]
+            maxes[index : index + 1] = [chunk[_CHUNK_SIZE - 1], chunk[-1]]
+            end = ends[index]
+            ends[index : index + 1] = [end - len(chunk) + _CHUNK_SIZE, end]
+
+    def popleft(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Remove the oldest sample."""
+        value = states[0]
+        chunks = self._chunks
+        maxes = self._maxes
+        # Clamped so a NaN sample, which does not sort, cannot raise
+        index = min(bisect_left(maxes, value), len(chunks) - 1)
+        chunk = chunks[index]
+        position = min(bisect_left(chunk, value), len(chunk) - 1)
+        del chunk[position]
+        self._count_from(index, -1)
+        if not chunk:
+            del chunks[index]
+            del maxes[index]
+            del self._ends[index]
+        elif position == len(chunk):
+            maxes[index] = chunk[-1]
+
+    def rebuild(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Sort all samples into chunks."""
+        ordered = sorted(states)
+        self._chunks = [
+            ordered[start : start + _CHUNK_SIZE]
+            for start in range(0, len(ordered), _CHUNK_SIZE)
+        ]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._ends = list(accumulate(len(chunk) for chunk in self._chunks))
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._ends[-1] if self._ends else 0
+
+    def __getitem__(self, index: int) -> bool | float:
+        """Return the sample at a position in sorted order."""
+        ends = self._ends
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        chunk_index = bisect_right(ends, index)
+        if chunk_index:
+            index -= ends[chunk_index - 1]
+        return self._chunks[chunk_index][index]
+
+    def median(self) -> float:
+        """Return the median of the samples."""
+        count = len(self)
+        middle = count // 2
+        if count % 2:
+            return self[middle]
+        return (self[middle - 1] + self[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of at least two samples.
+
+        Matches statistics.quantiles(n=100, method="exclusive").
+        """
+        count = len(self)
+        scaled = percentile * (count + 1)
+        index = min(max(scaled // 100, 1), count - 1)
+        delta = scaled - index * 100
+        return (self[index - 1] * (100 - delta) + self[index] * delta) / 100
+
+
+class StreamingStatistics:
+    """The samples of a statistics sensor and the statistics kept over them.
+
+    Trackers are created the first time a statistic is asked for and from
+    then on follow every sample added or removed, so a characteristic costs
+    O(n) once and little more than O(log n) per sample afterwards. Trackers
+    with running floating point sums are recalculated from the samples
+    after as many removals as there are samples, which keeps their error
+    bounded at an amortized constant cost.
+    """
+
+    def __init__(self, maxlen: int | None) -> None:
+        """Initialize an empty window holding at most maxlen samples."""
+        self._maxlen = maxlen
+        self.states: deque[bool | float] = deque()
+        self.ages: deque[float] = deque()
+        self._trackers: list[Tracker] = []
+        self._removals = 0
+        self._moments: Moments | None = None
+        self._circular: CircularSums | None = None
+        self._differences: Differences | None = None
+        self._areas: Areas | None = None
+        self._extremes: Extremes | None = None
+        self._order: OrderStatistics | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def append(self, value: bool | float, age: float) -> None:
+        """Add a sample, removing the oldest one when the window is full."""
+        if self._maxlen is not None and len(self.states) >= self._maxlen:
+            self.popleft()
+        self.states.append(value)
+        self.ages.append(age)
+        for tracker in self._trackers:
+            tracker.append(self.states, self.ages)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        states = self.states
+        ages = self.ages
+        for tracker in self._trackers:
+            tracker.popleft(states, ages)
+        states.popleft()
+        ages.popleft()
+        self._removals += 1
+        if self._removals > len(states):
+            self._removals = 0
+            for tracker in self._trackers:
+                if tracker.accumulates_error:
+                    tracker.rebuild(states, ages)
+
+    def _track[_TrackerT: Tracker](self, factory: Callable[[], _TrackerT]) -> _TrackerT:
+        """Create a tracker from the current samples and follow the window."""
+        tracker = factory()
+        tracker.rebuild(self.states, self.ages)
+        self._trackers.append(tracker)
+        return tracker
+
+    @property
+    def moments(self) -> Moments:
+        """Return the sum, mean and variance of the samples."""
+        if self._moments is None:
+            self._moments = self._track(Moments)
+        return self._moments
+
+    @property
+    def circular(self) -> CircularSums:
+        """Return the sums of the samples as angles."""
+        if self._circular is None:
+            self._circular = self._track(CircularSums)
+        return self._circular
+
+    @property
+    def differences(self) -> Differences:
+        """Return the sums of the differences between samples."""
+        if self._differences is None:
+            self._differences = self._track(Differences)
+        return self._differences
+
+    @property
+    def areas(self) -> Areas:
+        """Return the areas under the samples over time."""
+        if self._areas is None:
+            self._areas = self._track(Areas)
+        return self._areas
+
+    @property
+    def extremes(self) -> Extremes:
+        """Return the minimum and maximum of the samples."""
+        if self._extremes is None:
+            self._extremes = self._track(Extremes)
+        return self._extremes
+
+    @property
+    def order(self) -> OrderStatistics:
+        """Return the samples in sorted order."""
+        if self._order is None:
+            self._order = self._track(OrderStatistics)
+        return self._order
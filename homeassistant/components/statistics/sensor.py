@@ -2,20 +2,18 @@
 
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable, Mapping
 import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 import time
 from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import history
 from homeassistant.components.sensor import (
     DEVICE_CLASS_STATE_CLASSES,
     DEVICE_CLASS_UNITS,
@@ -59,6 +57,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .engine import StreamingStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,9 +100,8 @@ STAT_VARIANCE = "variance"
 
 def _callable_characteristic_fn(
     characteristic: str, binary: bool
-) -> Callable[[deque[bool | float], deque[float], int], float | int | datetime | None]:
+) -> Callable[[StreamingStatistics, int], float | int | datetime | None]:
     """Return the function callable of one characteristic function."""
-    Callable[[deque[bool | float], deque[datetime], int], datetime | int | float | None]
     if binary:
         return STATS_BINARY_SUPPORT[characteristic]
     return STATS_NUMERIC_SUPPORT[characteristic]
@@ -112,253 +110,206 @@ def _callable_characteristic_fn(
 # Statistics for numeric sensor
 
 
-def _stat_average_linear(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
-        return states[0]
-    if len(states) >= 2:
-        area: float = 0
-        for i in range(1, len(states)):
-            area += 0.5 * (states[i] + states[i - 1]) * (ages[i] - ages[i - 1])
-        age_range_seconds = ages[-1] - ages[0]
-        return area / age_range_seconds
+def _stat_average_linear(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) == 1:
+        return samples.states[0]
+    if len(samples) >= 2:
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
+        return samples.areas.linear / age_range_seconds
     return None
 
 
-def _stat_average_step(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
-        return states[0]
-    if len(states) >= 2:
-        area: float = 0
-        for i in range(1, len(states)):
-            area += states[i - 1] * (ages[i] - ages[i - 1])
-        age_range_seconds = ages[-1] - ages[0]
-        return area / age_range_seconds
+def _stat_average_step(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) == 1:
+        return samples.states[0]
+    if len(samples) >= 2:
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
+        return samples.areas.step / age_range_seconds
     return None
 
 
 def _stat_average_timeless(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    return _stat_mean(states, ages, percentile)
+    return _stat_mean(samples, percentile)
 
 
-def _stat_change(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return states[-1] - states[0]
+def _stat_change(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.states[-1] - samples.states[0]
     return None
 
 
-def _stat_change_sample(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 1:
-        return (states[-1] - states[0]) / (len(states) - 1)
+def _stat_change_sample(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 1:
+        return (samples.states[-1] - samples.states[0]) / (len(samples) - 1)
     return None
 
 
-def _stat_change_second(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 1:
-        age_range_seconds = ages[-1] - ages[0]
+def _stat_change_second(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 1:
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
         if age_range_seconds > 0:
-            return (states[-1] - states[0]) / age_range_seconds
+            return (samples.states[-1] - samples.states[0]) / age_range_seconds
     return None
 
 
-def _stat_count(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return len(states)
+def _stat_count(samples: StreamingStatistics, percentile: int) -> int | None:
+    return len(samples)
 
 
 def _stat_datetime_newest(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[-1])
+    if len(samples) > 0:
+        return dt_util.utc_from_timestamp(samples.ages[-1])
     return None
 
 
 def _stat_datetime_oldest(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[0])
+    if len(samples) > 0:
+        return dt_util.utc_from_timestamp(samples.ages[0])
     return None
 
 
 def _stat_datetime_value_max(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[states.index(max(states))])
+    if len(samples) > 0:
+        return dt_util.utc_from_timestamp(samples.extremes.max[1])
     return None
 
 
 def _stat_datetime_value_min(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> datetime | None:
-    if len(states) > 0:
-        return dt_util.utc_from_timestamp(ages[states.index(min(states))])
+    if len(samples) > 0:
+        return dt_util.utc_from_timestamp(samples.extremes.min[1])
     return None
 
 
 def _stat_distance_95_percent_of_values(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    if len(states) >= 1:
-        return (
-            2 * 1.96 * cast(float, _stat_standard_deviation(states, ages, percentile))
-        )
+    if len(samples) >= 1:
+        return 2 * 1.96 * cast(float, _stat_standard_deviation(samples, percentile))
     return None
 
 
 def _stat_distance_99_percent_of_values(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    if len(states) >= 1:
-        return (
-            2 * 2.58 * cast(float, _stat_standard_deviation(states, ages, percentile))
-        )
+    if len(samples) >= 1:
+        return 2 * 2.58 * cast(float, _stat_standard_deviation(samples, percentile))
     return None
 
 
 def _stat_distance_absolute(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    if len(states) > 0:
-        return max(states) - min(states)
+    if len(samples) > 0:
+        return samples.extremes.max[0] - samples.extremes.min[0]
     return None
 
 
-def _stat_mean(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return statistics.mean(states)
+def _stat_mean(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.moments.mean
     return None
 
 
-def _stat_mean_circular(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        sin_sum = sum(math.sin(math.radians(x)) for x in states)
-        cos_sum = sum(math.cos(math.radians(x)) for x in states)
-        return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+def _stat_mean_circular(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        circular = samples.circular
+        return (
+            math.degrees(math.atan2(circular.sin_sum, circular.cos_sum)) + 360
+        ) % 360
     return None
 
 
-def _stat_median(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return statistics.median(states)
+def _stat_median(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.order.median()
     return None
 
 
-def _stat_noisiness(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
+def _stat_noisiness(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return cast(float, _stat_sum_differences(states, ages, percentile)) / (
-            len(states) - 1
+    if len(samples) >= 2:
+        return cast(float, _stat_sum_differences(samples, percentile)) / (
+            len(samples) - 1
         )
     return None
 
 
-def _stat_percentile(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
-        return states[0]
-    if len(states) >= 2:
-        percentiles = statistics.quantiles(states, n=100, method="exclusive")
-        return percentiles[percentile - 1]
+def _stat_percentile(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) == 1:
+        return samples.states[0]
+    if len(samples) >= 2:
+        return samples.order.percentile(percentile)
     return None
 
 
 def _stat_standard_deviation(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    if len(states) == 1:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return statistics.stdev(states)
+    if len(samples) >= 2:
+        return math.sqrt(samples.moments.variance)
     return None
 
 
-def _stat_sum(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return sum(states)
+def _stat_sum(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.moments.total
     return None
 
 
 def _stat_sum_differences(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    if len(states) == 1:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return sum(
-            abs(j - i) for i, j in zip(list(states), list(states)[1:], strict=False)
-        )
+    if len(samples) >= 2:
+        return samples.differences.absolute
     return None
 
 
 def _stat_sum_differences_nonnegative(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    if len(states) == 1:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return sum(
-            (j - i if j >= i else j - 0)
-            for i, j in zip(list(states), list(states)[1:], strict=False)
-        )
+    if len(samples) >= 2:
+        return samples.differences.nonnegative
     return None
 
 
-def _stat_total(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    return _stat_sum(states, ages, percentile)
+def _stat_total(samples: StreamingStatistics, percentile: int) -> float | None:
+    return _stat_sum(samples, percentile)
 
 
-def _stat_value_max(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return max(states)
+def _stat_value_max(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.extremes.max[0]
     return None
 
 
-def _stat_value_min(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return min(states)
+def _stat_value_min(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return samples.extremes.min[0]
     return None
 
 
-def _stat_variance(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) == 1:
+def _stat_variance(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) == 1:
         return 0.0
-    if len(states) >= 2:
-        return statistics.variance(states)
+    if len(samples) >= 2:
+        return samples.moments.variance
     return None
 
 
@@ -366,61 +317,50 @@ def _stat_variance(
 
 
 def _stat_binary_average_step(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    if len(states) == 1:
-        return 100.0 * int(states[0] is True)
-    if len(states) >= 2:
-        on_seconds: float = 0
-        for i in range(1, len(states)):
-            if states[i - 1] is True:
-                on_seconds += ages[i] - ages[i - 1]
-        age_range_seconds = ages[-1] - ages[0]
+    if len(samples) == 1:
+        return 100.0 * int(samples.states[0] is True)
+    if len(samples) >= 2:
+        on_seconds = samples.areas.step
+        age_range_seconds = samples.ages[-1] - samples.ages[0]
         return 100 / age_range_seconds * on_seconds
     return None
 
 
 def _stat_binary_average_timeless(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> float | None:
-    return _stat_binary_mean(states, ages, percentile)
+    return _stat_binary_mean(samples, percentile)
 
 
-def _stat_binary_count(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return len(states)
+def _stat_binary_count(samples: StreamingStatistics, percentile: int) -> int | None:
+    return len(samples)
 
 
-def _stat_binary_count_on(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return states.count(True)
+def _stat_binary_count_on(samples: StreamingStatistics, percentile: int) -> int | None:
+    return round(samples.moments.total)
 
 
-def _stat_binary_count_off(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> int | None:
-    return states.count(False)
+def _stat_binary_count_off(samples: StreamingStatistics, percentile: int) -> int | None:
+    return len(samples) - round(samples.moments.total)
 
 
 def _stat_binary_datetime_newest(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> datetime | None:
-    return _stat_datetime_newest(states, ages, percentile)
+    return _stat_datetime_newest(samples, percentile)
 
 
 def _stat_binary_datetime_oldest(
-    states: deque[bool | float], ages: deque[float], percentile: int
+    samples: StreamingStatistics, percentile: int
 ) -> datetime | None:
-    return _stat_datetime_oldest(states, ages, percentile)
+    return _stat_datetime_oldest(samples, percentile)
 
 
-def _stat_binary_mean(
-    states: deque[bool | float], ages: deque[float], percentile: int
-) -> float | None:
-    if len(states) > 0:
-        return 100.0 / len(states) * states.count(True)
+def _stat_binary_mean(samples: StreamingStatistics, percentile: int) -> float | None:
+    if len(samples) > 0:
+        return 100.0 / len(samples) * round(samples.moments.total)
     return None
 
 
@@ -687,13 +627,11 @@ class StatisticsSensor(SensorEntity):
         self._percentile: int = percentile
         self._attr_available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=samples_max_buffer_size)
-        self.ages: deque[float] = deque(maxlen=samples_max_buffer_size)
+        self.samples = StreamingStatistics(samples_max_buffer_size)
         self._attr_extra_state_attributes = {}
 
         self._state_characteristic_fn: Callable[
-            [deque[bool | float], deque[float], int],
-            float | int | datetime | None,
+            [StreamingStatistics, int], float | int | datetime | None
         ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
 
         self._update_listener: CALLBACK_TYPE | None = None
@@ -795,12 +733,13 @@ class StatisticsSensor(SensorEntity):
             return
 
         try:
+            value: bool | float
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_reported_timestamp)
+                value = float(new_state.state)
+            self.samples.append(value, new_state.last_reported_timestamp)
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -922,8 +861,8 @@ class StatisticsSensor(SensorEntity):
                 self.samples_keep_last,
             )
 
-        while self.ages and (now_timestamp - self.ages[0]) > max_age:
-            if self.samples_keep_last and len(self.ages) == 1:
+        while self.samples.ages and (now_timestamp - self.samples.ages[0]) > max_age:
+            if self.samples_keep_last and len(self.samples.ages) == 1:
                 # Under normal circumstance this will not be executed, as a purge will not
                 # be scheduled for the last value if samples_keep_last is enabled.
                 # If this happens to be called outside normal scheduling logic or a
@@ -932,8 +871,12 @@ class StatisticsSensor(SensorEntity):
                     _LOGGER.debug(
                         "%s: preserving expired record with datetime %s(%s)",
                         self.entity_id,
-                        dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
-                        dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
+                        dt_util.as_local(
+                            dt_util.utc_from_timestamp(self.samples.ages[0])
+                        ),
+                        dt_util.utc_from_timestamp(
+                            now_timestamp - self.samples.ages[0]
+                        ),
                     )
                 break
 
@@ -941,17 +884,16 @@ class StatisticsSensor(SensorEntity):
                 _LOGGER.debug(
                     "%s: purging record with datetime %s(%s)",
                     self.entity_id,
-                    dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
-                    dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
+                    dt_util.as_local(dt_util.utc_from_timestamp(self.samples.ages[0])),
+                    dt_util.utc_from_timestamp(now_timestamp - self.samples.ages[0]),
                 )
-            self.ages.popleft()
-            self.states.popleft()
+            self.samples.popleft()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> float | None:
         """Find the timestamp when the next purge would occur."""
-        if self.ages and self._samples_max_age:
-            if self.samples_keep_last and len(self.ages) == 1:
+        if self.samples.ages and self._samples_max_age:
+            if self.samples_keep_last and len(self.samples.ages) == 1:
                 # Preserve the most recent entry if it is the only value.
                 # Do not schedule another purge. When a new source
                 # value is inserted it will restart purge cycle.
@@ -959,14 +901,19 @@ class StatisticsSensor(SensorEntity):
                     _LOGGER.debug(
                         "%s: skipping purge cycle for last record with datetime %s(%s)",
                         self.entity_id,
-                        dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
-                        (dt_util.utcnow() - dt_util.utc_from_timestamp(self.ages[0])),
+                        dt_util.as_local(
+                            dt_util.utc_from_timestamp(self.samples.ages[0])
+                        ),
+                        (
+                            dt_util.utcnow()
+                            - dt_util.utc_from_timestamp(self.samples.ages[0])
+                        ),
                     )
                 return None
             # Take the oldest entry from the ages list and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._samples_max_age
+            return self.samples.ages[0] + self._samples_max_age
         return None
 
     async def async_update(self) -> None:
@@ -1016,7 +963,7 @@ class StatisticsSensor(SensorEntity):
         if not self._preview_callback:
             self.async_write_ha_state()
 
-    def _fetch_states_from_database(self) -> list[State]:
+    async def _async_fetch_states_from_database(self) -> list[State]:
         """Fetch the states from the database."""
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
         lower_entity_id = self._source_entity_id.lower()
@@ -1034,14 +981,15 @@ class StatisticsSensor(SensorEntity):
         else:
             start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
             _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
+        states = await history.async_state_changes_during_period(
             self.hass,
             start_date,
             entity_id=lower_entity_id,
             descending=True,
             limit=self._samples_max_buffer_size,
             include_start_time_state=False,
-        ).get(lower_entity_id, [])
+        )
+        return states.get(lower_entity_id, [])
 
     async def _initialize_from_database(self) -> None:
         """Initialize the list of states from the database.
@@ -1053,9 +1001,7 @@ class StatisticsSensor(SensorEntity):
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
         """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
-        ):
+        if states := await self._async_fetch_states_from_database():
             for state in reversed(states):
                 self._add_state_to_queue(state)
                 self._calculate_state_attributes(state)
@@ -1073,13 +1019,13 @@ class StatisticsSensor(SensorEntity):
         """Calculate and update the various attributes."""
         if self._samples_max_buffer_size is not None:
             self._attr_extra_state_attributes[STAT_BUFFER_USAGE_RATIO] = round(
-                len(self.states) / self._samples_max_buffer_size, 2
+                len(self.samples) / self._samples_max_buffer_size, 2
             )
 
         if (max_age := self._samples_max_age) is not None:
-            if len(self.states) >= 1:
+            if len(self.samples) >= 1:
                 self._attr_extra_state_attributes[STAT_AGE_COVERAGE_RATIO] = round(
-                    (self.ages[-1] - self.ages[0]) / max_age,
+                    (self.samples.ages[-1] - self.samples.ages[0]) / max_age,
                     2,
                 )
             else:
@@ -1091,9 +1037,12 @@ class StatisticsSensor(SensorEntity):
         One of the _stat_*() functions is represented by self._state_characteristic_fn().
         """
 
-        value = self._state_characteristic_fn(self.states, self.ages, self._percentile)
+        value = self._state_characteristic_fn(self.samples, self._percentile)
         _LOGGER.debug(
-            "Updating value: states: %s, ages: %s => %s", self.states, self.ages, value
+            "Updating value: states: %s, ages: %s => %s",
+            self.samples.states,
+            self.samples.ages,
+            value,
         )
         if self._state_characteristic not in STATS_NOT_A_NUMBER:
             with contextlib.suppress(TypeError):
@@ -0,0 +1,98 @@
+"""Coalesce the events of a subscription before they are delivered."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any, Final
+
+import voluptuous as vol
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+
+# Window in seconds subscriptions can ask their events to be coalesced in
+COALESCE_WINDOW: Final = vol.All(vol.Coerce(float), vol.Range(min=0.05, max=1))
+
+
+def _merge_state_changed(
+    previous: Event[EventStateChangedData], event: Event[EventStateChangedData]
+) -> Event[EventStateChangedData]:
+    """Merge two state changes of an entity into one from the older old state."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {**event.data, "old_state": previous.data["old_state"]},
+        event.origin,
+        event.time_fired_timestamp,
+        event.context,
+    )
+
+
+def coalesce_state_changed_events(
+    events: list[Event[EventStateChangedData]],
+) -> list[Event[EventStateChangedData]]:
+    """Merge the state changes of each entity into a single state change."""
+    coalesced: dict[str, Event[EventStateChangedData]] = {}
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if (previous := coalesced.pop(entity_id, None)) is not None:
+            event = _merge_state_changed(previous, event)
+        coalesced[entity_id] = event
+    return list(coalesced.values())
+
+
+class EventCoalescer:
+    """Collect the events of a subscription and deliver them once per window.
+
+    State changes of the same entity within a window are merged into a
+    single state_changed event that carries the old state from before
+    the window and the newest state, so a slow client receives at most
+    one update per entity per window. Other events are delivered in order.
+    """
+
+    __slots__ = ("_deliver", "_hass", "_next_key", "_pending", "_timer", "_window")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float,
+        deliver: Callable[[list[Event[Any]]], None],
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._window = window
+        self._deliver = deliver
+        self._pending: dict[str | int, Event[Any]] = {}
+        self._next_key = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[Any]) -> None:
+        """Add an event to the current window."""
+        key: str | int
+        if event.event_type == EVENT_STATE_CHANGED:
+            key = event.data["entity_id"]
+            if (previous := self._pending.pop(key, None)) is not None:
+                event = _merge_state_changed(previous, event)
+        else:
+            key = self._next_key
+            self._next_key += 1
+        self._pending[key] = event
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(self._window, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Deliver the events of the window."""
+        self._timer = None
+        events = list(self._pending.values())
+        self._pending.clear()
+        self._deliver(events)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending events and stop the timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
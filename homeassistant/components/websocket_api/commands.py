@@ -14,6 +14,8 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
@@ -50,9 +52,11 @@ from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
     json_bytes,
+    json_dumps_sorted,
     json_fragment,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.storage import get_internal_store_manager
 from homeassistant.loader import (
     IntegrationNotFound,
     async_get_integration,
@@ -63,7 +67,9 @@ from homeassistant.setup import async_get_loaded_integrations, async_get_setup_t
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .coalesce import COALESCE_WINDOW, EventCoalescer
 from .connection import ActiveConnection
+from .fanout import async_get_entities_fanout
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -78,6 +84,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_call_service_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
@@ -89,6 +96,7 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_storage_write_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -96,6 +104,7 @@ def async_register_commands(
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_validate_config)
     async_reg(hass, handle_subscribe_entities)
+    async_reg(hass, handle_subscribe_entities_stats)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
 
@@ -135,11 +144,51 @@ def _forward_events_unconditional(
     send_message(messages.cached_event_message(message_id_as_bytes, event))
 
 
+@callback
+def _forward_events_coalesced(
+    coalescer: EventCoalescer, user: User | None, event: Event
+) -> None:
+    """Add events to the window of a coalesced subscription.
+
+    The permissions are only checked for state changed events.
+    """
+    if (
+        user is not None
+        and not user.is_admin
+        and not user.permissions.access_all_entities(POLICY_READ)
+        and not user.permissions.check_entity(event.data["entity_id"], POLICY_READ)
+    ):
+        return
+    coalescer.async_add(event)
+
+
+@callback
+def _send_coalesced_events(
+    connection: ActiveConnection,
+    message_id_as_bytes: bytes,
+    events: list[Event],
+) -> None:
+    """Send the events of a window.
+
+    Clients that support coalesce_messages receive them as a single
+    array frame, other clients as one message per event.
+    """
+    event_messages = [
+        messages.cached_event_message(message_id_as_bytes, event) for event in events
+    ]
+    if connection.can_coalesce and len(event_messages) > 1:
+        connection.send_message(b"".join((b"[", b",".join(event_messages), b"]")))
+        return
+    for message in event_messages:
+        connection.send_message(message)
+
+
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_events",
         vol.Optional("event_type", default=MATCH_ALL): str,
+        vol.Optional("coalesce_window"): COALESCE_WINDOW,
     }
 )
 def handle_subscribe_events(
@@ -158,21 +207,44 @@ def handle_subscribe_events(
 
     message_id_as_bytes = str(msg["id"]).encode()
 
-    if event_type == EVENT_STATE_CHANGED:
-        forward_events = partial(
-            _forward_events_check_permissions,
-            connection.send_message,
-            connection.user,
-            message_id_as_bytes,
+    if coalesce_window := msg.get("coalesce_window"):
+        coalescer = EventCoalescer(
+            hass,
+            coalesce_window,
+            partial(_send_coalesced_events, connection, message_id_as_bytes),
         )
-    else:
         forward_events = partial(
-            _forward_events_unconditional, connection.send_message, message_id_as_bytes
+            _forward_events_coalesced,
+            coalescer,
+            connection.user if event_type == EVENT_STATE_CHANGED else None,
         )
+    else:
+        coalescer = None
+        if event_type == EVENT_STATE_CHANGED:
+            forward_events = partial(
+                _forward_events_check_permissions,
+                connection.send_message,
+                connection.user,
+                message_id_as_bytes,
+            )
+        else:
+            forward_events = partial(
+                _forward_events_unconditional,
+                connection.send_message,
+                message_id_as_bytes,
+            )
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
+    unsub = hass.bus.async_listen(event_type, forward_events)
+    if coalescer:
+
+        @callback
+        def _async_unsubscribe() -> None:
+            unsub()
+            coalescer.async_cancel()
+
+        connection.subscriptions[msg["id"]] = _async_unsubscribe
+    else:
+        connection.subscriptions[msg["id"]] = unsub
 
     connection.send_result(msg["id"])
 
@@ -309,6 +381,28 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "call_service/stats"})
+def handle_call_service_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle call service stats command."""
+    connection.send_result(msg["id"], hass.services.async_call_latencies())
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "storage/write_stats"})
+def handle_storage_write_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle storage write stats command."""
+    connection.send_result(
+        msg["id"], get_internal_store_manager(hass).async_write_stats()
+    )
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
@@ -367,38 +461,12 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_window"): COALESCE_WINDOW,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,16 +483,18 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    filter_key = (
+        frozenset(entity_ids) if entity_ids else None,
+        json_dumps_sorted({key: msg.get(key) for key in (CONF_INCLUDE, CONF_EXCLUDE)}),
+    )
+    connection.subscriptions[msg_id] = async_get_entities_fanout(hass).async_subscribe(
+        filter_key,
+        entity_ids,
+        entity_filter,
+        connection.send_message,
+        connection.user,
+        message_id_as_bytes,
+        msg.get("coalesce_window"),
     )
     connection.send_result(msg_id)
 
@@ -467,6 +537,16 @@ def handle_subscribe_entities(
     )
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "subscribe_entities/stats"})
+def handle_subscribe_entities_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities stats command."""
+    connection.send_result(msg["id"], async_get_entities_fanout(hass).async_stats())
+
+
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
@@ -56,5 +56,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the subscribe_entities fanout
+DATA_ENTITIES_FANOUT: Final = f"{DOMAIN}.entities_fanout"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
@@ -0,0 +1,262 @@
+"""Fan out state changes to the subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.singleton import singleton
+
+from . import messages
+from .coalesce import EventCoalescer, coalesce_state_changed_events
+from .const import DATA_ENTITIES_FANOUT
+
+
+@dataclass(slots=True)
+class _Subscriber:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[bytes], None]
+    user: User
+    message_id_as_bytes: bytes
+    coalescer: EventCoalescer | None
+
+
+@dataclass(slots=True)
+class _FilterGroup:
+    """Subscriptions that share the same entity filter."""
+
+    entity_ids: set[str] | None
+    entity_filter: Callable[[str], bool] | None
+    subscribers: list[_Subscriber] = field(default_factory=list)
+
+
+class EntitiesFanout:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state batch listener serves all connections. Each event is
+    serialized once and the filters are evaluated once per group of
+    subscriptions with the same filter, leaving only the permission
+    check and the message id per connection. The state changes of a
+    batch, for example a coordinator update, are sent as one message.
+
+    State changes written through the state machine arrive as batches.
+    A state_changed event fired on the bus directly does not describe
+    the stored state and is forwarded by a bus listener instead.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fanout."""
+        self._hass = hass
+        self._groups: dict[Hashable, _FilterGroup] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self.events = 0
+        self.encodes = 0
+        self.messages_sent = 0
+
+    @callback
+    def async_subscribe(
+        self,
+        filter_key: Hashable,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        send_message: Callable[[bytes], None],
+        user: User,
+        message_id_as_bytes: bytes,
+        coalesce_window: float | None = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of the entities matching the filter.
+
+        Subscriptions with an equal filter_key must use equal filters. With
+        a coalesce_window the changes are delivered as one message per window.
+        """
+        if (group := self._groups.get(filter_key)) is None:
+            group = self._groups[filter_key] = _FilterGroup(entity_ids, entity_filter)
+        coalescer: EventCoalescer | None = None
+        if coalesce_window:
+
+            @callback
+            def _async_send_coalesced(events: list[Event[Any]]) -> None:
+                if message := messages.coalesced_state_diff_message(
+                    message_id_as_bytes, events
+                ):
+                    self.encodes += 1
+                    self.messages_sent += 1
+                    send_message(message)
+
+            coalescer = EventCoalescer(
+                self._hass, coalesce_window, _async_send_coalesced
+            )
+        subscriber = _Subscriber(send_message, user, message_id_as_bytes, coalescer)
+        group.subscribers.append(subscriber)
+        if not self._unsubs:
+            self._unsubs = [
+                self._hass.states.async_listen_batch(self._async_forward_batch),
+                self._hass.bus.async_listen(
+                    EVENT_STATE_CHANGED,
+                    self._async_forward,
+                    self._async_fired_on_bus,
+                ),
+            ]
+
+        @callback
+        def _async_unsubscribe() -> None:
+            if coalescer:
+                coalescer.async_cancel()
+            group.subscribers.remove(subscriber)
+            if not group.subscribers:
+                del self._groups[filter_key]
+            if not self._groups:
+                for unsub in self._unsubs:
+                    unsub()
+                self._unsubs = []
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_fired_on_bus(self, event_data: EventStateChangedData) -> bool:
+        """Return if a state_changed event was not written by the state machine.
+
+        The state machine stores the new state, or removes the entity,
+        before it fires the event, so the events it fires always carry
+        the state it holds.
+        """
+        return event_data["new_state"] is not self._hass.states.get(
+            event_data["entity_id"]
+        )
+
+    @callback
+    def _async_forward_batch(self, events: list[Event[EventStateChangedData]]) -> None:
+        """Forward a batch of state changes to the matching subscriptions."""
+        if len(events) == 1:
+            self._async_forward(events[0])
+            return
+        self.events += len(events)
+        events = coalesce_state_changed_events(events)
+        # Sending can close a connection and unsubscribe it
+        for group in list(self._groups.values()):
+            group_events = [
+                event
+                for event in events
+                if (not group.entity_ids or event.data["entity_id"] in group.entity_ids)
+                and (
+                    not group.entity_filter
+                    or group.entity_filter(event.data["entity_id"])
+                )
+            ]
+            if not group_events:
+                continue
+            partial_message: bytes | None = None
+            for subscriber in list(group.subscribers):
+                user = subscriber.user
+                subscriber_events = group_events
+                if not user.is_admin and not user.permissions.access_all_entities(
+                    POLICY_READ
+                ):
+                    subscriber_events = [
+                        event
+                        for event in group_events
+                        if user.permissions.check_entity(
+                            event.data["entity_id"], POLICY_READ
+                        )
+                    ]
+                if subscriber.coalescer:
+                    for event in subscriber_events:
+                        subscriber.coalescer.async_add(event)
+                    continue
+                if subscriber_events is group_events:
+                    if partial_message is None:
+                        partial_message = messages.partial_coalesced_state_diff_message(
+                            group_events
+                        )
+                        self.encodes += 1
+                    message = partial_message
+                else:
+                    message = messages.partial_coalesced_state_diff_message(
+                        subscriber_events
+                    )
+                    self.encodes += 1
+                if message is None:
+                    continue
+                subscriber.send_message(
+                    b"".join(
+                        (
+                            message[:-1],
+                            b',"id":',
+                            subscriber.message_id_as_bytes,
+                            b"}",
+                        )
+                    )
+                )
+                self.messages_sent += 1
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state changed event to the matching subscriptions."""
+        self.events += 1
+        entity_id = event.data["entity_id"]
+        partial_message: bytes | None = None
+        # Sending can close a connection and unsubscribe it
+        for group in list(self._groups.values()):
+            if (group.entity_ids and entity_id not in group.entity_ids) or (
+                group.entity_filter and not group.entity_filter(entity_id)
+            ):
+                continue
+            for subscriber in list(group.subscribers):
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                user = subscriber.user
+                if (
+                    not user.is_admin
+                    and not user.permissions.access_all_entities(POLICY_READ)
+                    and not user.permissions.check_entity(entity_id, POLICY_READ)
+                ):
+                    continue
+                if subscriber.coalescer:
+                    subscriber.coalescer.async_add(event)
+                    continue
+                if partial_message is None:
+                    partial_message = messages.partial_state_diff_message(event)[:-1]
+                    self.encodes += 1
+                subscriber.send_message(
+                    b"".join(
+                        (
+                            partial_message,
+                            b',"id":',
+                            subscriber.message_id_as_bytes,
+                            b"}",
+                        )
+                    )
+                )
+                self.messages_sent += 1
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the fanout statistics."""
+        return {
+            "subscriptions": sum(
+                len(group.subscribers) for group in self._groups.values()
+            ),
+            "filter_groups": len(self._groups),
+            "events": self.events,
+            "encodes": self.encodes,
+            "messages_sent": self.messages_sent,
+        }
+
+
+@callback
+@singleton(DATA_ENTITIES_FANOUT)
+def async_get_entities_fanout(hass: HomeAssistant) -> EntitiesFanout:
+    """Return the subscribe_entities fanout."""
+    return EntitiesFanout(hass)
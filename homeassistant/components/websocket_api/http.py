@@ -162,7 +162,17 @@ class WebSocketHandler:
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                # Array frames queued as one message are merged into the frame
+                coalesced_messages = b"".join(
+                    (
+                        b"[",
+                        b",".join(
+                            message[1:-1] if message[:1] == b"[" else message
+                            for message in message_queue
+                        ),
+                        b"]",
+                    )
+                )
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
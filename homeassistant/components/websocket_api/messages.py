@@ -141,38 +141,66 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
-def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
-) -> bytes:
-    """Return an event message.
-
-    Serialize to json once per message.
+def partial_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
+    """Serialize the state diff of a state_changed event to json.
 
-    Since we can have many clients connected that are
-    all getting many of the same events (mostly state changed)
-    we can avoid serializing the same data for each connection.
+    The message is constructed without the id which is appended
+    for each subscription.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
+    return (
+        _message_to_json_bytes_or_none(
+            {"type": "event", "event": _state_diff_event(event)}
         )
+        or INVALID_JSON_PARTIAL_MESSAGE
     )
 
 
-@lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
-    """Cache and serialize the event to json.
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes, events: list[Event[EventStateChangedData]]
+) -> bytes | None:
+    """Serialize the state diffs of coalesced state_changed events to json.
+
+    Returns None if the events cancel each other out.
+    """
+    if (partial_message := partial_coalesced_state_diff_message(events)) is None:
+        return None
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+
+def partial_coalesced_state_diff_message(
+    events: list[Event[EventStateChangedData]],
+) -> bytes | None:
+    """Serialize the state diffs of coalesced state_changed events to json.
+
+    The message is constructed without the id which is appended
+    for each subscription. Returns None if the events cancel each
+    other out.
     """
+    additions: dict[str, CompressedState] = {}
+    changes: dict[str, dict[str, dict[str, Any]]] = {}
+    removals: list[str] = []
+    for event in events:
+        if event.data["old_state"] is None and event.data["new_state"] is None:
+            # Added and removed within the window
+            continue
+        diff = _state_diff_event(event)
+        if ENTITY_EVENT_ADD in diff:
+            additions.update(diff[ENTITY_EVENT_ADD])  # type: ignore[arg-type]
+        elif ENTITY_EVENT_CHANGE in diff:
+            changes.update(diff[ENTITY_EVENT_CHANGE])  # type: ignore[arg-type]
+        else:
+            removals.extend(diff[ENTITY_EVENT_REMOVE])
+    batch: dict[str, Any] = {}
+    if additions:
+        batch[ENTITY_EVENT_ADD] = additions
+    if changes:
+        batch[ENTITY_EVENT_CHANGE] = changes
+    if removals:
+        batch[ENTITY_EVENT_REMOVE] = removals
+    if not batch:
+        return None
     return (
-        _message_to_json_bytes_or_none(
-            {"type": "event", "event": _state_diff_event(event)}
-        )
+        _message_to_json_bytes_or_none({"type": "event", "event": batch})
         or INVALID_JSON_PARTIAL_MESSAGE
     )
 
@@ -7,17 +7,20 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections import UserDict, defaultdict
 from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
+from contextlib import contextmanager
 from dataclasses import dataclass
 import datetime
 import enum
@@ -1459,7 +1462,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch_tables",
+        "_hass",
+        "_listeners",
+        "_match_all_dispatch_table",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1478,15 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The listeners to run for an event type, including the match all
+        # listeners, built when the event type is fired and dropped when
+        # its listeners change. Event types without listeners of their own
+        # share the match all table, so the tables only hold event types
+        # that are listened to.
+        self._dispatch_tables: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
+        self._match_all_dispatch_table: tuple[_FilterableJobType[Any], ...] = ()
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1548,14 +1567,11 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        if (dispatch_table := self._dispatch_tables.get(event_type)) is None:
+            dispatch_table = self._async_build_dispatch_table(event_type)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in dispatch_table:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1578,6 +1594,36 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def _async_build_dispatch_table(
+        self, event_type: EventType[_DataT] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build the dispatch table of an event type.
+
+        The table is immutable so listeners added or removed while an
+        event is being dispatched do not affect that event.
+        """
+        excluded = event_type in EVENTS_EXCLUDED_FROM_MATCH_ALL
+        if not (listeners := self._listeners.get(event_type)):
+            return () if excluded else self._match_all_dispatch_table
+        if excluded:
+            dispatch_table = tuple(listeners)
+        else:
+            dispatch_table = (*listeners, *self._match_all_listeners)
+        self._dispatch_tables[event_type] = dispatch_table
+        return dispatch_table
+
+    @callback
+    def _async_invalidate_dispatch_table(
+        self, event_type: EventType[_DataT] | str
+    ) -> None:
+        """Drop the dispatch tables the listeners of an event type are part of."""
+        if event_type == MATCH_ALL:
+            self._dispatch_tables.clear()
+            self._match_all_dispatch_table = tuple(self._match_all_listeners)
+        else:
+            self._dispatch_tables.pop(event_type, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1649,6 +1695,7 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_invalidate_dispatch_table(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1730,6 +1777,7 @@ class EventBus:
         """
         try:
             self._listeners[event_type].remove(filterable_job)
+            self._async_invalidate_dispatch_table(event_type)
 
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
@@ -1742,6 +1790,28 @@ class EventBus:
             )
 
 
+def _share_unchanged_attributes(
+    old_attributes: ReadOnlyDict[str, Any], attributes: Mapping[str, Any]
+) -> ReadOnlyDict[str, Any]:
+    """Return the attributes with the unchanged values of the previous state.
+
+    Entities build their attribute values again on every write. Reusing
+    the previous objects for equal values shares them by identity between
+    successive states, so while both states are alive the values are only
+    held once and comparing the attributes short-circuits on identity.
+    """
+    return ReadOnlyDict(
+        (
+            key,
+            old_value
+            if type(old_value := old_attributes.get(key, _SENTINEL)) is type(value)
+            and old_value == value
+            else value,
+        )
+        for key, value in attributes.items()
+    )
+
+
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
 
@@ -2066,7 +2136,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_batch",
+        "_batch_listeners",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2077,6 +2155,77 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._batch: list[Event[EventStateChangedData]] | None = None
+        self._batch_listeners: list[
+            Callable[[list[Event[EventStateChangedData]]], None]
+        ] = []
+
+    @callback
+    def async_listen_batch(
+        self, listener: Callable[[list[Event[EventStateChangedData]]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for state changes delivered in batches.
+
+        The state changes written within async_batch are delivered as a
+        single list when the batch ends, all other state changes as a list
+        of one right after their state_changed event was fired. The
+        listener must be a callback.
+
+        This method must be run in the event loop.
+        """
+        self._batch_listeners.append(listener)
+        return functools.partial(self._batch_listeners.remove, listener)
+
+    @contextmanager
+    def async_batch(self) -> Generator[None]:
+        """Write the states set within the context as one batch.
+
+        Every state is still set and fires its state_changed event right
+        away; batch listeners get all changes of the batch at once when the
+        context exits. Nested batches are part of the outermost batch.
+
+        This method must be run in the event loop.
+        """
+        if self._batch is not None:
+            yield
+            return
+        batch: list[Event[EventStateChangedData]] = []
+        self._batch = batch
+        try:
+            yield
+        finally:
+            self._batch = None
+            if batch:
+                self._async_deliver_batch(batch)
+
+    @callback
+    def _async_batch_state_changed(
+        self,
+        state_changed_data: EventStateChangedData,
+        context: Context | None,
+        timestamp: float | None,
+    ) -> None:
+        """Add a state change to the batch or deliver it right away."""
+        event = Event(
+            EVENT_STATE_CHANGED,
+            state_changed_data,
+            EventOrigin.local,
+            timestamp,
+            context,
+        )
+        if self._batch is not None:
+            self._batch.append(event)
+        else:
+            self._async_deliver_batch([event])
+
+    @callback
+    def _async_deliver_batch(self, batch: list[Event[EventStateChangedData]]) -> None:
+        """Deliver a batch of state changes to the batch listeners."""
+        for listener in self._batch_listeners.copy():
+            try:
+                listener(batch)
+            except Exception:
+                _LOGGER.exception("Error running state batch listener %s", listener)
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2189,6 +2338,9 @@ class StateMachine:
             return False
 
         old_state.expire()
+        if context is None:
+            # Share the context between the event and the batch listeners
+            context = Context()
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2199,6 +2351,8 @@ class StateMachine:
             state_changed_data,
             context=context,
         )
+        if self._batch_listeners:
+            self._async_batch_state_changed(state_changed_data, context, None)
         return True
 
     def set(
@@ -2318,6 +2472,9 @@ class StateMachine:
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
+            # Keep a single copy of the entity_id per entity instead of the
+            # one the caller created, for example by lowercasing it
+            entity_id = old_state.entity_id
 
         # It is much faster to convert a timestamp to a utc datetime object
         # than converting a utc datetime object to a timestamp since cpython
@@ -2357,6 +2514,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif old_state is not None and attributes:
+            attributes = _share_unchanged_attributes(old_state.attributes, attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2386,6 +2545,8 @@ class StateMachine:
             context=context,
             time_fired=timestamp,
         )
+        if self._batch_listeners:
+            self._async_batch_state_changed(state_changed_data, context, timestamp)
 
 
 class SupportsResponse(enum.StrEnum):
@@ -2401,10 +2562,45 @@ class SupportsResponse(enum.StrEnum):
     """The service is read-only and the caller must always ask for response data."""
 
 
+# Upper bounds in seconds of the buckets of the service call latency histograms
+SERVICE_CALL_LATENCY_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.5, 2.5, 10.0)
+
+
+class ServiceCallLatency:
+    """Histogram of how long the calls of a service take to execute."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        # The last bucket holds the calls slower than the largest bound
+        self.counts = [0] * (len(SERVICE_CALL_LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record the duration of a call."""
+        self.counts[bisect_left(SERVICE_CALL_LATENCY_BUCKETS, duration)] += 1
+        self.total += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with the buckets keyed by their upper bound."""
+        return {
+            "count": sum(self.counts),
+            "total": self.total,
+            "buckets": dict(
+                zip(
+                    (*map(str, SERVICE_CALL_LATENCY_BUCKETS), "inf"),
+                    self.counts,
+                    strict=True,
+                )
+            ),
+        }
+
+
 class Service:
     """Representation of a callable service."""
 
-    __slots__ = ["job", "schema", "domain", "service", "supports_response"]
+    __slots__ = ["job", "schema", "domain", "service", "supports_response", "latency"]
 
     def __init__(
         self,
@@ -2426,6 +2622,7 @@ class Service:
         self.job = HassJob(func, f"service {domain}.{service}", job_type=job_type)
         self.schema = schema
         self.supports_response = supports_response
+        self.latency = ServiceCallLatency()
 
 
 class ServiceCall:
@@ -2487,6 +2684,21 @@ class ServiceRegistry:
         """
         return {domain: service.copy() for domain, service in self._services.items()}
 
+    @callback
+    def async_call_latencies(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the latency histograms of the services that have been called.
+
+        This method must be run in the event loop.
+        """
+        latencies: dict[str, dict[str, dict[str, Any]]] = {}
+        for domain, services in self._services.items():
+            for service, handler in services.items():
+                if any(handler.latency.counts):
+                    latencies.setdefault(domain, {})[service] = (
+                        handler.latency.as_dict()
+                    )
+        return latencies
+
     @callback
     def async_services_for_domain(self, domain: str) -> dict[str, Service]:
         """Return dictionary with per domain a list of available services.
@@ -2829,19 +3041,23 @@ class ServiceRegistry:
         """Execute a service."""
         job = handler.job
         target = job.target
-        if job.job_type is HassJobType.Coroutinefunction:
-            if TYPE_CHECKING:
-                target = cast(
-                    Callable[..., Coroutine[Any, Any, ServiceResponse]], target
-                )
-            return await target(service_call)
-        if job.job_type is HassJobType.Callback:
+        start = monotonic()
+        try:
+            if job.job_type is HassJobType.Coroutinefunction:
+                if TYPE_CHECKING:
+                    target = cast(
+                        Callable[..., Coroutine[Any, Any, ServiceResponse]], target
+                    )
+                return await target(service_call)
+            if job.job_type is HassJobType.Callback:
+                if TYPE_CHECKING:
+                    target = cast(Callable[..., ServiceResponse], target)
+                return target(service_call)
             if TYPE_CHECKING:
                 target = cast(Callable[..., ServiceResponse], target)
-            return target(service_call)
-        if TYPE_CHECKING:
-            target = cast(Callable[..., ServiceResponse], target)
-        return await self._hass.async_add_executor_job(target, service_call)
+            return await self._hass.async_add_executor_job(target, service_call)
+        finally:
+            handler.latency.record(monotonic() - start)
 
 
 # These can be removed if no deprecated constant are in this module anymore
@@ -448,7 +448,7 @@ def format_mac(mac: str) -> str:
     return mac
 
 
-class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class DeviceRegistryStore(storage.JournaledStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
     async def _async_migrate_func(
@@ -1198,10 +1198,13 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of device registry to store in a file."""
         return {
-            "devices": [entry.as_storage_fragment for entry in self.devices.values()],
-            "deleted_devices": [
-                entry.as_storage_fragment for entry in self.deleted_devices.values()
-            ],
+            "devices": {
+                entry.id: entry.as_storage_fragment for entry in self.devices.values()
+            },
+            "deleted_devices": {
+                entry.id: entry.as_storage_fragment
+                for entry in self.deleted_devices.values()
+            },
         }
 
     @callback
@@ -983,6 +983,20 @@ class EntityPlatform:
         ):
             self.async_unsub_polling()
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity] | None = None) -> None:
+        """Write the states of entities of the platform as one batch.
+
+        Writes all entities of the platform if none are given.
+
+        This method must be run in the event loop.
+        """
+        with self.hass.states.async_batch():
+            for entity in (
+                list(self.entities.values()) if entities is None else entities
+            ):
+                entity.async_write_ha_state()
+
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> list[Entity]:
@@ -438,7 +438,7 @@ class DeletedRegistryEntry:
         )
 
 
-class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class EntityRegistryStore(storage.JournaledStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
     async def _async_migrate_func(  # noqa: C901
@@ -1368,10 +1368,13 @@ class EntityRegistry(BaseRegistry):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         return {
-            "entities": [entry.as_storage_fragment for entry in self.entities.values()],
-            "deleted_entities": [
-                entry.as_storage_fragment for entry in self.deleted_entities.values()
-            ],
+            "entities": {
+                entry.id: entry.as_storage_fragment for entry in self.entities.values()
+            },
+            "deleted_entities": {
+                entry.id: entry.as_storage_fragment
+                for entry in self.deleted_entities.values()
+            },
         }
 
     @callback
@@ -1971,7 +1971,7 @@ def _event_triggers_rerender(
     entity_id = event.data["entity_id"]
 
     if info.filter(entity_id):
-        return True
+        return not _read_fields_unchanged(event, info)
 
     if event.data["new_state"] is not None and event.data["old_state"] is not None:
         return False
@@ -1979,6 +1979,36 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _read_fields_unchanged(
+    event: Event[EventStateChangedData], info: RenderInfo
+) -> bool:
+    """Determine if none of the fields the template read of the entity changed.
+
+    Only applies to entities of which the template read nothing but the
+    state and attributes by name, as the template may read anything of
+    the states it iterates.
+    """
+    data = event.data
+    entity_id = data["entity_id"]
+    if (
+        (attributes := info.entity_attributes.get(entity_id)) is None
+        or info.all_states
+        or info.exception
+        or (old_state := data["old_state"]) is None
+        or (new_state := data["new_state"]) is None
+        or old_state.state != new_state.state
+        or (info.domains and old_state.domain in info.domains)
+    ):
+        return False
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    return all(
+        old_attributes.get(attribute) == new_attributes.get(attribute)
+        for attribute in attributes
+    )
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
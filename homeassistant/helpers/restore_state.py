@@ -17,9 +17,9 @@ from homeassistant.util.json import json_loads
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
-from .storage import Store
+from .storage import JournaledStore
 
 DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 
@@ -34,6 +34,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long between rewriting all states to refresh when they were last seen,
+# the other dumps only write the states which changed
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -95,6 +99,16 @@ class StoredState:
         )
 
 
+class RestoreStateStore(JournaledStore[list[dict[str, Any]]]):
+    """Store the restore state data."""
+
+    list_data = True
+
+    def _item_id(self, item: dict[str, Any]) -> str:
+        """Return the entity id of a stored state."""
+        return cast(str, item["state"]["entity_id"])
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -118,11 +132,16 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
+        self.store = RestoreStateStore(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Stored states of the previous run which were not requested yet
+        self._undecoded_states: dict[str, dict[str, Any]] = {}
+        # The state, extra data and storage fragment of each dumped state
+        self._fragments: dict[str, tuple[State, bytes | None, json_fragment]] = {}
+        self._next_compaction = dt_util.utcnow() + STATE_COMPACT_INTERVAL
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -143,16 +162,27 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
+        self.last_states = {}
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
-            self.last_states = {}
+            self._undecoded_states = {}
         else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+            # The states are only decoded once they are requested
+            self._undecoded_states = {
+                item["state"]["entity_id"]: item
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            _LOGGER.debug("Created cache with %s", list(self._undecoded_states))
+
+    @callback
+    def async_get_stored_state(self, entity_id: str) -> StoredState | None:
+        """Get the stored state of an entity from the previous run."""
+        if (stored_state := self.last_states.get(entity_id)) is None and (
+            item := self._undecoded_states.pop(entity_id, None)
+        ) is not None:
+            stored_state = self.last_states[entity_id] = StoredState.from_dict(item)
+        return stored_state
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -183,6 +213,17 @@ class RestoreStateData:
         ]
         expiration_time = now - STATE_EXPIRATION
 
+        # Old states of entities which are not in the current run are only
+        # decoded when they have not expired
+        for entity_id, item in list(self._undecoded_states.items()):
+            if entity_id in current_states_by_entity_id:
+                continue
+            last_seen = item["last_seen"]
+            if isinstance(last_seen, str):
+                last_seen = dt_util.parse_datetime(last_seen)
+            if last_seen is not None and last_seen >= expiration_time:
+                self.async_get_stored_state(entity_id)
+
         for entity_id, stored_state in self.last_states.items():
             # Don't save old states that have entities in the current run
             # They are either registered and already part of stored_states,
@@ -199,14 +240,63 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states which changed since the last dump are serialized
+        and appended to the journal of the store. All states are written
+        again every STATE_COMPACT_INTERVAL to refresh when they were last
+        seen, which is what their expiration is based on.
+        """
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        if now >= self._next_compaction:
+            self._fragments.clear()
+            self._next_compaction = now + STATE_COMPACT_INTERVAL
+
+        fragments: dict[str, tuple[State, bytes | None, json_fragment]] = {}
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            entity_id = state.entity_id
+            cached = self._fragments.get(entity_id)
+            try:
+                extra_data_json = (
+                    json_bytes(stored_state.extra_data.as_dict())
+                    if stored_state.extra_data
+                    else None
+                )
+                if (
+                    cached is None
+                    or cached[0] is not state
+                    or cached[1] != extra_data_json
+                ):
+                    cached = (
+                        state,
+                        extra_data_json,
+                        json_fragment(
+                            json_bytes(
+                                {
+                                    "state": state.json_fragment,
+                                    "extra_data": json_fragment(extra_data_json)
+                                    if extra_data_json
+                                    else None,
+                                    "last_seen": stored_state.last_seen,
+                                }
+                            )
+                        ),
+                    )
+            except (HomeAssistantError, TypeError) as exc:
+                _LOGGER.error("Error saving the state of %s", entity_id, exc_info=exc)
+                if cached is None:
+                    continue
+            fragments[entity_id] = cached
+        self._fragments = fragments
+
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+            await self.store.async_save_keyed(
+                {
+                    entity_id: fragment
+                    for entity_id, (_, _, fragment) in fragments.items()
+                }
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -264,6 +354,7 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
+            self._undecoded_states.pop(entity_id, None)
 
         del self.entities[entity_id]
 
@@ -292,7 +383,7 @@ class RestoreEntity(Entity):
                 "Cannot get last state. Entity not added to hass"
             )
             return None
-        return async_get(self.hass).last_states.get(self.entity_id)
+        return async_get(self.hass).async_get_stored_state(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
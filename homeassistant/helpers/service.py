@@ -11,6 +11,7 @@ import logging
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
@@ -32,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -65,6 +67,7 @@ from . import (
 )
 from .group import expand_entity_ids
 from .selector import TargetSelector
+from .singleton import singleton
 from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -80,6 +83,12 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_RESOLUTION_CACHE: HassKey[TargetResolutionCache] = HassKey(
+    "service_target_resolution_cache"
+)
+
+# Number of distinct device, area, floor and label targets to keep resolved
+TARGET_RESOLUTION_CACHE_SIZE = 256
 
 
 @cache
@@ -502,7 +511,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,6 +535,77 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    resolved = async_get_target_resolution_cache(hass).async_resolve(selector)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+class TargetResolutionCache:
+    """Cache the entities targeted through devices, areas, floors and labels.
+
+    Resolving these targets walks the entity, device, area, floor and label
+    registries. The resolved targets are kept until one of the registries
+    is updated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._resolved: LRU[
+            tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]],
+            SelectedEntities,
+        ] = LRU(TARGET_RESOLUTION_CACHE_SIZE)
+        for event_type in (
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_clear)
+
+    @callback
+    def _async_clear(self, event: Event[Any]) -> None:
+        """Drop the resolved targets when a registry is updated."""
+        self._resolved.clear()
+
+    @callback
+    def async_resolve(self, selector: ServiceTargetSelector) -> SelectedEntities:
+        """Return the targets selected by the device, area, floor and label ids.
+
+        The returned object is shared and must not be mutated.
+        """
+        key = (
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (resolved := self._resolved.get(key)) is None:
+            resolved = self._resolved[key] = _async_resolve_registry_targets(
+                self._hass, selector
+            )
+        return resolved
+
+
+@callback
+@singleton(TARGET_RESOLUTION_CACHE)
+def async_get_target_resolution_cache(hass: HomeAssistant) -> TargetResolutionCache:
+    """Return the service target resolution cache."""
+    return TargetResolutionCache(hass)
+
+
+def _async_resolve_registry_targets(  # noqa: C901
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the targets selected by device, area, floor and label ids."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
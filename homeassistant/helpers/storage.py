@@ -6,12 +6,15 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
-from typing import Any
+import time
+from typing import Any, cast
+import weakref
 
 from propcache import cached_property
 
@@ -34,12 +37,14 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
 MAX_LOAD_CONCURRENTLY = 6
+MAX_WRITE_CONCURRENTLY = 2
 
 STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
@@ -49,6 +54,9 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# A journal smaller than this is never compacted into the storage file
+MIN_JOURNAL_COMPACT_SIZE = 65536
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -90,6 +98,36 @@ async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
     return config
 
 
+@dataclass(slots=True)
+class StoreWriteStats:
+    """Statistics of the writes of a store."""
+
+    writes: int = 0
+    bytes: int = 0
+    last_bytes: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics with the durations in milliseconds."""
+        return {
+            "writes": self.writes,
+            "bytes": self.bytes,
+            "last_bytes": self.last_bytes,
+            "total_ms": round(self.total_duration * 1000, 1),
+            "max_ms": round(self.max_duration * 1000, 1),
+        }
+
+
+async def async_write_journal_snapshots(hass: HomeAssistant) -> None:
+    """Write the journals of the journaled stores into their storage files.
+
+    Backups, and older versions of Home Assistant restoring them, only
+    read the storage files.
+    """
+    await get_internal_store_manager(hass).async_write_snapshots()
+
+
 def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     """Get the store manager.
 
@@ -117,6 +155,9 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self._write_semaphore = asyncio.Semaphore(MAX_WRITE_CONCURRENTLY)
+        self._write_stats: dict[str, StoreWriteStats] = {}
+        self._journaled_stores: weakref.WeakSet[JournaledStore[Any]] = weakref.WeakSet()
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -174,6 +215,40 @@ class _StoreManager:
         _LOGGER.debug("%s: Cache miss, not preloaded", key)
         return None
 
+    @property
+    def write_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore that bounds the concurrent writes of all stores."""
+        return self._write_semaphore
+
+    @callback
+    def async_record_write(self, key: str, size: int, duration: float) -> None:
+        """Record a write of a store."""
+        if (stats := self._write_stats.get(key)) is None:
+            stats = self._write_stats[key] = StoreWriteStats()
+        stats.writes += 1
+        stats.bytes += size
+        stats.last_bytes = size
+        stats.total_duration += duration
+        stats.max_duration = max(stats.max_duration, duration)
+
+    @callback
+    def async_add_journaled_store(self, store: JournaledStore[Any]) -> None:
+        """Add a journaled store to write a snapshot of before backups."""
+        self._journaled_stores.add(store)
+
+    async def async_write_snapshots(self) -> None:
+        """Write a snapshot of every journaled store."""
+        await asyncio.gather(
+            *(store.async_write_snapshot() for store in list(self._journaled_stores))
+        )
+
+    @callback
+    def async_write_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the write statistics of each store."""
+        return {
+            key: stats.as_dict() for key, stats in sorted(self._write_stats.items())
+        }
+
     @callback
     def _async_schedule_cleanup(self, _event: Event) -> None:
         """Schedule the cleanup of old files."""
@@ -328,9 +403,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 return None
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_data)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -421,6 +494,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    def _load_data(self) -> json_util.JsonValueType:
+        """Load the data from disk."""
+        return json_util.load_json(self.path)
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -531,22 +608,29 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
                 # Another write already consumed the data
                 return
 
-            data = self._data
-            self._data = None
+            # The data is taken once a write slot is free, saves
+            # made while waiting for it are coalesced into this write
+            async with self._manager.write_semaphore:
+                self._async_cleanup_delay_listener()
+                self._async_cleanup_final_write_listener()
+                data = self._data
+                self._data = None
 
-            if self._read_only:
-                return
+                if self._read_only:
+                    return
 
-            try:
-                await self._async_write_data(self.path, data)
-            except (json_util.SerializationError, WriteError) as err:
-                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+                try:
+                    await self._async_write_data(self.path, data)
+                except (json_util.SerializationError, WriteError) as err:
+                    _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        start = time.monotonic()
+        size = await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        self._manager.async_record_write(self.key, size, time.monotonic() - start)
 
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
+    def _write_data(self, path: str, data: dict) -> int:
+        """Write the data and return the number of bytes written."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         if "data_func" in data:
@@ -560,6 +644,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        return os.path.getsize(path)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -573,3 +658,286 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+# The collection the items of a journaled store with list data are kept in
+_LIST_COLLECTION = ""
+
+
+def _data_from_collections(
+    list_data: bool, collections: dict[str, dict[str, Any]]
+) -> Any:
+    """Return the data of a journaled store from its keyed collections."""
+    if list_data:
+        return list(collections[_LIST_COLLECTION].values())
+    return {name: list(items.values()) for name, items in collections.items()}
+
+
+class _KeyedDataFunc:
+    """Data function of a journaled store.
+
+    Calling it returns the regular storage data, the store takes the
+    items keyed by their id from collections.
+    """
+
+    __slots__ = ("func", "list_data")
+
+    def __init__(self, list_data: bool, func: Callable[[], Any]) -> None:
+        """Initialize the data function."""
+        self.list_data = list_data
+        self.func = func
+
+    def collections(self) -> dict[str, dict[str, Any]]:
+        """Return the items keyed by their id per collection."""
+        keyed = self.func()
+        if self.list_data:
+            return {_LIST_COLLECTION: dict(keyed)}
+        return {name: dict(items) for name, items in keyed.items()}
+
+    def __call__(self) -> Any:
+        """Return the data to store."""
+        return _data_from_collections(self.list_data, self.collections())
+
+
+class JournaledStore[_T: Mapping[str, Any] | Sequence[Any]](Store[_T]):
+    """Store that appends the changes of a save to a journal.
+
+    The data of the store is a dict of collections, each a list of items
+    with an id, or a single list of such items when list_data is set. The
+    data function passed to async_delay_save, and the data passed to
+    async_save_keyed, have the items keyed by their id instead. Items are
+    compared by identity with the last written ones, so they should be
+    cached json fragments, and only the changed and removed items are
+    appended to the journal next to the storage file. The journal is
+    compacted into the storage file when it grows past half its size, on
+    the final write when Home Assistant stops, and before backups.
+
+    Versions of Home Assistant without journals only read the storage
+    file, so changes that are still in the journal are lost when one is
+    started on the storage directory, for example after a crash.
+    """
+
+    # The data is a list of items instead of a dict of collections
+    list_data = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        version: int,
+        key: str,
+        private: bool = False,
+        *,
+        atomic_writes: bool = False,
+        encoder: type[JSONEncoder] | None = None,
+        minor_version: int = 1,
+        read_only: bool = False,
+    ) -> None:
+        """Initialize the journaled store."""
+        super().__init__(
+            hass,
+            version,
+            key,
+            private,
+            atomic_writes=atomic_writes,
+            encoder=encoder,
+            minor_version=minor_version,
+            read_only=read_only,
+        )
+        # The collections as last written, None when the next write
+        # has to be a snapshot. Only used in the executor.
+        self._written: dict[str, dict[str, Any]] | None = None
+        self._journal_id: str | None = None
+        self._snapshot_size = 0
+        self._journal_size = 0
+        self._manager.async_add_journaled_store(self)
+
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}.journal"
+
+    def _item_id(self, item: dict[str, Any]) -> str:
+        """Return the id of an item of the storage file."""
+        return item["id"]
+
+    async def _async_load_data(self):
+        """Load the data, the preloaded storage file misses the journal."""
+        self._manager.async_invalidate(self.key)
+        return await super()._async_load_data()
+
+    def _load_data(self) -> json_util.JsonValueType:
+        """Load the storage file and replay the journal on it."""
+        data = super()._load_data()
+        self._written = None
+        if not isinstance(data, dict) or not (journal_id := data.get("journal")):
+            return data
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                lines = fdesc.readlines()
+        except FileNotFoundError:
+            return data
+
+        stored = data["data"]
+        collections: dict[str, dict[str, Any]] = {
+            name: {self._item_id(item): item for item in items}
+            for name, items in cast(
+                dict[str, list[Any]],
+                {_LIST_COLLECTION: stored} if self.list_data else stored,
+            ).items()
+        }
+        for line in lines:
+            try:
+                entry: dict[str, Any] = json_util.json_loads_object(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # An interrupted append, the next write is a snapshot
+                _LOGGER.warning("Ignoring incomplete journal entry of %s", self.key)
+                break
+            if entry["journal"] != journal_id:
+                # Left behind by a snapshot which was written after it
+                continue
+            for name, changes in entry["data"].items():
+                items = collections.setdefault(name, {})
+                for item_id, item in changes.items():
+                    if item is None:
+                        items.pop(item_id, None)
+                    else:
+                        items[item_id] = item
+        data["data"] = _data_from_collections(self.list_data, collections)
+        return data
+
+    @callback
+    def async_delay_save(
+        self,
+        data_func: Callable[[], Any],
+        delay: float = 0,
+    ) -> None:
+        """Save the keyed collections with an optional delay."""
+        super().async_delay_save(_KeyedDataFunc(self.list_data, data_func), delay)
+
+    async def async_save_keyed(self, data: Mapping[str, Any]) -> None:
+        """Save the keyed collections now."""
+        self._data = {
+            "version": self.version,
+            "minor_version": self.minor_version,
+            "key": self.key,
+            "data_func": _KeyedDataFunc(self.list_data, lambda: data),
+        }
+
+        if self.hass.state is CoreState.stopping:
+            self._async_ensure_final_write_listener()
+            return
+
+        await self._async_handle_write_data()
+
+    async def async_write_snapshot(self) -> None:
+        """Write the pending save and the journal into the storage file."""
+        if self._read_only:
+            return
+        if self._data is not None:
+            await self._async_handle_write_data()
+        async with self._write_lock:
+            self._manager.async_invalidate(self.key)
+            await self.hass.async_add_executor_job(self._compact_journal)
+
+    def _compact_journal(self) -> None:
+        """Write the storage file with the journal replayed on it."""
+        if not os.path.exists(self.journal_path):
+            return
+        data = self._load_data()
+        if not isinstance(data, dict) or "data" not in data:
+            return
+        _LOGGER.debug("Compacting the journal of %s", self.key)
+        self._write_snapshot(self.path, data, None)
+
+    def _write_data(self, path: str, data: dict) -> int:
+        """Append the changes to the journal or write a snapshot."""
+        data_func = data.get("data_func")
+        if not isinstance(data_func, _KeyedDataFunc):
+            return self._write_snapshot(path, data, None)
+
+        del data["data_func"]
+        collections = data_func.collections()
+        if (changes := self._changes(collections)) is None:
+            data["data"] = _data_from_collections(self.list_data, collections)
+            return self._write_snapshot(path, data, collections)
+        if not changes:
+            return 0
+
+        line = json_helper.json_bytes({"journal": self._journal_id, "data": changes})
+        if self._journal_size + len(line) + 1 > max(
+            self._snapshot_size // 2, MIN_JOURNAL_COMPACT_SIZE
+        ):
+            data["data"] = _data_from_collections(self.list_data, collections)
+            return self._write_snapshot(path, data, collections)
+
+        _LOGGER.debug("Appending changes for %s to %s", self.key, self.journal_path)
+        self._written = None
+        try:
+            with open(self.journal_path, "ab", opener=_private_opener) as fdesc:
+                if not self._private:
+                    os.fchmod(fdesc.fileno(), 0o644)
+                fdesc.write(line + b"\n")
+                if self._atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", self.journal_path)
+            raise WriteError(error) from error
+        self._journal_size += len(line) + 1
+        self._written = collections
+        return len(line) + 1
+
+    def _changes(
+        self, collections: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]] | None:
+        """Return the changed items, None if a snapshot has to be written."""
+        if (
+            (written := self._written) is None
+            or written.keys() != collections.keys()
+            # The final write leaves the storage file current without journal
+            or self.hass.state is CoreState.final_write
+        ):
+            return None
+        changes: dict[str, dict[str, Any]] = {}
+        for name, items in collections.items():
+            written_items = written[name]
+            changed: dict[str, Any] = {}
+            kept = 0
+            for item_id, item in items.items():
+                if (written_item := written_items.get(item_id)) is not None:
+                    kept += 1
+                if written_item is not item:
+                    changed[item_id] = item
+            if kept != len(written_items):
+                changed.update(dict.fromkeys(written_items.keys() - items.keys()))
+            if changed:
+                changes[name] = changed
+        return changes
+
+    def _write_snapshot(
+        self,
+        path: str,
+        data: dict,
+        collections: dict[str, dict[str, Any]] | None,
+    ) -> int:
+        """Write the storage file and start a new journal."""
+        self._written = None
+        data["journal"] = journal_id = ulid_now()
+        self._snapshot_size = super()._write_data(path, data)
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_id = journal_id
+        self._journal_size = 0
+        self._written = collections
+        return self._snapshot_size
+
+    async def async_remove(self) -> None:
+        """Remove all data."""
+        await super().async_remove()
+        with suppress(FileNotFoundError):
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _private_opener(path: str, flags: int) -> int:
+    """Open a file only the owner can access when it is created."""
+    return os.open(path, flags, 0o600)
@@ -12,8 +12,10 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -22,6 +24,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import monotonic
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -54,10 +57,12 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -94,6 +99,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -114,6 +120,11 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -397,6 +408,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
         "rate_limit",
         "has_time",
     )
@@ -415,6 +427,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The attributes read of entities of which only the state and
+        # attributes by name were read; None if anything else was read
+        self.entity_attributes: dict[str, set[str] | None] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -427,6 +442,7 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entity_attributes={self.entity_attributes}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -434,6 +450,23 @@ class RenderInfo:
             ">"
         )
 
+    def _collect_entity(self, entity_id: str) -> None:
+        """Collect an entity of which any field may have been read."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        self.entity_attributes[entity_id] = None
+
+    def _collect_entity_attribute(self, entity_id: str, attribute: str | None) -> None:
+        """Collect an entity of which the state and an attribute were read."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_attributes = self.entity_attributes
+        if entity_id not in entity_attributes:
+            entity_attributes[entity_id] = set()
+        if (
+            attribute is not None
+            and (attributes := entity_attributes[entity_id]) is not None
+        ):
+            attributes.add(attribute)
+
     def _filter_domains_and_entities(self, entity_id: str) -> bool:
         """Template should re-render if the entity state changes.
 
@@ -1053,7 +1086,16 @@ class TemplateStateBase(State):
 
     def _collect_state(self) -> None:
         if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info._collect_entity(self._entity_id)  # noqa: SLF001
+
+    def _collect_state_attribute(self, attribute: str | None) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info._collect_entity_attribute(self._entity_id, attribute)  # noqa: SLF001
+
+    def _attribute(self, name: str) -> Any:
+        """Return an attribute, only collecting the state and the attribute."""
+        self._collect_state_attribute(name)
+        return self._state.attributes.get(name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -1062,7 +1104,10 @@ class TemplateStateBase(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item == "state":
+                    render_info._collect_entity_attribute(self._entity_id, None)  # noqa: SLF001
+                else:
+                    render_info._collect_entity(self._entity_id)  # noqa: SLF001
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1081,7 +1126,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_attribute(None)
         return self._state.state
 
     @property
@@ -1205,7 +1250,7 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
-        entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect._collect_entity(entity_id)  # noqa: SLF001
 
 
 def _state_generator(
@@ -1886,7 +1931,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2818,6 +2863,110 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_template_bytecode(hass: HomeAssistant) -> None:
+    """Load the compiled code of the templates of the previous run."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+def _bytecode_version() -> str:
+    """Return the version the cached code was compiled for.
+
+    Code objects are only valid for the Python version that created
+    them and the generated code changes with Jinja and the template
+    environment.
+    """
+    return f"{sys.implementation.cache_tag}-{jinja2.__version__}-{__version__}"
+
+
+class TemplateBytecodeCache:
+    """Persist the compiled code of templates across restarts.
+
+    Entries are keyed by a hash of the template source and the variant of
+    the template environment that compiled it, as the limited and strict
+    environments generate different code for the same source. Only the
+    entries used during the current run are saved, so templates that were removed
+    from the configuration drop out of the cache.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+            atomic_writes=True,
+        )
+        self._loaded: dict[str, str] = {}
+        self._used: dict[str, str] = {}
+        self.compiled = 0
+        self.compile_time = 0.0
+        self.loaded = 0
+        self.load_time = 0.0
+
+    async def async_load(self) -> None:
+        """Load the cache and log the template timings once started."""
+        if (data := await self._store.async_load()) and data.get(
+            "version"
+        ) == _bytecode_version():
+            self._loaded = data["code"]
+        self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STARTED, self._async_log_timings
+        )
+
+    @callback
+    def _async_log_timings(self, _: Any) -> None:
+        """Log how much time templates took during startup."""
+        _LOGGER.debug(
+            "Templates compiled during startup: %s in %.3fs, "
+            "loaded from the bytecode cache: %s in %.3fs",
+            self.compiled,
+            self.compile_time,
+            self.loaded,
+            self.load_time,
+        )
+
+    @staticmethod
+    def _key(source: str, variant: str) -> str:
+        """Return the key of the template source in an environment variant."""
+        return hashlib.sha256(f"{variant}:{source}".encode()).hexdigest()
+
+    def get(self, source: str, variant: str) -> CodeType | None:
+        """Return the cached code for the template source."""
+        key = self._key(source, variant)
+        if (entry := self._used.get(key) or self._loaded.get(key)) is None:
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(entry))
+        except (ValueError, EOFError, TypeError):
+            return None
+        if not isinstance(code, CodeType):
+            return None
+        if key not in self._used:
+            self._used[key] = entry
+            self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+        return code
+
+    def set(self, source: str, variant: str, code: CodeType) -> None:
+        """Store the compiled code of the template source."""
+        key = self._key(source, variant)
+        self._used[key] = base64.b64encode(marshal.dumps(code)).decode()
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"version": _bytecode_version(), "code": dict(self._used)}
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2864,6 +3013,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._bytecode_variant = f"limited={bool(limited)},strict={bool(strict)}"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3219,7 +3369,24 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is None
+        ):
+            compiled = super().compile(source)
+        else:
+            start = monotonic()
+            variant = self._bytecode_variant
+            if (cached := bytecode_cache.get(source, variant)) is not None:
+                compiled = cached
+                bytecode_cache.loaded += 1
+                bytecode_cache.load_time += monotonic() - start
+            else:
+                compiled = super().compile(source)
+                bytecode_cache.compiled += 1
+                bytecode_cache.compile_time += monotonic() - start
+                bytecode_cache.set(source, variant, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -172,9 +172,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
     @callback
     def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        """Update all registered listeners.
+
+        The states the listeners write are delivered to state batch
+        listeners as one batch.
+        """
+        with self.hass.states.async_batch():
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -16,6 +16,7 @@ import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,8 +30,8 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
-from .core import HomeAssistant, callback
+from .const import Platform, __version__ as HA_VERSION
+from .core import CoreState, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -133,6 +134,12 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_INTEGRATION_INDEX: HassKey[IntegrationIndex | asyncio.Future[None]] = HassKey(
+    "integration_index"
+)
+INTEGRATION_INDEX_STORAGE_KEY = "core.integration_index"
+INTEGRATION_INDEX_STORAGE_VERSION = 1
+INTEGRATION_INDEX_SAVE_DELAY = 30
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -284,6 +291,131 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class IntegrationIndex:
+    """On-disk index of the manifests and top level files of integrations.
+
+    Resolving an integration reads its manifest.json and lists its
+    directory. The index keeps both keyed by the path of the manifest.
+    Built-in integrations are part of the installed release and are
+    trusted for the Home Assistant version the index was written with.
+    Custom integrations, and built-in integrations of development
+    versions, are checked against the modification times of their
+    manifest and directory.
+
+    Entries are added from the executor and never changed in place.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        # Deferred import to avoid circular imports
+        from .helpers.storage import Store  # pylint: disable=import-outside-toplevel
+
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            INTEGRATION_INDEX_STORAGE_VERSION,
+            INTEGRATION_INDEX_STORAGE_KEY,
+            atomic_writes=True,
+        )
+        self._hass = hass
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._trust_built_in = "dev" not in HA_VERSION
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    async def async_load(self) -> None:
+        """Load the index, dropping it when it was written by another version."""
+        if (data := await self._store.async_load()) and data.get(
+            "ha_version"
+        ) == HA_VERSION:
+            self._entries = data["integrations"]
+
+    @staticmethod
+    def stat(manifest_path: pathlib.Path) -> tuple[int, int] | None:
+        """Return the modification times of a manifest and its directory."""
+        try:
+            return (
+                manifest_path.stat().st_mtime_ns,
+                manifest_path.parent.stat().st_mtime_ns,
+            )
+        except OSError:
+            return None
+
+    def get(
+        self, manifest_path: pathlib.Path, built_in: bool
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files of an indexed integration."""
+        key = str(manifest_path)
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if not (built_in and self._trust_built_in) and (
+            self.stat(manifest_path) != tuple(entry["mtimes"])
+        ):
+            with self._lock:
+                self._entries.pop(key, None)
+                self._dirty = True
+            return None
+        files = entry["files"]
+        return cast(Manifest, dict(entry["manifest"])), (
+            None if files is None else set(files)
+        )
+
+    def add(
+        self,
+        manifest_path: pathlib.Path,
+        mtimes: tuple[int, int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Add an integration to the index."""
+        with self._lock:
+            self._entries[str(manifest_path)] = {
+                "mtimes": mtimes,
+                "manifest": dict(manifest),
+                "files": None if top_level_files is None else sorted(top_level_files),
+            }
+            self._dirty = True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the index if integrations were added or dropped."""
+        # Nothing can be written anymore once the final write has started
+        if self._dirty and self._hass.state not in (
+            CoreState.final_write,
+            CoreState.stopped,
+        ):
+            self._dirty = False
+            self._store.async_delay_save(
+                self._data_to_save, INTEGRATION_INDEX_SAVE_DELAY
+            )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        with self._lock:
+            return {"ha_version": HA_VERSION, "integrations": dict(self._entries)}
+
+
+async def _async_get_integration_index(hass: HomeAssistant) -> IntegrationIndex:
+    """Return the integration index, loading it on first use."""
+    index_or_future = hass.data.get(DATA_INTEGRATION_INDEX)
+
+    if index_or_future is None:
+        future = hass.data[DATA_INTEGRATION_INDEX] = hass.loop.create_future()
+        index = IntegrationIndex(hass)
+        try:
+            await index.async_load()
+        finally:
+            hass.data[DATA_INTEGRATION_INDEX] = index
+            future.set_result(None)
+        return index
+
+    if isinstance(index_or_future, asyncio.Future):
+        await index_or_future
+        return cast(IntegrationIndex, hass.data[DATA_INTEGRATION_INDEX])
+
+    return index_or_future
+
+
 def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
     """Return list of custom integrations."""
     if hass.config.recovery_mode or hass.config.safe_mode:
@@ -294,12 +426,10 @@ def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
     except ImportError:
         return {}
 
-    dirs = [
-        entry
-        for path in custom_components.__path__
-        for entry in pathlib.Path(path).iterdir()
-        if entry.is_dir()
-    ]
+    dirs: list[os.DirEntry[str]] = []
+    for path in custom_components.__path__:
+        with os.scandir(path) as entries:
+            dirs.extend(entry for entry in entries if entry.is_dir())
 
     integrations = _resolve_integrations_from_root(
         hass,
@@ -322,7 +452,9 @@ async def async_get_custom_components(
     if comps_or_future is None:
         future = hass.data[DATA_CUSTOM_COMPONENTS] = hass.loop.create_future()
 
+        index = await _async_get_integration_index(hass)
         comps = await hass.async_add_executor_job(_get_custom_components, hass)
+        index.async_schedule_save()
 
         hass.data[DATA_CUSTOM_COMPONENTS] = comps
         future.set_result(comps)
@@ -653,30 +785,45 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        index = hass.data.get(DATA_INTEGRATION_INDEX)
+        if not isinstance(index, IntegrationIndex):
+            index = None
+        built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = manifest_path.parent
 
-            if not manifest_path.is_file():
-                continue
+            if index and (indexed := index.get(manifest_path, built_in)):
+                manifest, top_level_files = indexed
+            else:
+                mtimes: tuple[int, int] | None = None
+                if index:
+                    if (mtimes := index.stat(manifest_path)) is None:
+                        continue
+                elif not manifest_path.is_file():
+                    continue
+
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if index and mtimes:
+                    index.add(manifest_path, mtimes, manifest, top_level_files)
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -1415,9 +1562,11 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        index = await _async_get_integration_index(hass)
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, needed
         )
+        index.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
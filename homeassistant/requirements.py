@@ -79,6 +79,12 @@ def _async_get_manager(hass: HomeAssistant) -> RequirementsManager:
     return RequirementsManager(hass)
 
 
+@callback
+def async_requirements_installed(hass: HomeAssistant, requirements: list[str]) -> bool:
+    """Return if the requirements are known to be installed."""
+    return _async_get_manager(hass).async_requirements_installed(requirements)
+
+
 @callback
 def async_clear_install_history(hass: HomeAssistant) -> None:
     """Forget the install history."""
@@ -268,6 +274,11 @@ class RequirementsManager:
             if missing := self._find_missing_requirements(requirements):
                 await self._async_process_requirements(name, missing)
 
+    @callback
+    def async_requirements_installed(self, requirements: list[str]) -> bool:
+        """Return if the requirements are known to be installed."""
+        return not self._find_missing_requirements(requirements)
+
     def _find_missing_requirements(self, requirements: list[str]) -> list[str]:
         """Find requirements that are missing in the cache."""
         return [req for req in requirements if req not in self.is_installed_cache]
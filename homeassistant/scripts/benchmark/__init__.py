@@ -6,6 +6,7 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from functools import partial
 import logging
 from timeit import default_timer as timer
 
@@ -116,6 +117,62 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_listener_count(hass):
+    """Fire state changed events with a growing number of listeners.
+
+    Every listener tracks another entity so each event runs a single
+    listener. Listeners tracking entities by key are looked up in a dict,
+    listeners with an event filter are all asked whether to run.
+    """
+    count = 0
+    events_to_fire = 10**5
+    event_data = {"entity_id": "light.kitchen_0", "old_state": None}
+    total = 0.0
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    @core.callback
+    def event_filter(entity_id, event_data):
+        """Filter event."""
+        return event_data["entity_id"] == entity_id
+
+    def listen_keyed(entity_id):
+        return async_track_state_change_event(hass, entity_id, listener)
+
+    def listen_filtered(entity_id):
+        return hass.bus.async_listen(
+            EVENT_STATE_CHANGED, listener, partial(event_filter, entity_id)
+        )
+
+    for kind, listen in (("keyed", listen_keyed), ("filtered", listen_filtered)):
+        unsubs = []
+        for listener_count in (1, 10, 100, 1000):
+            unsubs.extend(
+                listen(f"light.kitchen_{idx}")
+                for idx in range(len(unsubs), listener_count)
+            )
+            count = 0
+
+            start = timer()
+            for _ in range(events_to_fire):
+                hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+            await hass.async_block_till_done()
+            runtime = timer() - start
+
+            assert count == events_to_fire
+            print(f"{listener_count} {kind} listeners: {runtime}s")
+            total += runtime
+        for unsub in unsubs:
+            unsub()
+
+    return total
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +365,214 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Write 20k state rows for 4000 entities at several commit intervals.
+
+    Compares the ORM unit of work with the recorder bulk insert mode
+    and prints the rows/sec for each commit interval.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.table_managers.bulk_insert import (
+        BulkInsertManager,
+    )
+
+    entity_count = 4000
+    rows_to_write = 20000
+    # Rate of state_changed events during a burst, used to turn the
+    # commit interval into the number of rows written per commit
+    events_per_second = 2000
+
+    def _write(commit_interval: int, bulk_insert: bool) -> float:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        rows_per_commit = max(1, commit_interval * events_per_second)
+        with Session(engine, expire_on_commit=False) as session:
+            attributes = StateAttributes(shared_attrs="{}", hash=0)
+            session.add(attributes)
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+                for idx in range(entity_count)
+            ]
+            session.add_all(states_meta)
+            session.commit()
+            bulk_insert_manager = BulkInsertManager()
+            pending: dict[int, States] = {}
+            committed: dict[int, int] = {}
+            start = timer()
+            for row in range(rows_to_write):
+                idx = row % entity_count
+                dbstate = States(
+                    state=str(row),
+                    last_updated_ts=float(row),
+                    metadata_id=states_meta[idx].metadata_id,
+                    attributes_id=attributes.attributes_id,
+                    origin_idx=0,
+                )
+                if old_state := pending.pop(idx, None):
+                    dbstate.old_state = old_state
+                else:
+                    dbstate.old_state_id = committed.pop(idx, None)
+                pending[idx] = dbstate
+                if bulk_insert:
+                    bulk_insert_manager.add_state(dbstate)
+                else:
+                    session.add(dbstate)
+                if (row + 1) % rows_per_commit == 0 or row + 1 == rows_to_write:
+                    bulk_insert_manager.write_pending(session)
+                    session.commit()
+                    committed.update(
+                        (pending_idx, pending_state.state_id)
+                        for pending_idx, pending_state in pending.items()
+                    )
+                    pending.clear()
+            return timer() - start
+
+    start = timer()
+    for commit_interval in (0, 1, 5):
+        for bulk_insert in (False, True):
+            runtime = await hass.async_add_executor_job(
+                _write, commit_interval, bulk_insert
+            )
+            print(
+                f"commit_interval={commit_interval} bulk_insert={bulk_insert}: "
+                f"{rows_to_write / runtime:.0f} rows/sec"
+            )
+    return timer() - start
+
+
+@benchmark
+async def state_memory(hass):
+    """Report the memory held per entity after a day of state changes.
+
+    4000 entities write their state every 5 minutes for a simulated day
+    with attributes built anew on every write, as entities do. The memory
+    is reported for the state machine alone and with the previous state
+    of every entity kept alive, as consumers of state_changed events do
+    while they process them.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import tracemalloc
+
+    entity_count = 4000
+    writes_per_entity = 24 * 12
+    entity_ids = [
+        f"light.benchmark_{idx}" if idx % 4 == 0 else f"sensor.benchmark_{idx}"
+        for idx in range(entity_count)
+    ]
+
+    def attributes(idx, write):
+        if idx % 4 == 0:
+            return {
+                "supported_color_modes": ["color_temp", "hs"],
+                "effect_list": ["colorloop", "random", "none"],
+                "brightness": write % 255,
+                "color_mode": "hs",
+                "friendly_name": f"Benchmark light {idx}",
+                "supported_features": 44,
+            }
+        return {
+            "unit_of_measurement": "°C",
+            "device_class": "temperature",
+            "state_class": "measurement",
+            "friendly_name": f"Benchmark sensor {idx}",
+        }
+
+    previous_states = {}
+
+    @core.callback
+    def keep_previous_state(event):
+        previous_states[event.data["entity_id"]] = event.data["old_state"]
+
+    start = timer()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    async_set = hass.states.async_set
+    for write in range(writes_per_entity):
+        if write == writes_per_entity - 1:
+            hass.bus.async_listen(EVENT_STATE_CHANGED, keep_previous_state)
+        for idx, entity_id in enumerate(entity_ids):
+            async_set(entity_id.upper(), str(write % 7), attributes(idx, write // 6))
+        if write == writes_per_entity - 2:
+            state_machine = tracemalloc.get_traced_memory()[0] - before
+    await hass.async_block_till_done()
+    with_previous_states = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"State machine: {state_machine / entity_count:.0f} bytes per entity")
+    print(
+        "With previous states: "
+        f"{with_previous_states / entity_count:.0f} bytes per entity"
+    )
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor(hass):
+    """Update statistics over a window of 10k samples a thousand times.
+
+    Compares calculating the characteristics from all samples on every
+    update with the incremental statistics of the statistics sensor.
+    """
+    # pylint: disable=import-outside-toplevel
+    from collections import deque
+    import math
+    import random
+    import statistics
+
+    from homeassistant.components.statistics.engine import StreamingStatistics
+
+    window = 10**4
+    updates = 10**3
+    rng = random.Random(0)
+    values = [rng.uniform(-20, 40) for _ in range(window + updates)]
+
+    characteristics = {
+        "mean": (statistics.mean, lambda samples: samples.moments.mean),
+        "standard_deviation": (
+            statistics.stdev,
+            lambda samples: math.sqrt(samples.moments.variance),
+        ),
+        "median": (statistics.median, lambda samples: samples.order.median()),
+        "percentile": (
+            lambda states: statistics.quantiles(states, n=100, method="exclusive")[94],
+            lambda samples: samples.order.percentile(95),
+        ),
+        "value_max": (max, lambda samples: samples.extremes.max[0]),
+    }
+
+    total = 0.0
+    for name, (recalculate, incremental) in characteristics.items():
+        states = deque(values[:window], maxlen=window)
+        start = timer()
+        for value in values[window:]:
+            states.append(value)
+            recalculate(states)
+        recalculated = timer() - start
+
+        samples = StreamingStatistics(window)
+        for age, value in enumerate(values[:window]):
+            samples.append(value, float(age))
+        incremental(samples)
+        start = timer()
+        for age, value in enumerate(values[window:], window):
+            samples.append(value, float(age))
+            incremental(samples)
+        streamed = timer() - start
+
+        print(
+            f"{name}: recalculated {recalculated / updates * 10**6:.1f}µs, "
+            f"incremental {streamed / updates * 10**6:.1f}µs per update"
+        )
+        total += recalculated + streamed
+    return total
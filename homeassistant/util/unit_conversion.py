@@ -138,6 +138,19 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return from_ratio / to_ratio
 
+    @classmethod
+    @lru_cache
+    def get_conversion_ratios(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> tuple[float, float] | None:
+        """Get the ratios a value is divided and multiplied with to convert it.
+
+        Converting many values with the ratios gives the same results as the
+        function from converter_factory without calling it for each value.
+        Returns None if the units are not converted with ratios.
+        """
+        return cls._get_from_to_ratio(from_unit, to_unit)
+
 
 class DataRateConverter(BaseUnitConverter):
     """Utility to convert data rate values."""
@@ -449,6 +462,16 @@ class SpeedConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def get_conversion_ratios(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> tuple[float, float] | None:
+        """Get the ratios a speed is divided and multiplied with to convert it."""
+        if UnitOfSpeed.BEAUFORT in (from_unit, to_unit):
+            return None
+        return super().get_conversion_ratios(from_unit, to_unit)
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
@@ -528,6 +551,17 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def get_conversion_ratios(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> tuple[float, float] | None:
+        """Get the ratios a temperature is divided and multiplied with to convert it.
+
+        Temperatures are not converted with ratios, use converter_factory.
+        """
+        return None
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
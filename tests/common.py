@@ -198,6 +198,10 @@ class StoreWithoutWriteLoad[_T: (Mapping[str, Any] | Sequence[Any])](storage.Sto
         """
 
 
+class JournaledStoreWithoutWriteLoad(storage.JournaledStore, StoreWithoutWriteLoad):
+    """Fake journaled store that does not write or load. Used for testing."""
+
+
 @asynccontextmanager
 async def async_test_home_assistant(
     event_loop: asyncio.AbstractEventLoop | None = None,
@@ -299,11 +303,11 @@ async def async_test_home_assistant(
             ),
             patch(
                 "homeassistant.helpers.device_registry.DeviceRegistryStore",
-                StoreWithoutWriteLoad,
+                JournaledStoreWithoutWriteLoad,
             ),
             patch(
                 "homeassistant.helpers.entity_registry.EntityRegistryStore",
-                StoreWithoutWriteLoad,
+                JournaledStoreWithoutWriteLoad,
             ),
             patch(
                 "homeassistant.helpers.storage.Store",  # Floor & label registry are different
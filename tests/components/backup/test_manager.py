@@ -1297,6 +1297,34 @@ async def test_exception_platform_pre(hass: HomeAssistant) -> None:
     assert str(err.value) == "Error during pre-backup: Test exception"
 
 
+@pytest.mark.usefixtures("mock_backup_generation")
+async def test_pre_backup_writes_journal_snapshots(hass: HomeAssistant) -> None:
+    """Test the journaled stores write a snapshot before a backup."""
+    remote_agent = BackupAgentTest("remote", backups=[])
+    await setup_backup_platform(
+        hass,
+        domain="test",
+        platform=Mock(
+            async_pre_backup=AsyncMock(),
+            async_post_backup=AsyncMock(),
+            async_get_backup_agents=AsyncMock(return_value=[remote_agent]),
+        ),
+    )
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.backup.manager.storage.async_write_journal_snapshots"
+    ) as write_snapshots_mock:
+        await hass.services.async_call(
+            DOMAIN,
+            "create",
+            blocking=True,
+        )
+
+    write_snapshots_mock.assert_awaited_once_with(hass)
+
+
 @pytest.mark.usefixtures("mock_backup_generation")
 async def test_exception_platform_post(hass: HomeAssistant) -> None:
     """Test exception in post step."""
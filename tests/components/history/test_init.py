@@ -389,6 +389,37 @@ async def test_fetch_period_api(
     assert response.status == HTTPStatus.OK
 
 
+async def test_fetch_period_api_with_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the fetch period view downsamples with max_points."""
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    for idx in range(20):
+        hass.states.async_set("sensor.power", str(idx))
+    await async_wait_recording_done(hass)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"filter_entity_id": "sensor.power", "max_points": "4"},
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert len(response_json) == 1
+    assert len(response_json[0]) <= 4
+    assert response_json[0][0]["entity_id"] == "sensor.power"
+    assert response_json[0][0]["state"] == "0"
+    assert response_json[0][-1]["state"] == "19"
+
+    for max_points in ("3", "many"):
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}",
+            params={"filter_entity_id": "sensor.power", "max_points": max_points},
+        )
+        assert response.status == HTTPStatus.BAD_REQUEST
+        assert await response.json() == {"message": "Invalid max_points"}
+
+
 async def test_fetch_period_api_with_use_include_order(
     hass: HomeAssistant,
     recorder_mock: Recorder,
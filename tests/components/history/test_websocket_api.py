@@ -403,6 +403,190 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_stream(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period streams columnar chunks per entity."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "1", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "2", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "changed"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "significant_changes_only": False,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    chunks = []
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        if response["event"].get("done"):
+            break
+        chunks.append(response["event"])
+
+    assert [chunk["entity_id"] for chunk in chunks] == ["sensor.one", "sensor.two"]
+    attributes = [attrs for chunk in chunks for attrs in chunk["attributes"]]
+    assert attributes == [{"any": "attr"}, {"any": "changed"}]
+
+    sensor_one, sensor_two = chunks
+    assert sensor_one["s"] == ["on", "off", "off"]
+    assert sensor_one["a"] == [0, 0, 1]
+    assert sensor_one["lc"] == [None, None, pytest.approx(sensor_one["lu"][1])]
+    assert sensor_one["lu"] == sorted(sensor_one["lu"])
+    assert sensor_two["s"] == ["1", "2"]
+    assert sensor_two["a"] == [0, 1]
+    assert sensor_two["attributes"] == []
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one"],
+            "no_attributes": True,
+            "minimal_response": True,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {
+        "entity_id": "sensor.one",
+        "s": ["on", "off"],
+        "lu": [sensor_one["lu"][0], sensor_one["lu"][1]],
+    }
+    response = await client.receive_json()
+    assert response["event"] == {"done": True}
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples to max_points per entity."""
+    start = dt_util.utcnow().replace(microsecond=0)
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    with freeze_time(start) as freezer:
+        for idx in range(40):
+            freezer.move_to(start + timedelta(seconds=idx + 1))
+            hass.states.async_set("sensor.power", str(idx % 7))
+        await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(seconds=41)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 8,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    power = response["result"]["sensor.power"]
+    assert len(power) <= 8
+    assert power[0]["s"] == "0"
+    assert power[-1]["s"] == str(39 % 7)
+    assert {state["s"] for state in power} >= {"0", "6"}
+    assert [state["lu"] for state in power] == sorted(state["lu"] for state in power)
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+    # Downsampled history can not be streamed
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 8,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+async def test_history_during_period_stream_error(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period ends the stream when the query fails."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.history.websocket_api.history.stream_significant_states",
+        side_effect=RuntimeError("boom"),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+    assert response == {
+        "id": 1,
+        "type": "event",
+        "event": {
+            "error": {"code": "unknown_error", "message": "Error streaming history"}
+        },
+    }
+
+    # The subscription of the stream is gone
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
 async def test_history_during_period_bad_start_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -14,6 +14,7 @@ from homeassistant.components.history_stats.const import (
     DEFAULT_NAME,
     DOMAIN,
 )
+from homeassistant.components.history_stats.data import HistoryStats
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
@@ -24,6 +25,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_STATE,
     CONF_TYPE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_UNKNOWN,
 )
@@ -31,6 +33,7 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.template import Template
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -304,9 +307,26 @@ async def test_measure_multiple(recorder_mock: Recorder, hass: HomeAssistant) ->
             ]
         }
 
-    with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        _fake_states,
+    def _fake_states_during_periods(hass, periods, *args):
+        # Requests for several entities are loaded together
+        start_state, *states = _fake_states()["input_select.test_id"]
+        _, _, start_times = periods["input_select.test_id"]
+        return {
+            "input_select.test_id": (
+                {start_time.timestamp(): start_state for start_time in start_times},
+                states,
+            )
+        }
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        patch(
+            "homeassistant.components.recorder.history.modern.state_changes_during_periods",
+            _fake_states_during_periods,
+        ),
     ):
         await async_setup_component(
             hass,
@@ -1364,16 +1384,21 @@ async def test_measure_from_end_going_backwards(
     assert hass.states.get("sensor.sensor3").state == "0"
     assert hass.states.get("sensor.sensor4").state == "0.0"
 
+    # The window moves with the state changes passed to the sensors
+    # as they happen, so the history is not loaded again
     past_next_update = start_time + timedelta(minutes=30)
-    with (
-        patch(
-            "homeassistant.components.recorder.history.state_changes_during_period",
-            _fake_states,
-        ),
-        freeze_time(past_next_update),
-    ):
-        async_fire_time_changed(hass, past_next_update)
-        await hass.async_block_till_done(wait_background_tasks=True)
+    with patch(
+        "homeassistant.components.history_stats.data.history.async_state_changes_during_period",
+    ) as mock_state_changes:
+        for when, state in ((t0, "on"), (t1, "off")):
+            with freeze_time(when):
+                hass.states.async_set("binary_sensor.test_id", state)
+                await hass.async_block_till_done()
+        with freeze_time(past_next_update):
+            async_fire_time_changed(hass, past_next_update)
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_state_changes.assert_not_called()
 
     assert hass.states.get("sensor.sensor1").state == "0.17"
     assert 0.166 < float(hass.states.get("sensor.sensor2").state) < 0.167
@@ -1381,6 +1406,118 @@ async def test_measure_from_end_going_backwards(
     assert 16.6 <= float(hass.states.get("sensor.sensor4").state) <= 16.7
 
 
+async def test_sliding_window_trims_history(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test state changes leave the history as a sliding window moves past them."""
+    start_time = dt_util.utcnow()
+    with freeze_time(start_time):
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    },
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor2",
+                        "state": "on",
+                        "duration": {"hours": 1},
+                        "end": "{{ utcnow() }}",
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        for i in range(1, 3):
+            await async_update_entity(hass, f"sensor.sensor{i}")
+        await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.history_stats.data.history.async_state_changes_during_period",
+    ) as mock_state_changes:
+        # off 10min, on 10min, off 10min, on 20min
+        for minutes, state in ((10, "on"), (20, "off"), (30, "on")):
+            with freeze_time(start_time + timedelta(minutes=minutes)):
+                hass.states.async_set("binary_sensor.test_id", state)
+                await hass.async_block_till_done()
+
+        for minutes, expected_time, expected_count in (
+            (50, "0.5", "2"),
+            # The first on period left the window
+            (85, "0.92", "1"),
+            # The state at the start of the window is on
+            (100, "1.0", "1"),
+        ):
+            next_update = start_time + timedelta(minutes=minutes)
+            with freeze_time(next_update):
+                async_fire_time_changed(hass, next_update)
+                await hass.async_block_till_done()
+            assert hass.states.get("sensor.sensor1").state == expected_time
+            assert hass.states.get("sensor.sensor2").state == expected_count
+
+    mock_state_changes.assert_not_called()
+
+
+async def test_state_change_while_loading_history(hass: HomeAssistant) -> None:
+    """Test a state change while the history loads is not lost as the window moves."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+    history_stats = HistoryStats(
+        hass,
+        "binary_sensor.test_id",
+        ["on"],
+        None,
+        Template("{{ utcnow() }}", hass),
+        timedelta(hours=1),
+    )
+    history_stats.async_set_tracking_events(True)
+    off = ha.State(
+        "binary_sensor.test_id", "off", last_changed=start_time - timedelta(hours=2)
+    )
+    on = ha.State("binary_sensor.test_id", "on", last_changed=start_time)
+
+    async def _async_load_while_changing(*args, **kwargs):
+        # The state changes after the database was queried
+        await history_stats.async_update(
+            ha.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": "binary_sensor.test_id",
+                    "old_state": off,
+                    "new_state": on,
+                },
+            )
+        )
+        return {"binary_sensor.test_id": [off]}
+
+    with patch(
+        "homeassistant.components.history_stats.data.history.async_state_changes_during_period",
+        side_effect=_async_load_while_changing,
+    ) as mock_state_changes:
+        with freeze_time(start_time):
+            await history_stats.async_update(None)
+
+        mock_state_changes.side_effect = None
+        mock_state_changes.return_value = {"binary_sensor.test_id": [off, on]}
+        with freeze_time(start_time + timedelta(minutes=10)):
+            state = await history_stats.async_update(None)
+
+    assert mock_state_changes.call_count == 2
+    assert state.seconds_matched == 600
+    assert state.match_count == 1
+
+
 async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Test the history statistics sensor measure with a non-UTC timezone."""
     await hass.config.async_set_time_zone("Europe/Berlin")
@@ -2,7 +2,12 @@
 
 from unittest.mock import Mock
 
-from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
+from homeassistant.components.logbook.models import (
+    EventAsRow,
+    LazyEventPartialState,
+    LiveStreamIndex,
+)
+from homeassistant.core import Event
 
 
 def test_lazy_event_partial_state_context() -> None:
@@ -31,3 +36,43 @@ def test_lazy_event_partial_state_context() -> None:
     assert state.event_type == "event_type"
     assert state.entity_id == "entity_id"
     assert state.state == "state"
+
+
+def test_live_stream_index() -> None:
+    """Test the live stream index keeps the rows and entries of recent events."""
+    index = LiveStreamIndex(2)
+    entries = index.async_get_entries(False, True)
+    events = [Event(f"event_{i}") for i in range(3)]
+
+    row = index.async_get_row(events[0])
+    assert row.event_type == "event_0"
+    assert index.async_get_row(events[0]) is row
+    entries[events[0]] = {"when": row.time_fired_ts}
+    index.async_get_row(events[1])
+    entries[events[1]] = None
+    assert index.async_get_entries(False, True) is entries
+    assert index.async_get_entries(True, True) is not entries
+
+    # The oldest event leaves the index
+    index.async_get_row(events[2])
+    assert entries == {events[1]: None}
+    assert index.async_get_row(events[0]) is not row
+
+
+def test_live_stream_index_cleared_without_streams() -> None:
+    """Test the live stream index is cleared when the last stream is removed."""
+    index = LiveStreamIndex(2)
+    remove_first = index.async_add_stream()
+    remove_second = index.async_add_stream()
+    event = Event("event")
+    row = index.async_get_row(event)
+    index.async_get_entries(False, True)[event] = None
+
+    remove_first()
+    assert len(index) == 1
+    assert index.async_get_row(event) is row
+
+    remove_second()
+    assert len(index) == 0
+    assert index.async_get_entries(False, True) == {}
+    assert index.async_get_row(event) is not row
@@ -12,7 +12,7 @@ import pytest
 from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook import processor, websocket_api
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -1567,6 +1567,82 @@ async def test_subscribe_unsubscribe_logbook_stream_entities(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_live_streams_share_entries(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live streams with overlapping entities humanify each event once."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    hass.states.async_set("light.small", STATE_ON)
+    hass.states.async_set("light.large", STATE_ON)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    websocket_clients = [await hass_ws_client(), await hass_ws_client()]
+    for websocket_client, entity_ids in zip(
+        websocket_clients,
+        (["light.small"], ["light.small", "light.large"]),
+        strict=True,
+    ):
+        await websocket_client.send_json(
+            {
+                "id": 7,
+                "type": "logbook/event_stream",
+                "start_time": now.isoformat(),
+                "entity_ids": entity_ids,
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["event"]["partial"] is True
+
+    await get_instance(hass).async_block_till_done()
+    await hass.async_block_till_done()
+    for websocket_client in websocket_clients:
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert "partial" not in msg["event"]
+
+    with patch(
+        "homeassistant.components.logbook.processor._humanify",
+        wraps=processor._humanify,
+    ) as mock_humanify:
+        hass.states.async_set("light.small", STATE_OFF)
+        await hass.async_block_till_done()
+        messages = [
+            await asyncio.wait_for(websocket_client.receive_json(), 2)
+            for websocket_client in websocket_clients
+        ]
+
+    assert mock_humanify.call_count == 1
+    for msg in messages:
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": "light.small",
+                "state": "off",
+                "when": ANY,
+            },
+        ]
+
+    live_stream_index = hass.data[logbook.DOMAIN].live_stream_index
+    assert len(live_stream_index) == 1
+    for websocket_client in websocket_clients:
+        await websocket_client.send_json(
+            {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+
+    # The index is cleared once no live stream is left
+    assert len(live_stream_index) == 0
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_entities_with_end_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
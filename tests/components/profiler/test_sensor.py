@@ -0,0 +1,120 @@
+"""Test the Profiler event loop monitor."""
+
+import asyncio
+from datetime import timedelta
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant.components.profiler.const import DOMAIN, LOOP_MONITOR
+from homeassistant.components.profiler.loop_monitor import LoopMonitor, find_culprit
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
+
+
+def _frame(filename: str, qualname: str, back: SimpleNamespace | None = None):
+    return SimpleNamespace(
+        f_code=SimpleNamespace(
+            co_filename=filename, co_qualname=qualname, co_firstlineno=1
+        ),
+        f_back=back,
+    )
+
+
+async def _async_setup_profiler(hass: HomeAssistant) -> LoopMonitor:
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][LOOP_MONITOR]
+
+
+def test_find_culprit() -> None:
+    """Test the innermost integration and its outermost frame are blamed."""
+    stack = _frame(
+        "/src/homeassistant/core.py",
+        "HomeAssistant._run",
+        _frame("/usr/lib/python3/asyncio/events.py", "Handle._run"),
+    )
+    stack = _frame("/src/homeassistant/components/hue/light.py", "async_update", stack)
+    stack = _frame("/src/homeassistant/components/hue/bridge.py", "_fetch", stack)
+    stack = _frame("/src/homeassistant/helpers/json.py", "json_loads", stack)
+    stack = _frame("/usr/lib/python3/json/decoder.py", "decode", stack)
+
+    assert find_culprit(stack) == (
+        "hue",
+        "async_update (/src/homeassistant/components/hue/light.py:1)",
+    )
+    assert find_culprit(_frame("/usr/lib/python3/json/decoder.py", "decode", None)) == (
+        None,
+        "decode (/usr/lib/python3/json/decoder.py:1)",
+    )
+    assert find_culprit(None) == (None, "unknown")
+
+
+async def test_sensors(hass: HomeAssistant) -> None:
+    """Test the sensors publish the rolling event loop statistics."""
+    monitor = await _async_setup_profiler(hass)
+
+    for lag in (0.001, 0.002, 0.003, 0.25):
+        monitor.async_record_lag(lag)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get("sensor.event_loop_lag_median").state) >= 1
+    assert float(hass.states.get("sensor.event_loop_lag_maximum").state) >= 250
+    assert hass.states.get("sensor.slow_callbacks").state == "1"
+
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DOMAIN not in hass.data
+
+
+@pytest.mark.timeout(10)
+async def test_slow_callback_attributed(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a callback blocking the event loop is caught while it blocks."""
+    monitor = await _async_setup_profiler(hass)
+    client = await hass_ws_client(hass)
+
+    # Let a heartbeat run, then block the event loop past the next one
+    await asyncio.sleep(0.3)
+    time.sleep(0.4)  # noqa: ASYNC251
+    await asyncio.sleep(0.3)
+
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    stats = msg["result"]
+    assert stats["samples"] >= 2
+    assert stats["slow_callbacks_total"] >= 1
+    assert stats["lag_ms"]["max"] >= 100
+    assert any(
+        "test_slow_callback_attributed" in slow_callback["callback"]
+        for slow_callback in stats["slow_callbacks"]
+    )
+    await monitor.async_stop()
+
+
+async def test_loop_stats_not_loaded(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the loop stats command when the profiler is not loaded."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_stats"})
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
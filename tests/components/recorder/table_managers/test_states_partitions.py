@@ -0,0 +1,305 @@
+"""The tests for the states partition manager."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import ANY, MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import migration
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.table_managers.states_partitions import (
+    DEFAULT_PARTITION,
+    LEGACY_PARTITION,
+    PARTITIONS_AHEAD,
+    StatesPartition,
+    StatesPartitionManager,
+    _parse_partition,
+    partition_start,
+    plan_partitions,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def _ts(value: str) -> float:
+    return datetime.fromisoformat(value).timestamp()
+
+
+@pytest.mark.parametrize(
+    ("moment", "interval", "expected"),
+    [
+        ("2026-10-17T13:45:00+00:00", "daily", "2026-10-17T00:00:00+00:00"),
+        ("2026-10-17T01:00:00+02:00", "daily", "2026-10-16T00:00:00+00:00"),
+        ("2026-10-17T13:45:00+00:00", "weekly", "2026-10-12T00:00:00+00:00"),
+        ("2026-10-12T00:00:00+00:00", "weekly", "2026-10-12T00:00:00+00:00"),
+    ],
+)
+def test_partition_start(moment: str, interval: str, expected: str) -> None:
+    """Test partitions start at UTC midnight and weekly ones on Monday."""
+    assert partition_start(datetime.fromisoformat(moment), interval) == (
+        datetime.fromisoformat(expected)
+    )
+
+
+def test_plan_partitions() -> None:
+    """Test planning the partitions for a period."""
+    start = datetime.fromisoformat("2026-10-17T00:00:00+00:00")
+
+    assert plan_partitions(
+        start, datetime.fromisoformat("2026-10-19T06:00:00+00:00"), "daily"
+    ) == [
+        StatesPartition(
+            "states_p20261017",
+            _ts("2026-10-17T00:00:00+00:00"),
+            _ts("2026-10-18T00:00:00+00:00"),
+        ),
+        StatesPartition(
+            "states_p20261018",
+            _ts("2026-10-18T00:00:00+00:00"),
+            _ts("2026-10-19T00:00:00+00:00"),
+        ),
+        StatesPartition(
+            "states_p20261019",
+            _ts("2026-10-19T00:00:00+00:00"),
+            _ts("2026-10-20T00:00:00+00:00"),
+        ),
+    ]
+    # Switching from daily to weekly partitions fills up the current
+    # week before the first full week starts
+    assert plan_partitions(
+        start, datetime.fromisoformat("2026-10-20T00:00:00+00:00"), "weekly"
+    ) == [
+        StatesPartition(
+            "states_p20261017",
+            _ts("2026-10-17T00:00:00+00:00"),
+            _ts("2026-10-19T00:00:00+00:00"),
+        ),
+        StatesPartition(
+            "states_p20261019",
+            _ts("2026-10-19T00:00:00+00:00"),
+            _ts("2026-10-26T00:00:00+00:00"),
+        ),
+    ]
+    assert plan_partitions(start, start, "daily") == []
+
+
+def test_parse_partition() -> None:
+    """Test parsing the partition bounds returned by PostgreSQL."""
+    assert _parse_partition(
+        "states_legacy", "FOR VALUES FROM (MINVALUE) TO ('1792195200')"
+    ) == StatesPartition("states_legacy", None, 1792195200.0)
+    assert _parse_partition(
+        "states_p20261017", "FOR VALUES FROM ('1792195200') TO ('1792281600')"
+    ) == StatesPartition("states_p20261017", 1792195200.0, 1792281600.0)
+    assert _parse_partition("states_default", "DEFAULT") == StatesPartition(
+        "states_default", None, None
+    )
+
+
+def test_ensure_partitions_continues_after_failure() -> None:
+    """Test the later partitions are created when creating one fails."""
+    manager = StatesPartitionManager(MagicMock())
+    manager.active = True
+    session = MagicMock()
+    # Rows for the current range already ended up in the default partition
+    session.execute.side_effect = [
+        OperationalError("CREATE TABLE", {}, Exception("overlaps")),
+        *[None] * PARTITIONS_AHEAD,
+    ]
+    now = datetime.fromisoformat("2026-10-17T13:45:00+00:00")
+
+    manager.ensure_partitions(session, now, "daily")
+
+    assert session.execute.call_count == PARTITIONS_AHEAD + 1
+    assert [partition.name for partition in manager.partitions] == [
+        (now + timedelta(days=day)).strftime("states_p%Y%m%d")
+        for day in range(1, PARTITIONS_AHEAD + 1)
+    ]
+
+
+async def test_partitions_not_supported_on_sqlite(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the states table is not partitioned on SQLite."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PARTITION_INTERVAL: "daily"}
+    )
+    await async_wait_recording_done(hass)
+
+    manager = instance.states_partition_manager
+    assert manager.active is False
+    assert manager.partitions == []
+    assert manager.expired_partitions(dt_util.utcnow()) == []
+    assert (
+        "Partitioning the states table is only supported on PostgreSQL" in caplog.text
+    )
+
+
+async def test_purge_drops_expired_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test purging drops one expired partition per pass before the default one."""
+    instance = await async_setup_recorder_instance(hass)
+    manager = instance.states_partition_manager
+    expired = [
+        StatesPartition("states_legacy", None, _ts("2026-10-10T00:00:00+00:00")),
+        StatesPartition(
+            "states_p20261010",
+            _ts("2026-10-10T00:00:00+00:00"),
+            _ts("2026-10-11T00:00:00+00:00"),
+        ),
+    ]
+    purge_before = dt_util.utcnow() - timedelta(days=1)
+
+    with (
+        patch.object(manager, "active", True),
+        patch.object(manager, "expired_partitions", return_value=expired),
+        patch.object(manager, "drop_partition", return_value=set()) as drop_mock,
+    ):
+        finished = await instance.async_add_executor_job(
+            purge_old_data, instance, purge_before, False
+        )
+    assert not finished
+    drop_mock.assert_called_once_with(ANY, expired[0])
+
+    with (
+        patch.object(manager, "active", True),
+        patch.object(manager, "expired_partitions", return_value=expired[1:]),
+        patch.object(manager, "drop_partition", return_value=set()) as drop_mock,
+        patch.object(
+            manager, "select_default_partition_rows_to_purge"
+        ) as select_default_mock,
+    ):
+        finished = await instance.async_add_executor_job(
+            purge_old_data, instance, purge_before, False
+        )
+    drop_mock.assert_called_once_with(ANY, expired[1])
+    select_default_mock.assert_not_called()
+    assert not finished
+
+    # The default partition is purged once the expired partitions are gone
+    with (
+        patch.object(manager, "active", True),
+        patch.object(manager, "expired_partitions", return_value=[]),
+        patch.object(
+            manager,
+            "select_default_partition_rows_to_purge",
+            side_effect=[({1, 2}, {3}), (set(), set())],
+        ) as select_default_mock,
+        patch(
+            "homeassistant.components.recorder.purge._purge_state_ids"
+        ) as purge_state_ids_mock,
+    ):
+        finished = await instance.async_add_executor_job(
+            purge_old_data, instance, purge_before, False
+        )
+        assert not finished
+        purge_state_ids_mock.assert_called_once_with(instance, ANY, {1, 2})
+
+        finished = await instance.async_add_executor_job(
+            purge_old_data, instance, purge_before, False
+        )
+    assert select_default_mock.call_count == 2
+    assert finished
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_partition_states_table(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test partitioning a populated states table on PostgreSQL."""
+    instance = await async_setup_recorder_instance(hass)
+    manager = instance.states_partition_manager
+    for value in range(5):
+        hass.states.async_set("sensor.test", str(value), {"value": value})
+    await async_wait_recording_done(hass)
+
+    def _count_and_max_state_id() -> tuple[int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.execute(
+                text("SELECT count(*), max(state_id) FROM states")
+            ).one()
+
+    def _foreign_key_columns(table: str) -> set[str]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return {
+                column
+                for (column,) in session.execute(
+                    text(
+                        "SELECT attname FROM pg_constraint JOIN pg_attribute"
+                        " ON attrelid = conrelid AND attnum = conkey[1]"
+                        " WHERE conrelid = to_regclass(:table) AND contype = 'f'"
+                    ),
+                    {"table": table},
+                )
+            }
+
+    count, max_state_id = await instance.async_add_executor_job(_count_and_max_state_id)
+    assert count == 5
+    assert "old_state_id" in await instance.async_add_executor_job(
+        _foreign_key_columns, "states"
+    )
+
+    instance.partition_interval = "daily"
+    instance.queue_task(migration.StatesPartitionTask())
+    await async_wait_recording_done(hass)
+
+    # The populated table was attached as the first partition
+    assert manager.active is True
+    names = [partition.name for partition in manager.partitions]
+    assert names[0] == LEGACY_PARTITION
+    assert names[-1] == DEFAULT_PARTITION
+    assert len(names) == PARTITIONS_AHEAD + 2
+    assert await instance.async_add_executor_job(_count_and_max_state_id) == (
+        5,
+        max_state_id,
+    )
+    for table in ("states", LEGACY_PARTITION):
+        assert await instance.async_add_executor_job(_foreign_key_columns, table) == {
+            "attributes_id",
+            "metadata_id",
+        }
+
+    # New states continue the sequence of the state_ids
+    hass.states.async_set("sensor.test", "new", {"value": 5})
+    await async_wait_recording_done(hass)
+    assert await instance.async_add_executor_job(_count_and_max_state_id) == (
+        6,
+        max_state_id + 1,
+    )
+
+    # Restoring the foreign keys skips the one the partitioned table can't have
+    await instance.async_add_executor_job(
+        migration._restore_foreign_key_constraints,
+        instance.get_session,
+        instance.engine,
+        [("states", "old_state_id", "states", "state_id")],
+    )
+    assert "old_state_id" not in await instance.async_add_executor_job(
+        _foreign_key_columns, "states"
+    )
+
+    # Purging drops the legacy partition
+    purge_before = dt_util.utcnow() + timedelta(days=1)
+    for _ in range(10):
+        if await instance.async_add_executor_job(
+            purge_old_data, instance, purge_before, False
+        ):
+            break
+    names = [partition.name for partition in manager.partitions]
+    assert LEGACY_PARTITION not in names
+    assert DEFAULT_PARTITION in names
+    assert (await instance.async_add_executor_job(_count_and_max_state_id))[0] == 0
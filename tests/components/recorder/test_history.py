@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -124,6 +125,115 @@ async def test_significant_states_with_session_single_entity(
         assert len(states["demo.id"]) == 2
 
 
+async def test_stream_significant_states_chunks(
+    hass: HomeAssistant,
+) -> None:
+    """Test stream_significant_states splits entities into chunks."""
+    start = dt_util.utcnow()
+    for idx in range(5):
+        hass.states.async_set("demo.id", str(idx), {"attr": idx % 2})
+    hass.states.async_set("demo.id2", "any", {"attr": 0})
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+
+    chunks = list(
+        history.stream_significant_states(
+            hass,
+            start - timedelta(days=1),
+            now,
+            entity_ids=["demo.id", "demo.id2", "demo.never_recorded"],
+            chunk_size=2,
+        )
+    )
+    assert [(chunk["entity_id"], chunk["s"]) for chunk in chunks] == [
+        ("demo.id", ["0", "1"]),
+        ("demo.id", ["2", "3"]),
+        ("demo.id", ["4"]),
+        ("demo.id2", ["any"]),
+    ]
+    assert [chunk["a"] for chunk in chunks] == [[0, 1], [0, 1], [0], [0]]
+    assert [chunk["attributes"] for chunk in chunks] == [
+        [{"attr": 0}, {"attr": 1}],
+        [],
+        [],
+        [],
+    ]
+    assert "lc" not in chunks[0]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        full_states = history.get_significant_states_with_session(
+            hass,
+            session,
+            start - timedelta(days=1),
+            now,
+            entity_ids=["demo.id"],
+            compressed_state_format=True,
+        )
+    assert [last_updated for chunk in chunks[:3] for last_updated in chunk["lu"]] == [
+        state["lu"] for state in full_states["demo.id"]
+    ]
+
+    assert (
+        list(
+            history.stream_significant_states(
+                hass, start, now, entity_ids=["demo.never_recorded"]
+            )
+        )
+        == []
+    )
+
+
+async def test_get_downsampled_states(
+    hass: HomeAssistant,
+) -> None:
+    """Test downsampling keeps the first, min, max and last state of a bucket."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    with freeze_time(start) as freezer:
+        for idx, state in enumerate(("5", "1", "unavailable", "9", "3")):
+            freezer.move_to(start + timedelta(seconds=idx + 1))
+            hass.states.async_set("sensor.power", state, {"unit": "W"})
+        hass.states.async_set("sensor.other", "on")
+        await async_wait_recording_done(hass)
+
+    end = start + timedelta(seconds=10)
+    with session_scope(hass=hass, read_only=True) as session:
+        hist = history.get_downsampled_states_with_session(
+            hass,
+            session,
+            start,
+            end,
+            ["sensor.power", "sensor.other"],
+            max_points=4,
+            include_start_time_state=False,
+            compressed_state_format=True,
+        )
+    power = hist["sensor.power"]
+    assert [state["s"] for state in power] == ["5", "1", "9", "3"]
+    assert power[0]["a"] == {"unit": "W"}
+    assert [state["lu"] for state in power] == [
+        (start + timedelta(seconds=seconds)).timestamp() for seconds in (1, 2, 4, 5)
+    ]
+    assert [state["s"] for state in hist["sensor.other"]] == ["on"]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        hist = history.get_downsampled_states_with_session(
+            hass,
+            session,
+            start,
+            end,
+            ["sensor.power"],
+            max_points=40,
+            include_start_time_state=False,
+        )
+    assert [state["state"] for state in hist["sensor.power"][1:]] == [
+        "1",
+        "unavailable",
+        "9",
+        "3",
+    ]
+    assert hist["sensor.power"][0].state == "5"
+
+
 @pytest.mark.parametrize(
     ("attributes", "no_attributes", "limit"),
     [
@@ -309,6 +419,175 @@ async def test_state_changes_during_period_descending(
     )
 
 
+async def test_async_state_changes_during_period_batched(hass: HomeAssistant) -> None:
+    """Test concurrent requests are answered together like single queries."""
+    before = dt_util.utcnow().replace(microsecond=0)
+    start = before + timedelta(seconds=1)
+    point = start + timedelta(seconds=1)
+    end = point + timedelta(seconds=1)
+
+    with freeze_time(before) as freezer:
+        for moment in (before, start, point, end):
+            freezer.move_to(moment + timedelta(milliseconds=100))
+            hass.states.async_set("media_player.test", f"idle_{moment.second}")
+            hass.states.async_set("sensor.test", str(moment.second), {"any": 1})
+            freezer.move_to(moment + timedelta(milliseconds=200))
+            hass.states.async_set("sensor.test", str(moment.second), {"any": 2})
+    await async_wait_recording_done(hass)
+
+    requests = [
+        (start, end, "media_player.test", False, False, None, True),
+        (point, None, "media_player.test", False, False, None, True),
+        (start, None, "sensor.test", False, True, 2, False),
+        (point, end, "sensor.test", False, False, None, True),
+        (start, None, "sensor.test", True, False, None, True),
+        (start, None, "binary_sensor.unknown", False, False, None, True),
+    ]
+    with patch(
+        "homeassistant.components.recorder.history.modern.state_changes_during_periods",
+        wraps=history.modern.state_changes_during_periods,
+    ) as state_changes_during_periods:
+        results = await asyncio.gather(
+            *(
+                history.async_state_changes_during_period(hass, *request)
+                for request in requests
+            )
+        )
+    assert state_changes_during_periods.call_count == 1
+
+    def _states(result: dict[str, list[State]]) -> list[tuple]:
+        return [
+            (state.entity_id, state.state, state.last_changed, state.attributes)
+            for states in result.values()
+            for state in states
+        ]
+
+    for request, result in zip(requests, results, strict=True):
+        expected = history.state_changes_during_period(hass, *request)
+        assert _states(result) == _states(expected)
+    assert results[1]["media_player.test"][0].last_updated == point
+    assert results[5] == {}
+
+
+async def test_async_state_changes_during_period_batched_limit(
+    hass: HomeAssistant,
+) -> None:
+    """Test concurrent requests with a limit are loaded with one query."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    entity_ids = ("sensor.one", "sensor.two", "sensor.three")
+    with freeze_time(start) as freezer:
+        for second in range(1, 11):
+            freezer.move_to(start + timedelta(seconds=second))
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(second))
+    await async_wait_recording_done(hass)
+
+    requests = [
+        (start, None, "sensor.one", False, True, 3, False),
+        (start + timedelta(seconds=4.5), None, "sensor.two", True, True, 2, True),
+        (start + timedelta(seconds=4.5), None, "sensor.three", True, False, 2, True),
+    ]
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            wraps=history.state_changes_during_period,
+        ) as state_changes_during_period,
+        patch(
+            "homeassistant.components.recorder.history.modern._state_changes_during_periods_stmt",
+            wraps=history.modern._state_changes_during_periods_stmt,
+        ) as state_changes_during_periods_stmt,
+    ):
+        results = await asyncio.gather(
+            *(
+                history.async_state_changes_during_period(hass, *request)
+                for request in requests
+            )
+        )
+    # One query per value of no_attributes applies the limits
+    assert state_changes_during_period.call_count == 0
+    assert state_changes_during_periods_stmt.call_count == 2
+
+    assert [
+        [state.state for state in result[request[2]]]
+        for request, result in zip(requests, results, strict=True)
+    ] == [["10", "9", "8"], ["10", "9", "4"], ["4", "5", "6"]]
+    for request, result in zip(requests, results, strict=True):
+        entity_id = request[2]
+        assert [state.state for state in result[entity_id]] == [
+            state.state
+            for state in history.state_changes_during_period(hass, *request)[entity_id]
+        ]
+
+
+async def test_async_state_changes_during_period_batched_limits_same_entity(
+    hass: HomeAssistant,
+) -> None:
+    """Test requests with a limit for the same entity are loaded on their own."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    with freeze_time(start) as freezer:
+        for second in range(1, 11):
+            freezer.move_to(start + timedelta(seconds=second))
+            hass.states.async_set("sensor.one", str(second))
+    await async_wait_recording_done(hass)
+
+    requests = [
+        (start, None, "sensor.one", False, True, 3, False),
+        (start, None, "sensor.one", False, False, 2, False),
+    ]
+    with patch(
+        "homeassistant.components.recorder.history.modern.state_changes_during_periods",
+        wraps=history.modern.state_changes_during_periods,
+    ) as state_changes_during_periods:
+        results = await asyncio.gather(
+            *(
+                history.async_state_changes_during_period(hass, *request)
+                for request in requests
+            )
+        )
+    assert state_changes_during_periods.call_count == 0
+    assert [[state.state for state in result["sensor.one"]] for result in results] == [
+        ["10", "9", "8"],
+        ["1", "2"],
+    ]
+
+
+async def test_state_changes_during_periods_chunked(hass: HomeAssistant) -> None:
+    """Test the state changes of many entities are selected in chunks."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    entity_ids = [f"sensor.test_{index}" for index in range(5)]
+    with freeze_time(start) as freezer:
+        for second in range(3):
+            freezer.move_to(start + timedelta(seconds=second, milliseconds=100))
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, f"{entity_id}_{second}")
+    await async_wait_recording_done(hass)
+
+    point = start + timedelta(seconds=1)
+    periods = {entity_id: (point, None, [point]) for entity_id in entity_ids}
+    with (
+        patch(
+            "homeassistant.components.recorder.history.modern.MAX_PERIODS_PER_QUERY", 2
+        ),
+        patch(
+            "homeassistant.components.recorder.history.modern._state_changes_during_periods_stmt",
+            wraps=history.modern._state_changes_during_periods_stmt,
+        ) as state_changes_during_periods_stmt,
+    ):
+        result = await recorder.get_instance(hass).async_add_executor_job(
+            history.modern.state_changes_during_periods, hass, periods
+        )
+    assert state_changes_during_periods_stmt.call_count == 3
+
+    point_ts = point.timestamp()
+    assert set(result) == set(entity_ids)
+    for entity_id, (start_time_states, changes) in result.items():
+        assert start_time_states[point_ts].state == f"{entity_id}_0"
+        assert [state.state for state in changes] == [
+            f"{entity_id}_1",
+            f"{entity_id}_2",
+        ]
+
+
 async def test_get_last_state_changes(hass: HomeAssistant) -> None:
     """Test number of state changes."""
     entity_id = "sensor.test"
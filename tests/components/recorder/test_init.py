@@ -131,6 +131,9 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         auto_repack=True,
         keep_days=7,
         commit_interval=1,
+        bulk_insert=False,
+        purge_range_delete=False,
+        partition_interval=None,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
@@ -558,6 +561,82 @@ async def test_saving_event(hass: HomeAssistant, setup_recorder: None) -> None:
     )
 
 
+async def test_saving_states_with_bulk_insert(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test saving states and events with bulk insert links old states."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_BULK_INSERT: True, recorder.CONF_COMMIT_INTERVAL: 1}
+    )
+    assert instance.bulk_insert is True
+    await async_wait_recording_done(hass)
+    statements_before = instance.bulk_insert_manager.statements_executed
+
+    for idx in range(3):
+        hass.states.async_set("test.one", str(idx), {"attr": idx})
+        hass.states.async_set("test.two", str(idx), {"attr": "same"})
+    hass.states.async_remove("test.two")
+    hass.bus.async_fire("bulk_test_event", {"data": 1})
+    hass.bus.async_fire("bulk_test_event")
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    # One statement for the events and one per generation of states
+    assert instance.bulk_insert_manager.statements_executed - statements_before == 5
+    assert not instance.bulk_insert_manager.pending
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {
+            db_state.state_id: (db_state, states_meta.entity_id, attrs)
+            for db_state, states_meta, attrs in session.query(
+                States, StatesMeta, StateAttributes
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        }
+        assert len(db_states) == 7
+        by_entity: dict[str, list[States]] = {}
+        for db_state, entity_id, attrs in db_states.values():
+            if entity_id == "test.one":
+                assert attrs.to_native() == {"attr": int(db_state.state)}
+            by_entity.setdefault(entity_id, []).append(db_state)
+        for entity_states in by_entity.values():
+            assert entity_states[0].old_state_id is None
+            for old_state, new_state in zip(
+                entity_states, entity_states[1:], strict=False
+            ):
+                assert new_state.old_state_id == old_state.state_id
+        assert by_entity["test.two"][-1].state is None
+
+        db_events = list(
+            session.query(Events, EventData)
+            .filter(
+                Events.event_type_id.in_(select_event_type_ids(("bulk_test_event",)))
+            )
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+        )
+        assert len(db_events) == 2
+        assert [
+            event_data.to_native() if event_data else None
+            for _, event_data in db_events
+        ] == [{"data": 1}, None]
+
+    # The next state links to the state committed by the bulk insert
+    hass.states.async_set("test.one", "3", {"attr": 3})
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        last_state = session.query(States).order_by(States.state_id.desc()).first()
+        assert last_state.state == "3"
+        assert last_state.old_state_id == by_entity["test.one"][-1].state_id
+
+
 async def test_saving_state_with_commit_interval_zero(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -4,7 +4,7 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import ANY, Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -13,7 +13,10 @@ from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
 from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.const import (
+    EVENT_RECORDER_PURGE_PROGRESS,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.db_schema import (
     Events,
     EventTypes,
@@ -25,7 +28,14 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    DEFAULT_STATES_BATCHES_PER_PURGE,
+    MAX_BATCHES_PER_PURGE,
+    PURGE_TIME_SLICE,
+    PurgeProgress,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -45,7 +55,8 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
-from tests.typing import RecorderInstanceGenerator
+from tests.common import async_capture_events
+from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 TEST_EVENT_TYPES = (
     "EVENT_TEST_AUTOPURGE",
@@ -110,6 +121,154 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_big_database_with_range_delete(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test deleting 2/3 old states from a big database with range deletes."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    with (
+        patch.object(recorder_mock, "dialect_name", SupportedDialect.MYSQL),
+        patch.object(recorder_mock, "purge_range_delete", True),
+        patch.object(recorder_mock, "max_bind_vars", 10),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 10),
+    ):
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        passes = 0
+        while not purge_old_data(
+            recorder_mock,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        ):
+            passes += 1
+        # 48 states to purge in batches of at most 10
+        assert passes >= 5
+
+        with session_scope(hass=hass) as session:
+            states = session.query(States)
+            state_attributes = session.query(StateAttributes)
+            assert states.count() == 24
+            assert state_attributes.count() == 1
+            state_ids = {state.state_id for state in states}
+            assert all(
+                state.old_state_id is None or state.old_state_id in state_ids
+                for state in states
+            )
+
+
+def test_purge_progress_adapts_batch_size() -> None:
+    """Test the purge batch size follows the measured delete latency."""
+    now = dt_util.utcnow()
+    progress = PurgeProgress(now - timedelta(days=10), now)
+    progress.finish_pass(False)
+    assert progress.states_batch_size == DEFAULT_STATES_BATCHES_PER_PURGE
+    assert progress.events_batch_size == DEFAULT_EVENTS_BATCHES_PER_PURGE
+
+    progress.record_states_batches(100, 2, PURGE_TIME_SLICE / 5)
+    progress.record_events_batches(50, 1, PURGE_TIME_SLICE / 1000)
+    progress.finish_pass(False)
+    assert progress.states_batch_size == 5
+    assert progress.events_batch_size == MAX_BATCHES_PER_PURGE
+
+    progress.record_states_batches(100, 1, PURGE_TIME_SLICE * 10)
+    progress.finish_pass(True)
+    assert progress.states_batch_size == 1
+    assert progress.as_dict() == {
+        "purge_before": (now - timedelta(days=10)).isoformat(),
+        "started": now.isoformat(),
+        "finished": ANY,
+        "passes": 3,
+        "states_purged": 200,
+        "events_purged": 50,
+        "states_batch_size": 1,
+        "events_batch_size": MAX_BATCHES_PER_PURGE,
+    }
+
+
+async def test_purge_progress_times_unused_attributes(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging the unused attributes and data counts towards the batches."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+    clock = 0.0
+
+    def _monotonic() -> float:
+        return clock
+
+    def _slow_cleanup(*args: object) -> None:
+        nonlocal clock
+        clock += PURGE_TIME_SLICE
+
+    now = dt_util.utcnow()
+    progress = PurgeProgress(now - timedelta(days=4), now)
+    with (
+        patch(
+            "homeassistant.components.recorder.purge.time",
+            Mock(monotonic=_monotonic),
+        ),
+        patch(
+            "homeassistant.components.recorder.purge._purge_unused_attributes_ids",
+            side_effect=_slow_cleanup,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge._purge_unused_data_ids",
+            side_effect=_slow_cleanup,
+        ),
+    ):
+        purge_old_data(
+            recorder_mock,
+            progress.purge_before,
+            repack=False,
+            progress=progress,
+        )
+
+    assert progress.states_purged == 4
+    assert progress.events_purged == 4
+    # A single batch of each took the time of the cleanup
+    assert progress.states_batch_latency == PURGE_TIME_SLICE
+    assert progress.events_batch_latency == PURGE_TIME_SLICE
+    progress.finish_pass(True)
+    assert progress.states_batch_size == 1
+    assert progress.events_batch_size == 1
+
+
+async def test_purge_reports_progress(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the purge task fires progress events and updates recorder/info."""
+    await _add_test_states(hass)
+    progress_events = async_capture_events(hass, EVENT_RECORDER_PURGE_PROGRESS)
+
+    with patch.object(recorder_mock, "max_bind_vars", 1):
+        await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+        await hass.async_block_till_done()
+        await async_wait_purge_done(hass)
+
+    assert progress_events
+    last_progress = progress_events[-1].data
+    assert last_progress["finished"] is not None
+    assert last_progress["states_purged"] == 4
+    assert last_progress["passes"] == len(progress_events)
+    assert [event.data["passes"] for event in progress_events] == list(
+        range(1, len(progress_events) + 1)
+    )
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["purge_progress"] == last_progress
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     assert recorder_mock.states_manager.oldest_ts is None
@@ -1,11 +1,12 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
@@ -35,6 +36,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import ImportStatisticsTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -292,6 +294,137 @@ async def test_compile_hourly_statistics(
     assert stats == {}
 
 
+async def test_compile_hourly_statistics_from_accumulator(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test hourly statistics are summarized in memory when the hour is complete."""
+    instance = recorder.get_instance(hass)
+
+    def _stats(start: datetime) -> list[dict[str, Any]]:
+        minute = start.minute
+        return [
+            {
+                "meta": {
+                    "has_mean": True,
+                    "has_sum": False,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": "sensor.mean",
+                    "unit_of_measurement": "W",
+                },
+                "stat": {
+                    "start": start,
+                    "mean": minute / 5,
+                    "min": minute / 5 - 10 * (minute == 20),
+                    "max": minute / 5 + 10 * (minute == 30),
+                },
+            },
+            {
+                "meta": {
+                    "has_mean": False,
+                    "has_sum": True,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": "sensor.sum",
+                    "unit_of_measurement": "kWh",
+                },
+                "stat": {
+                    "start": start,
+                    "last_reset": None,
+                    "state": minute,
+                    "sum": minute * 2,
+                },
+            },
+        ]
+
+    def _mock_compile_statistics(
+        hass: HomeAssistant, session: Session, start: datetime, end: datetime
+    ) -> PlatformCompiledStatistics:
+        return PlatformCompiledStatistics(
+            _stats(start),
+            get_metadata_with_session(
+                instance, session, statistic_ids={"sensor.mean", "sensor.sum"}
+            ),
+        )
+
+    await _setup_mock_domain(
+        hass,
+        Mock(compile_statistics=_mock_compile_statistics, spec=["compile_statistics"]),
+    )
+    await async_recorder_block_till_done(hass)
+
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1
+    )
+    expected = {
+        "sensor.mean": [
+            {
+                "start": hour.timestamp(),
+                "end": (hour + timedelta(hours=1)).timestamp(),
+                "last_reset": None,
+                "mean": pytest.approx(5.5),
+                "min": pytest.approx(-6.0),
+                "max": pytest.approx(16.0),
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.sum": [
+            {
+                "start": hour.timestamp(),
+                "end": (hour + timedelta(hours=1)).timestamp(),
+                "last_reset": None,
+                "mean": None,
+                "min": None,
+                "max": None,
+                "state": pytest.approx(55.0),
+                "sum": pytest.approx(110.0),
+            }
+        ],
+    }
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    with patch.object(
+        statistics,
+        "_compile_hourly_statistics_summary_mean_stmt",
+        wraps=statistics._compile_hourly_statistics_summary_mean_stmt,
+    ) as summary_mean_stmt:
+        for minute in range(0, 60, 5):
+            do_adhoc_statistics(hass, start=hour + timedelta(minutes=minute))
+        await async_wait_recording_done(hass)
+    summary_mean_stmt.assert_not_called()
+    stats = statistics_during_period(hass, hour, period="hour", types=types)
+    assert stats == expected
+
+    # One period of the next hour is imported instead of compiled, the
+    # summary must be compiled from the database
+    next_hour = hour + timedelta(hours=1)
+    for minute in range(0, 30, 5):
+        do_adhoc_statistics(hass, start=next_hour + timedelta(minutes=minute))
+    await async_wait_recording_done(hass)
+    instance.queue_task(
+        ImportStatisticsTask(
+            _stats(next_hour)[0]["meta"],
+            [{"start": next_hour + timedelta(minutes=30), "mean": 100}],
+            StatisticsShortTerm,
+        )
+    )
+    with patch.object(
+        statistics,
+        "_compile_hourly_statistics_summary_mean_stmt",
+        wraps=statistics._compile_hourly_statistics_summary_mean_stmt,
+    ) as summary_mean_stmt:
+        for minute in range(35, 60, 5):
+            do_adhoc_statistics(hass, start=next_hour + timedelta(minutes=minute))
+        await async_wait_recording_done(hass)
+    summary_mean_stmt.assert_called_once()
+    stats = statistics_during_period(
+        hass, next_hour, statistic_ids={"sensor.mean"}, period="hour", types=types
+    )
+    assert stats["sensor.mean"][0]["mean"] == pytest.approx(160 / 12)
+
+
 @pytest.fixture
 def mock_sensor_statistics():
     """Generate some fake statistics."""
@@ -0,0 +1,135 @@
+"""Test the incremental statistics of the statistics sensor."""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.statistics import engine
+from homeassistant.components.statistics.engine import (
+    OrderStatistics,
+    StreamingStatistics,
+)
+
+
+def _assert_matches(samples: StreamingStatistics) -> None:
+    """Assert the tracked statistics match those calculated from scratch."""
+    states = list(samples.states)
+    ages = list(samples.ages)
+    assert samples.moments.total == pytest.approx(sum(states))
+    assert samples.moments.mean == pytest.approx(statistics.mean(states))
+    assert samples.extremes.max == (max(states), ages[states.index(max(states))])
+    assert samples.extremes.min == (min(states), ages[states.index(min(states))])
+    assert samples.order.median() == statistics.median(states)
+    assert samples.differences.absolute == pytest.approx(
+        sum(abs(j - i) for i, j in zip(states, states[1:], strict=False))
+    )
+    assert samples.circular.sin_sum == pytest.approx(
+        sum(math.sin(math.radians(x)) for x in states), abs=1e-9
+    )
+    if len(states) < 2:
+        return
+    assert samples.moments.variance == pytest.approx(statistics.variance(states))
+    assert samples.areas.step == pytest.approx(
+        sum(states[i - 1] * (ages[i] - ages[i - 1]) for i in range(1, len(states)))
+    )
+    percentiles = statistics.quantiles(states, n=100, method="exclusive")
+    for percentile in (1, 25, 50, 95, 99):
+        assert samples.order.percentile(percentile) == pytest.approx(
+            percentiles[percentile - 1]
+        )
+
+
+@pytest.mark.parametrize("maxlen", [1, 7, 600, None])
+def test_streaming_statistics(maxlen: int | None) -> None:
+    """Test the statistics follow samples being added and removed."""
+    rng = random.Random(maxlen)
+    samples = StreamingStatistics(maxlen)
+    for step in range(1500):
+        samples.append(float(rng.randint(-50, 50)), float(step))
+        if step % 3 == 0 and len(samples) > 1:
+            samples.popleft()
+        # Trackers are created from the samples on first use
+        if step % 100 == 99:
+            _assert_matches(samples)
+    assert maxlen is None or len(samples) <= maxlen
+
+
+def test_order_statistics_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test sorted chunks are split and dropped as samples come and go."""
+    monkeypatch.setattr(engine, "_CHUNK_SIZE", 4)
+    samples = StreamingStatistics(None)
+    order = samples.order
+    values = [5.0, 1.0, 9.0, 3.0, 7.0, 2.0, 8.0, 6.0, 4.0, 0.0] * 3
+    for age, value in enumerate(values):
+        samples.append(value, float(age))
+    assert [order[index] for index in range(len(values))] == sorted(values)
+    while len(samples) > 1:
+        samples.popleft()
+        assert order.median() == statistics.median(samples.states)
+    with pytest.raises(IndexError):
+        order[1]
+
+
+def test_order_statistics_split_boundaries() -> None:
+    """Test chunks are split above twice the chunk size and looked up by count."""
+    size = engine._CHUNK_SIZE
+    samples = StreamingStatistics(None)
+    order = samples.order
+    for value in range(2 * size):
+        samples.append(float(value), float(value))
+    assert [len(chunk) for chunk in order._chunks] == [2 * size]
+    samples.append(float(2 * size), float(2 * size))
+    assert [len(chunk) for chunk in order._chunks] == [size, size + 1]
+    assert len(order) == 2 * size + 1
+    for index in (0, size - 1, size, size + 1, 2 * size):
+        assert order[index] == float(index)
+    with pytest.raises(IndexError):
+        order[2 * size + 1]
+    with pytest.raises(IndexError):
+        order[-1]
+
+    # Emptying the first chunk drops it
+    for _ in range(size):
+        samples.popleft()
+    assert [len(chunk) for chunk in order._chunks] == [size + 1]
+    assert order[0] == float(size)
+    assert order[size] == float(2 * size)
+    assert order.median() == statistics.median(samples.states)
+
+
+def test_rebuild_after_removals() -> None:
+    """Test running sums are recalculated after as many removals as samples."""
+    samples = StreamingStatistics(None)
+    moments = samples.moments
+    order = samples.order
+    for age, value in enumerate((1e16, 1.0, 1.0, 1.0)):
+        samples.append(value, float(age))
+    with patch.object(OrderStatistics, "rebuild", autospec=True) as order_rebuild_mock:
+        samples.popleft()
+        samples.popleft()
+        # The ones were lost next to the large sample
+        assert moments.total != sum(samples.states)
+        samples.popleft()
+    assert moments.total == sum(samples.states) == 1.0
+    assert moments.mean == 1.0
+    # Order statistics do not accumulate errors and are not rebuilt
+    order_rebuild_mock.assert_not_called()
+    assert order.median() == 1.0
+
+
+def test_extremes_keep_oldest_tie() -> None:
+    """Test the oldest sample is reported when several share the extreme."""
+    samples = StreamingStatistics(None)
+    for age, value in enumerate((3.0, 1.0, 3.0, 1.0)):
+        samples.append(value, float(age))
+    assert samples.extremes.max == (3.0, 0.0)
+    assert samples.extremes.min == (1.0, 1.0)
+    samples.popleft()
+    assert samples.extremes.max == (3.0, 2.0)
+    samples.popleft()
+    assert samples.extremes.min == (1.0, 3.0)
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -19,14 +20,16 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.storage import get_internal_store_manager
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +37,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -186,6 +190,51 @@ async def test_call_service(
     assert call.context.as_dict() == msg["result"]["context"]
 
 
+async def test_call_service_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test call service stats command."""
+    async_mock_service(hass, "domain_test", "test_service")
+    async_mock_service(hass, "domain_test", "never_called")
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "call_service",
+            "domain": "domain_test",
+            "service": "test_service",
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 6, "type": "call_service/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "domain_test": {"test_service": {"count": 1, "total": ANY, "buckets": ANY}}
+    }
+    assert sum(msg["result"]["domain_test"]["test_service"]["buckets"].values()) == 1
+
+
+async def test_storage_write_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test storage write stats command."""
+    get_internal_store_manager(hass).async_record_write("test_key", 120, 0.0042)
+
+    await websocket_client.send_json({"id": 5, "type": "storage/write_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["test_key"] == {
+        "writes": 1,
+        "bytes": 120,
+        "last_bytes": 120,
+        "total_ms": 4.2,
+        "max_ms": 4.2,
+    }
+
+
 async def test_return_response_error(hass: HomeAssistant, websocket_client) -> None:
     """Test return_response=True errors when service has no response."""
     hass.services.async_register(
@@ -1310,6 +1359,235 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shares_serialization(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test state changes are serialized once for all subscriptions."""
+    hass.states.async_set("light.include", "off")
+    other_client = await hass_ws_client(hass)
+    for client, msg_id in ((websocket_client, 7), (other_client, 8)):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "subscribe_entities",
+                "include": {"domains": ["light"]},
+            }
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+
+    hass.states.async_set("switch.not_included", "on")
+    hass.states.async_set("light.include", "on")
+    for client, msg_id in ((websocket_client, 7), (other_client, 8)):
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["event"] == {
+            "c": {"light.include": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+    await websocket_client.send_json({"id": 9, "type": "subscribe_entities/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "subscriptions": 2,
+        "filter_groups": 1,
+        "events": 2,
+        "encodes": 1,
+        "messages_sent": 2,
+    }
+
+    await other_client.send_json(
+        {"id": 9, "type": "unsubscribe_events", "subscription": 8}
+    )
+    msg = await other_client.receive_json()
+    assert msg["success"]
+    await websocket_client.send_json({"id": 10, "type": "subscribe_entities/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["subscriptions"] == 1
+
+
+async def test_subscribe_entities_state_batch(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the state changes of a state batch are sent as one message."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "include": {"domains": ["light"]}}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.one", "on")
+        hass.states.async_set("switch.not_included", "on")
+        hass.states.async_set("light.two", "on", {"color": "red"})
+        hass.states.async_set("light.one", "on", {"color": "blue"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {
+            "light.two": {"+": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "on"}},
+            "light.one": {
+                "+": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "on"}
+            },
+        }
+    }
+
+    await websocket_client.send_json({"id": 8, "type": "subscribe_entities/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["events"] == 4
+    assert msg["result"]["messages_sent"] == 1
+
+
+async def test_subscribe_entities_coalesce_window(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test changes within the coalesce window are sent as one message."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "on")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window": 0.1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+
+    hass.states.async_set("light.changed", "on", {"color": "blue"})
+    hass.states.async_set("light.changed", "off", {"color": "green"})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.transient", "on")
+    hass.states.async_remove("light.transient")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.1))
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {"light.changed": {"+": {"a": {"color": "green"}, "c": ANY, "lc": ANY}}},
+        "r": ["light.removed"],
+    }
+
+
+async def test_subscribe_events_coalesce_window(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changed events are coalesced per entity."""
+    hass.states.async_set("light.kitchen", "off")
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+            "coalesce_window": 0.25,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    hass.states.async_set("light.hallway", "on")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.25))
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    event_data = msg["event"]["data"]
+    assert event_data["entity_id"] == "light.kitchen"
+    assert event_data["old_state"]["state"] == "off"
+    assert event_data["old_state"]["attributes"] == {}
+    assert event_data["new_state"]["attributes"] == {"brightness": 10}
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["entity_id"] == "light.hallway"
+
+
+async def test_subscribe_entities_state_changed_fired_on_bus(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changed events fired on the bus directly are forwarded once."""
+    hass.states.async_set("light.kitchen", "off")
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+
+    hass.bus.async_fire(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": "light.fired",
+            "old_state": None,
+            "new_state": State("light.fired", "on"),
+        },
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {"light.fired": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+    # State changes written by the state machine are only sent once
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+    await websocket_client.send_json({"id": 8, "type": "subscribe_entities/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["events"] == 2
+    assert msg["result"]["messages_sent"] == 2
+
+
+async def test_subscribe_events_coalesce_window_array_frame(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test clients supporting coalesce_messages get a window as one array."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {
+                "id": msg_id,
+                "type": "subscribe_events",
+                "event_type": "test_event",
+                "coalesce_window": 0.25,
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    hass.bus.async_fire("test_event", {"index": 1})
+    hass.bus.async_fire("test_event", {"index": 2})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.25))
+
+    # The array frames of both windows are merged into one frame
+    frame = json_loads(await websocket_client.receive_str())
+    assert [(event["id"], event["event"]["data"]["index"]) for event in frame] == [
+        (7, 1),
+        (7, 2),
+        (8, 1),
+        (8, 2),
+    ]
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
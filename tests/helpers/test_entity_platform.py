@@ -15,6 +15,8 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
 from homeassistant.core import (
     CoreState,
+    Event,
+    EventStateChangedData,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -182,6 +184,32 @@ async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 2
 
 
+async def test_write_ha_states_as_batch(hass: HomeAssistant) -> None:
+    """Test the platform writes the states of its entities as one batch."""
+    batches = []
+
+    @callback
+    def batch_listener(batch: list[Event[EventStateChangedData]]) -> None:
+        """Mock batch listener."""
+        batches.append([event.data["new_state"].state for event in batch])
+
+    platform = MockEntityPlatform(hass)
+    entity1 = MockEntity(name="test1")
+    entity2 = MockEntity(name="test2")
+    await platform.async_add_entities([entity1, entity2])
+    hass.states.async_listen_batch(batch_listener)
+
+    entity1._attr_state = "on"
+    entity2._attr_state = "on"
+    platform.async_write_ha_states()
+    assert batches == [["on", "on"]]
+
+    entity1._attr_state = "off"
+    platform.async_write_ha_states([entity1])
+    assert batches == [["on", "on"], ["off"]]
+    assert hass.states.get(entity1.entity_id).state == "off"
+
+
 async def test_update_state_adds_entities_with_update_before_add_true(
     hass: HomeAssistant,
 ) -> None:
@@ -1067,6 +1067,76 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_skips_unread_fields(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are not re-rendered when only unread fields change."""
+    hass.states.async_set("sensor.test", 5, {"unit": "W", "other": 1})
+    state_template = Template(
+        "{{ states('sensor.test') }} {{ state_attr('sensor.test', 'unit') }}", hass
+    )
+    attributes_template = Template("{{ states.sensor.test.attributes.other }}", hass)
+    domain_template = Template(
+        "{{ states('sensor.test') }} {{ states.sensor | map(attribute='attributes.other')"
+        " | list }}",
+        hass,
+    )
+    runs = []
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(update.template for update in updates)
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as render_mock:
+        info = async_track_template_result(
+            hass,
+            [
+                TrackTemplate(state_template, None),
+                TrackTemplate(attributes_template, None),
+                TrackTemplate(domain_template, None, 0),
+            ],
+            run_callback,
+        )
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 3
+
+        def rendered() -> list[Template]:
+            templates = [call.args[0] for call in render_mock.call_args_list]
+            render_mock.reset_mock()
+            return templates
+
+        rendered()
+        hass.states.async_set("sensor.test", 5, {"unit": "W", "other": 2})
+        await hass.async_block_till_done()
+        assert rendered() == [attributes_template, domain_template]
+
+        hass.states.async_set("sensor.test", 5, {"unit": "kW", "other": 2})
+        await hass.async_block_till_done()
+        assert rendered() == [state_template, attributes_template, domain_template]
+
+        hass.states.async_set("sensor.test", 6, {"unit": "kW", "other": 2})
+        await hass.async_block_till_done()
+        assert rendered() == [state_template, attributes_template, domain_template]
+
+        info.async_remove()
+
+    assert runs == [
+        attributes_template,
+        domain_template,
+        state_template,
+        state_template,
+        domain_template,
+    ]
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -1,11 +1,17 @@
 """The tests for the Restore component."""
 
+import asyncio
 from collections.abc import Coroutine
 from datetime import datetime, timedelta
+import json
 import logging
+import pathlib
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
+import py
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -15,6 +21,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_COMPACT_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -30,6 +37,7 @@ from tests.common import (
     MockModule,
     MockPlatform,
     async_fire_time_changed,
+    async_test_home_assistant,
     json_round_trip,
     mock_integration,
     mock_platform,
@@ -58,10 +66,10 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     with (
         patch(
-            "homeassistant.helpers.restore_state.Store.async_load",
+            "homeassistant.helpers.restore_state.RestoreStateStore.async_load",
             side_effect=HomeAssistantError,
         ),
-        patch("homeassistant.helpers.restore_state.Store.async_save"),
+        patch("homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"),
     ):
         # Failure to load should not be treated as fatal
         await async_load(hass)
@@ -71,7 +79,7 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     # Mock that only b1 is present this run
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         await async_load(hass)
         await hass.async_block_till_done()
@@ -100,7 +108,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     # Emulate a fresh load
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
@@ -116,7 +124,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
@@ -124,7 +132,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -132,7 +140,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
@@ -148,7 +156,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     # Emulate a fresh load
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
@@ -165,7 +173,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
         await hass.async_block_till_done()
@@ -174,7 +182,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert not mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         await RestoreStateData.async_save_persistent_states(hass)
         await hass.async_block_till_done()
@@ -182,7 +190,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
@@ -190,7 +198,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -229,7 +237,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     # Mock that only b1 is present this run
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -244,7 +252,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
 
     # Finish hass startup
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
         await hass.async_block_till_done()
@@ -292,13 +300,13 @@ async def test_dump_data(hass: HomeAssistant) -> None:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         await data.async_dump_states()
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = list(args[0].values())
 
     for state in states:
         hass.states.async_remove(state.entity_id)
@@ -326,13 +334,13 @@ async def test_dump_data(hass: HomeAssistant) -> None:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
     ) as mock_write_data:
         await data.async_dump_states()
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = list(args[0].values())
     assert len(written_states) == 2
     state0 = json_round_trip(written_states[0])
     state1 = json_round_trip(written_states[1])
@@ -367,7 +375,7 @@ async def test_dump_error(hass: HomeAssistant) -> None:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save",
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed",
         side_effect=HomeAssistantError,
     ) as mock_write_data:
         await data.async_dump_states()
@@ -534,3 +542,104 @@ async def test_restore_entity_end_to_end(
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
+
+
+async def test_dump_only_changed_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test unchanged states are not serialized again until compacted."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await platform.async_add_entities([entity])
+    data = async_get(hass)
+
+    with patch(
+        "homeassistant.helpers.restore_state.RestoreStateStore.async_save_keyed"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+        freezer.tick(STATE_COMPACT_INTERVAL)
+        await data.async_dump_states()
+
+    first, second, compacted = (call.args[0] for call in mock_write_data.mock_calls)
+    assert second["input_boolean.b0"] is first["input_boolean.b0"]
+    assert second["input_boolean.b1"] is not first["input_boolean.b1"]
+    assert json_round_trip(second["input_boolean.b1"])["state"]["state"] == "off"
+    assert compacted["input_boolean.b0"] is not first["input_boolean.b0"]
+    assert compacted["input_boolean.b1"] is not second["input_boolean.b1"]
+
+
+async def test_dump_states_at_stop(tmpdir: py.path.local) -> None:
+    """Test stopping Home Assistant leaves the storage file current."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        platform = MockEntityPlatform(hass, domain="input_boolean")
+        for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+            entity = RestoreEntity()
+            entity.hass = hass
+            entity.entity_id = entity_id
+            await platform.async_add_entities([entity])
+        data = async_get(hass)
+        data.async_setup_dump()
+        await hass.async_block_till_done()
+
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+        store = data.store
+        assert await hass.async_add_executor_job(
+            pathlib.Path(store.journal_path).exists
+        )
+
+        hass.states.async_set("input_boolean.b1", "on")
+        await hass.async_stop(force=True)
+
+        assert not await hass.async_add_executor_job(
+            pathlib.Path(store.journal_path).exists
+        )
+        stored = json.loads(
+            await hass.async_add_executor_job(pathlib.Path(store.path).read_bytes)
+        )
+        assert {
+            item["state"]["entity_id"]: item["state"]["state"]
+            for item in stored["data"]
+        } == {"input_boolean.b0": "unknown", "input_boolean.b1": "on"}
+
+
+async def test_load_lazily(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test stored states are only decoded when they are requested."""
+    now = dt_util.utcnow().isoformat()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            {
+                "state": {
+                    "entity_id": "input_boolean.b0",
+                    "state": "on",
+                    "attributes": {},
+                    "last_changed": now,
+                    "last_updated": now,
+                    "context": {"id": "3c2243ff5f30447eb12e7348cfd5b8ff"},
+                },
+                "extra_data": {"native_value": 1},
+                "last_seen": now,
+            }
+        ],
+    }
+    data = async_get(hass)
+    await data.async_load()
+    assert data.last_states == {}
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    state = await entity.async_get_last_state()
+    assert state.state == "on"
+    extra_data = await entity.async_get_last_extra_data()
+    assert extra_data.as_dict() == {"native_value": 1}
+    assert list(data.last_states) == ["input_boolean.b0"]
@@ -726,6 +726,34 @@ async def test_extract_entity_ids_from_devices(
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_caches_registry_targets(hass: HomeAssistant) -> None:
+    """Test registry targets are resolved once until a registry is updated."""
+    call = ServiceCall(hass, "light", "turn_on", {"device_id": "device-area-a-id"})
+
+    with patch(
+        "homeassistant.helpers.service._async_resolve_registry_targets",
+        wraps=service._async_resolve_registry_targets,
+    ) as resolve_mock:
+        for _ in range(2):
+            assert await service.async_extract_entity_ids(hass, call) == {
+                "light.in_area_a",
+                "light.in_area_b",
+            }
+        assert resolve_mock.call_count == 1
+
+        hass.bus.async_fire(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            {"action": "update", "device_id": "device-area-a-id", "changes": {}},
+        )
+        await hass.async_block_till_done()
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_area_a",
+            "light.in_area_b",
+        }
+        assert resolve_mock.call_count == 2
+
+
 @pytest.mark.usefixtures("floor_area_mock")
 async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with floors."""
@@ -4,8 +4,9 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+import pathlib
 from typing import Any, NamedTuple
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import py
@@ -20,7 +21,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1181,258 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_writes_coalesced_while_waiting(
+    hass: HomeAssistant, store: storage.Store, hass_storage: dict[str, Any]
+) -> None:
+    """Test saves made while waiting for a write slot are written once."""
+    semaphore = storage.get_internal_store_manager(hass).write_semaphore
+    for _ in range(storage.MAX_WRITE_CONCURRENTLY):
+        await semaphore.acquire()
+
+    task = hass.async_create_task(store.async_save(MOCK_DATA))
+    await asyncio.sleep(0)
+    store.async_delay_save(lambda: MOCK_DATA2, 10)
+    assert store.key not in hass_storage
+
+    for _ in range(storage.MAX_WRITE_CONCURRENTLY):
+        semaphore.release()
+    await task
+    assert hass_storage[store.key]["data"] == MOCK_DATA2
+    assert store._delay_handle is None
+    assert store._data is None
+
+
+async def test_write_stats(tmpdir: py.path.local) -> None:
+    """Test the bytes and durations of the writes are recorded per store."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        await store.async_save(MOCK_DATA)
+        await store.async_save(MOCK_DATA2)
+        size = await hass.async_add_executor_job(os.path.getsize, store.path)
+
+        stats = storage.get_internal_store_manager(hass).async_write_stats()
+        assert stats[MOCK_KEY] == {
+            "writes": 2,
+            "bytes": ANY,
+            "last_bytes": size,
+            "total_ms": ANY,
+            "max_ms": ANY,
+        }
+        assert stats[MOCK_KEY]["bytes"] > size
+        await hass.async_stop(force=True)
+
+
+def _item(item_id: str, value: int) -> json_fragment:
+    """Return a cached storage fragment of an item."""
+    return json_fragment(json_bytes({"id": item_id, "value": value}))
+
+
+async def _async_save_items(
+    hass: HomeAssistant, store: storage.JournaledStore, data: dict[str, Any]
+) -> None:
+    """Save the keyed collections and wait for the write."""
+    store.async_delay_save(lambda: data, 0)
+    # sleep is to run one event loop to get the task scheduled
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends the changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = {"a": _item("a", 1), "b": _item("b", 1)}
+        await _async_save_items(hass, store, {"items": items})
+        snapshot = await hass.async_add_executor_job(
+            pathlib.Path(store.path).read_bytes
+        )
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        items = {"a": _item("a", 2), "b": items["b"], "c": _item("c", 1)}
+        await _async_save_items(hass, store, {"items": items})
+        items = {"a": items["a"], "c": items["c"]}
+        await _async_save_items(hass, store, {"items": items})
+
+        # The changes were appended to the journal
+        assert (
+            await hass.async_add_executor_job(pathlib.Path(store.path).read_bytes)
+            == snapshot
+        )
+        journal = await hass.async_add_executor_job(
+            pathlib.Path(store.journal_path).read_text
+        )
+        journal_id = json.loads(snapshot)["journal"]
+        assert [json.loads(line) for line in journal.splitlines()] == [
+            {
+                "journal": journal_id,
+                "data": {
+                    "items": {
+                        "a": {"id": "a", "value": 2},
+                        "c": {"id": "c", "value": 1},
+                    }
+                },
+            },
+            {"journal": journal_id, "data": {"items": {"b": None}}},
+        ]
+
+        # Unchanged items are not written again
+        await _async_save_items(hass, store, {"items": items})
+        assert (
+            await hass.async_add_executor_job(
+                pathlib.Path(store.journal_path).read_text
+            )
+            == journal
+        )
+
+        assert await storage.JournaledStore(
+            hass, MOCK_VERSION, MOCK_KEY
+        ).async_load() == {"items": [{"id": "a", "value": 2}, {"id": "c", "value": 1}]}
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compaction(tmpdir: py.path.local) -> None:
+    """Test a journaled store writes a snapshot when the journal grows."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        await _async_save_items(hass, store, {"items": {"a": _item("a", 1)}})
+        assert await hass.async_add_executor_job(store._load_data) == {
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "key": MOCK_KEY,
+            "data": {"items": [{"id": "a", "value": 1}]},
+            "journal": ANY,
+        }
+
+        with patch.object(storage, "MIN_JOURNAL_COMPACT_SIZE", 0):
+            await _async_save_items(hass, store, {"items": {"a": _item("a", 2)}})
+
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        assert (await hass.async_add_executor_job(store._load_data))["data"] == {
+            "items": [{"id": "a", "value": 2}]
+        }
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_stale_and_incomplete_journal(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a journaled store skips stale entries and stops at an incomplete one."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        await _async_save_items(hass, store, {"items": {"a": _item("a", 1)}})
+        journal_id = (await hass.async_add_executor_job(store._load_data))["journal"]
+
+        def _write_journal() -> None:
+            with open(store.journal_path, "wb") as fdesc:
+                for entry in (
+                    {"journal": "stale", "data": {"items": {"a": None}}},
+                    {"journal": journal_id, "data": {"items": {"b": {"id": "b"}}}},
+                ):
+                    fdesc.write(json_bytes(entry) + b"\n")
+                fdesc.write(b'{"journal": "')
+
+        await hass.async_add_executor_job(_write_journal)
+        store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == {
+            "items": [{"id": "a", "value": 1}, {"id": "b"}]
+        }
+        assert "Ignoring incomplete journal entry of storage-test" in caplog.text
+
+        # The first save after loading is a snapshot which drops the journal
+        await _async_save_items(hass, store, {"items": {"a": _item("a", 1)}})
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_final_write(tmpdir: py.path.local) -> None:
+    """Test a journaled store writes a snapshot on the final write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = {"a": _item("a", 1)}
+        await _async_save_items(hass, store, {"items": items})
+        await _async_save_items(hass, store, {"items": {**items, "b": _item("b", 1)}})
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        store.async_delay_save(lambda: {"items": {**items, "c": _item("c", 1)}}, 10)
+        await hass.async_stop(force=True)
+
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        data = await hass.async_add_executor_job(pathlib.Path(store.path).read_bytes)
+        assert json.loads(data)["data"] == {
+            "items": [{"id": "a", "value": 1}, {"id": "c", "value": 1}]
+        }
+
+
+async def test_journaled_store_write_snapshots(tmpdir: py.path.local) -> None:
+    """Test the journals of the journaled stores are written into their files."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = {"a": _item("a", 1)}
+        await _async_save_items(hass, store, {"items": items})
+        await _async_save_items(hass, store, {"items": {**items, "b": _item("b", 1)}})
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        # A pending save is written before the snapshot
+        store.async_delay_save(lambda: {"items": {**items, "c": _item("c", 1)}}, 10)
+
+        await storage.async_write_journal_snapshots(hass)
+
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        data = await hass.async_add_executor_job(pathlib.Path(store.path).read_bytes)
+        assert json.loads(data)["data"] == {
+            "items": [{"id": "a", "value": 1}, {"id": "c", "value": 1}]
+        }
+
+        # The next save appends to the journal of the snapshot again
+        await _async_save_items(hass, store, {"items": items})
+        await _async_save_items(hass, store, {"items": {**items, "d": _item("d", 1)}})
+        assert await storage.JournaledStore(
+            hass, MOCK_VERSION, MOCK_KEY
+        ).async_load() == {"items": [{"id": "a", "value": 1}, {"id": "d", "value": 1}]}
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_list_data(tmpdir: py.path.local) -> None:
+    """Test a journaled store of a list of items."""
+
+    class ListStore(storage.JournaledStore[list[dict[str, Any]]]):
+        list_data = True
+
+        def _item_id(self, item: dict[str, Any]) -> str:
+            return item["key"]
+
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = ListStore(hass, MOCK_VERSION, MOCK_KEY)
+        item_a = json_fragment(json_bytes({"key": "a"}))
+        await store.async_save_keyed({"a": item_a})
+        assert await ListStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == [
+            {"key": "a"}
+        ]
+
+        await store.async_save_keyed(
+            {"a": item_a, "b": json_fragment(json_bytes({"key": "b"}))}
+        )
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        assert await ListStore(hass, MOCK_VERSION, MOCK_KEY).async_load() == [
+            {"key": "a"},
+            {"key": "b"},
+        ]
+        await hass.async_stop(force=True)
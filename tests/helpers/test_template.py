@@ -6584,3 +6584,51 @@ async def test_merge_response_not_mutate_original_object(
 
     tpl = template.Template(_template, hass)
     assert tpl.async_render()
+
+
+async def test_template_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the compiled code of templates is persisted across restarts."""
+    await template.async_load_template_bytecode(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    tpl = template.Template("{{ 40 + 2 }}", hass)
+    tpl.ensure_valid()
+    assert bytecode_cache.compiled == 1
+    assert bytecode_cache.loaded == 0
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.BYTECODE_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert len(stored["code"]) == 1
+
+    # Simulate a restart with a new template environment
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_template_bytecode(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    tpl = template.Template("{{ 40 + 2 }}", hass)
+    tpl.ensure_valid()
+    assert bytecode_cache.compiled == 0
+    assert bytecode_cache.loaded == 1
+    assert tpl.async_render() == 42
+
+    # Limited and strict templates do not share the code of the default variant
+    for limited, strict in ((True, False), (False, True)):
+        template.TemplateEnvironment(hass, limited, strict).compile("{{ 40 + 2 }}")
+    assert bytecode_cache.compiled == 2
+    assert bytecode_cache.loaded == 1
+    template.TemplateEnvironment(hass, limited=True).compile("{{ 40 + 2 }}")
+    assert bytecode_cache.compiled == 2
+    assert bytecode_cache.loaded == 2
+
+    # The cache is discarded when the version does not match
+    hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]["version"] = "other"
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_template_bytecode(hass)
+    bytecode_cache = hass.data[template._BYTECODE_CACHE]
+    template.Template("{{ 40 + 2 }}", hass).ensure_valid()
+    assert bytecode_cache.compiled == 1
+    assert bytecode_cache.loaded == 0
@@ -1,6 +1,7 @@
 """Tests for the update coordinator."""
 
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 import urllib.error
@@ -492,6 +493,28 @@ async def test_async_set_updated_data(
     remove_callbacks()
 
 
+async def test_update_listeners_writes_state_batch(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test the states written by the listeners are delivered as one batch."""
+    batches = []
+    hass.states.async_listen_batch(
+        callback(
+            lambda batch: batches.append([event.data["entity_id"] for event in batch])
+        )
+    )
+
+    remove_callbacks = [
+        crd.async_add_listener(partial(hass.states.async_set, entity_id, "on"))
+        for entity_id in ("sensor.one", "sensor.two")
+    ]
+    crd.async_set_updated_data(1)
+    assert batches == [["sensor.one", "sensor.two"]]
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
@@ -1528,3 +1528,66 @@ def test_should_rollover_is_always_false() -> None:
         ).shouldRollover(Mock())
         is False
     )
+
+
+async def test_startup_critical_path(hass: HomeAssistant) -> None:
+    """Test the critical path follows the dependencies that finished last."""
+    integrations = {
+        domain: mock_integration(
+            hass, MockModule(domain, dependencies=dependencies), top_level_files=set()
+        )
+        for domain, dependencies in (
+            ("http", []),
+            ("frontend", ["http"]),
+            ("slow_dep", []),
+            ("root", ["frontend", "slow_dep"]),
+            ("quick", ["http"]),
+        )
+    }
+    setup_time = {
+        "http": 0.5,
+        "frontend": 1.0,
+        "slow_dep": 4.0,
+        "root": 2.0,
+        "quick": 0.1,
+    }
+
+    assert bootstrap._startup_critical_path(integrations, setup_time) == [
+        ("slow_dep", 4.0),
+        ("root", 2.0),
+    ]
+    setup_time["http"] = 5.0
+    assert bootstrap._startup_critical_path(integrations, setup_time) == [
+        ("http", 5.0),
+        ("frontend", 1.0),
+        ("root", 2.0),
+    ]
+    assert bootstrap._startup_critical_path(integrations, {}) == []
+
+
+async def test_prefetch_imports(hass: HomeAssistant) -> None:
+    """Test integrations are imported ahead of setup when their requirements are."""
+    with_requirements = mock_integration(
+        hass, MockModule("with_requirements", requirements=["not_installed==1.0"])
+    )
+    without_requirements = mock_integration(hass, MockModule("without_requirements"))
+    failing = mock_integration(hass, MockModule("failing"))
+
+    async def _get_component(integration: Integration) -> None:
+        if integration is failing:
+            raise ImportError
+
+    with patch.object(
+        Integration,
+        "async_get_component",
+        autospec=True,
+        side_effect=_get_component,
+    ) as get_component_mock:
+        await bootstrap._async_prefetch_imports(
+            hass, [failing, with_requirements, without_requirements]
+        )
+
+    assert [call.args[0] for call in get_component_mock.mock_calls] == [
+        failing,
+        without_requirements,
+    ]
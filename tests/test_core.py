@@ -1239,6 +1239,84 @@ async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     assert len(calls) == 1
 
 
+async def test_eventbus_dispatch_table_follows_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test the dispatch table of an event type is rebuilt when listeners change."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append(("all", event.event_type))
+
+    @ha.callback
+    def listener(event):
+        """Mock listener that subscribes another listener."""
+        calls.append(("test", event.event_type))
+        unsubs.append(hass.bus.async_listen("test", added_listener))
+
+    @ha.callback
+    def added_listener(event):
+        """Mock listener added while dispatching."""
+        calls.append(("added", event.event_type))
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    assert calls == [("test", "test")]
+
+    # Listeners added while dispatching only get the next event
+    unsub()
+    unsub_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    calls.clear()
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    hass.bus.async_fire(EVENT_STATE_REPORTED)
+    assert calls == [("added", "test"), ("all", "test"), ("all", "other")]
+
+    unsub_all()
+    unsubs.pop()()
+    calls.clear()
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other")
+    assert calls == []
+    assert hass.bus.async_listeners().get("test") is None
+
+
+async def test_eventbus_dispatch_tables_pruned(hass: HomeAssistant) -> None:
+    """Test dispatch tables are only kept for event types with listeners."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.event_type)
+
+    # Event types nobody listens to do not get a table
+    for index in range(10):
+        hass.bus.async_fire(f"unheard_{index}")
+    assert not any(
+        str(event_type).startswith("unheard_")
+        for event_type in hass.bus._dispatch_tables
+    )
+
+    unsub = hass.bus.async_listen("test", listener)
+    unsub_all = hass.bus.async_listen(MATCH_ALL, listener)
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("unheard")
+    assert calls == ["test", "test", "unheard"]
+    assert "test" in hass.bus._dispatch_tables
+    assert "unheard" not in hass.bus._dispatch_tables
+
+    unsub()
+    unsub_all()
+    hass.bus.async_fire("test")
+    assert calls == ["test", "test", "unheard"]
+    assert "test" not in hass.bus._dispatch_tables
+    assert "test" not in hass.bus._listeners
+
+
 async def test_eventbus_listen_once_event_with_callback(hass: HomeAssistant) -> None:
     """Test listen_once_event method."""
     runs = []
@@ -1560,6 +1638,75 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test async_set shares unchanged values with the previous state."""
+    hass.states.async_set(
+        "light.bowl", "off", {"effect_list": ["colorloop"], "on": 1, "level": 1}
+    )
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set(
+        "LIGHT.BOWL", "on", {"effect_list": ["colorloop"], "on": True, "level": 2}
+    )
+    new_state = hass.states.get("light.bowl")
+
+    assert new_state.entity_id is state.entity_id
+    assert new_state.attributes == {"effect_list": ["colorloop"], "on": 1, "level": 2}
+    assert new_state.attributes["effect_list"] is state.attributes["effect_list"]
+    # Equal values of another type are not shared
+    assert new_state.attributes["on"] is True
+    assert isinstance(new_state.attributes, ReadOnlyDict)
+
+
+async def test_statemachine_batch(hass: HomeAssistant) -> None:
+    """Test batch listeners get the state changes of a batch at once."""
+    batches: list[list[ha.Event[ha.EventStateChangedData]]] = []
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    @ha.callback
+    def batch_listener(batch: list[ha.Event[ha.EventStateChangedData]]) -> None:
+        """Mock batch listener."""
+        batches.append(batch)
+
+    unsub = hass.states.async_listen_batch(batch_listener)
+
+    def _changes(batch: list[ha.Event[ha.EventStateChangedData]]) -> list[tuple]:
+        return [
+            (event.data["entity_id"], getattr(event.data["new_state"], "state", None))
+            for event in batch
+        ]
+
+    hass.states.async_set("light.bowl", "on")
+    assert _changes(batches[0]) == [("light.bowl", "on")]
+
+    with hass.states.async_batch():
+        hass.states.async_set("light.bowl", "off")
+        with hass.states.async_batch():
+            hass.states.async_set("light.kitchen", "on")
+        hass.states.async_remove("light.bowl")
+        # States and events are not held back by the batch
+        assert hass.states.get("light.kitchen").state == "on"
+        assert len(events) == 4
+        assert len(batches) == 1
+
+    assert _changes(batches[1]) == [
+        ("light.bowl", "off"),
+        ("light.kitchen", "on"),
+        ("light.bowl", None),
+    ]
+    assert [event.context for event in batches[1]] == [
+        event.context for event in events[1:]
+    ]
+
+    with hass.states.async_batch():
+        pass
+    assert len(batches) == 2
+
+    unsub()
+    hass.states.async_set("light.kitchen", "off")
+    assert len(batches) == 2
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
@@ -1621,6 +1768,38 @@ async def test_serviceregistry_call_with_blocking_done_in_time(
     assert len(calls) == 1
 
 
+async def test_serviceregistry_call_latencies(hass: HomeAssistant) -> None:
+    """Test the latency of service calls is recorded per service."""
+
+    async def slow_service(call: ServiceCall) -> None:
+        """Service that takes a while."""
+
+    hass.services.async_register("test_domain", "slow", slow_service)
+    hass.services.async_register("test_domain", "unused", slow_service)
+    assert hass.services.async_call_latencies() == {}
+
+    with patch("homeassistant.core.monotonic", side_effect=[10.0, 10.2, 20.0, 20.0]):
+        await hass.services.async_call("test_domain", "slow", blocking=True)
+        await hass.services.async_call("test_domain", "slow", blocking=True)
+
+    latency = hass.services.async_call_latencies()["test_domain"]["slow"]
+    assert latency == {
+        "count": 2,
+        "total": pytest.approx(0.2),
+        "buckets": {
+            "0.001": 1,
+            "0.005": 0,
+            "0.025": 0,
+            "0.1": 0,
+            "0.5": 1,
+            "2.5": 0,
+            "10.0": 0,
+            "inf": 0,
+        },
+    }
+    assert "unused" not in hass.services.async_call_latencies()["test_domain"]
+
+
 async def test_serviceregistry_call_non_existing_with_blocking(
     hass: HomeAssistant,
 ) -> None:
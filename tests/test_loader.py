@@ -9,6 +9,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 from awesomeversion import AwesomeVersion
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import loader
@@ -19,7 +20,12 @@ from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -2039,3 +2045,93 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+def _hue_manifest_path() -> pathlib.Path:
+    return pathlib.Path(loader.__file__).parent / "components" / "hue" / "manifest.json"
+
+
+def _store_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    integrations: dict[str, Any],
+    ha_version: str = loader.HA_VERSION,
+) -> None:
+    hass.data.pop(loader.DATA_INTEGRATION_INDEX, None)
+    hass.data[loader.DATA_INTEGRATIONS].pop("hue", None)
+    hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_INDEX_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.INTEGRATION_INDEX_STORAGE_KEY,
+        "data": {"ha_version": ha_version, "integrations": integrations},
+    }
+
+
+async def test_integration_index_skips_filesystem(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations in the index are resolved without reading them."""
+    manifest_path = _hue_manifest_path()
+    _store_index(
+        hass,
+        hass_storage,
+        {
+            str(manifest_path): {
+                "mtimes": list(loader.IntegrationIndex.stat(manifest_path)),
+                "manifest": {"domain": "hue", "name": "Indexed Hue"},
+                "files": ["__init__.py", "light.py"],
+            }
+        },
+    )
+
+    with (
+        patch.object(pathlib.Path, "read_text") as read_text_mock,
+        patch("os.listdir") as listdir_mock,
+    ):
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert integration.name == "Indexed Hue"
+    assert integration.platforms_exists(["light", "sensor"]) == ["light"]
+    read_text_mock.assert_not_called()
+    listdir_mock.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("mtimes", "ha_version"),
+    [((1, 1), loader.HA_VERSION), (None, "2020.1.0")],
+)
+async def test_integration_index_stale(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    mtimes: tuple[int, int] | None,
+    ha_version: str,
+) -> None:
+    """Test changed integrations and indexes of other versions are not used."""
+    manifest_path = _hue_manifest_path()
+    current_mtimes = loader.IntegrationIndex.stat(manifest_path)
+    _store_index(
+        hass,
+        hass_storage,
+        {
+            str(manifest_path): {
+                "mtimes": list(mtimes or current_mtimes),
+                "manifest": {"domain": "hue", "name": "Indexed Hue"},
+                "files": [],
+            }
+        },
+        ha_version,
+    )
+
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+    freezer.tick(loader.INTEGRATION_INDEX_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == loader.HA_VERSION
+    entry = data["integrations"][str(manifest_path)]
+    assert tuple(entry["mtimes"]) == current_mtimes
+    assert entry["manifest"]["name"] == "Philips Hue"
+    assert "light.py" in entry["files"]
@@ -903,6 +903,36 @@ def test_unit_conversion_factory(
     )
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "from_unit", "to_unit"),
+    [
+        # Process all items in _CONVERTED_VALUE
+        (converter, value, from_unit, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, _, to_unit in item
+    ],
+)
+def test_get_conversion_ratios(
+    converter: type[BaseUnitConverter],
+    value: float,
+    from_unit: str,
+    to_unit: str,
+) -> None:
+    """Test converting with the conversion ratios matches the converter."""
+    ratios = converter.get_conversion_ratios(from_unit, to_unit)
+    if converter is TemperatureConverter or UnitOfSpeed.BEAUFORT in (
+        from_unit,
+        to_unit,
+    ):
+        assert ratios is None
+        return
+    assert ratios is not None
+    from_ratio, to_ratio = ratios
+    assert value / from_ratio * to_ratio == converter.converter_factory(
+        from_unit, to_unit
+    )(value)
+
+
 def test_unit_conversion_factory_allow_none_with_none() -> None:
     """Test test_unit_conversion_factory_allow_none with None."""
     assert (